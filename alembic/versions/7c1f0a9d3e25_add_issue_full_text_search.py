@@ -0,0 +1,68 @@
+"""Add issue full-text search
+
+Revision ID: 7c1f0a9d3e25
+Revises: 5ee5c6853966
+Create Date: 2026-10-16 23:04:51.218409
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f0a9d3e25'
+down_revision: Union[str, Sequence[str], None] = '5ee5c6853966'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE issues_fts USING fts5(
+            title,
+            description,
+            content='issues',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+            INSERT INTO issues_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+            INSERT INTO issues_fts(issues_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+            INSERT INTO issues_fts(issues_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO issues_fts(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """
+    )
+    # Index the issues that already exist.
+    op.execute("INSERT INTO issues_fts(issues_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS issues_fts_ai")
+    op.execute("DROP TABLE IF EXISTS issues_fts")
@@ -0,0 +1,234 @@
+"""
+Seeds a SQLite database with synthetic guilds, projects, tags, users and issues.
+"""
+
+import datetime
+import random
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from sqlalchemy import Engine, bindparam, create_engine, event, insert, select, update
+
+from discord_issues.db.models import (
+    Base,
+    Guild,
+    Issue,
+    IssueStatus,
+    Project,
+    Tag,
+    User,
+    issue_assignees,
+    issue_tags,
+)
+
+SEED_CHUNK_SIZE = 10_000
+
+TAG_NAMES = ("bug", "feature", "ui", "backend", "docs", "urgent", "chore", "perf")
+
+# Titles and descriptions are drawn from these, so full-text search has both
+# common and rare terms to match.
+WORDS = (
+    "login button crash error page slow timeout upload avatar profile "
+    "settings theme dark mode search filter sort export import notification "
+    "email password reset session cache database query index migration "
+    "permission role channel message thread reaction emoji voice video "
+    "mobile desktop layout font color icon tooltip modal dialog menu"
+).split()
+
+STATUS_WEIGHTS = {
+    IssueStatus.OPEN: 5,
+    IssueStatus.IN_PROGRESS: 2,
+    IssueStatus.CLOSED: 3,
+}
+
+
+class Scale(NamedTuple):
+    guilds: int
+    projects: int
+    issues: int
+    users: int
+    tags_per_project: int
+
+
+SCALES = {
+    "tiny": Scale(guilds=2, projects=4, issues=200, users=20, tags_per_project=3),
+    "small": Scale(
+        guilds=10, projects=100, issues=20_000, users=500, tags_per_project=5
+    ),
+    "large": Scale(
+        guilds=1_000,
+        projects=10_000,
+        issues=1_000_000,
+        users=20_000,
+        tags_per_project=len(TAG_NAMES),
+    ),
+}
+
+
+class ProjectInfo(NamedTuple):
+    id: int
+    guild_id: str
+    name: str
+    issues: int
+
+
+class Dataset(NamedTuple):
+    """What the benchmarks need to know to pick realistic arguments."""
+
+    guild_ids: list[str]
+    projects: list[ProjectInfo]
+    tags: dict[int, list[tuple[int, str]]]  # project id -> (tag id, name)
+    user_ids: list[str]
+    max_issue_id: int
+
+    def random_project(self, rng: random.Random) -> ProjectInfo:
+        """Picks a project that has at least one issue."""
+        while True:
+            project = rng.choice(self.projects)
+            if project.issues:
+                return project
+
+    def random_tag(self, rng: random.Random, project_id: int) -> tuple[int, str]:
+        return rng.choice(self.tags[project_id])
+
+
+def _sqlite_engine(path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # Seeding can start over if interrupted, so it skips durability.
+        for pragma in ("journal_mode=WAL", "synchronous=OFF", "foreign_keys=OFF"):
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+    return engine
+
+
+def _chunks(rows: Iterator[dict], size: int = SEED_CHUNK_SIZE) -> Iterator[list]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(low, high)))
+
+
+def seed(path: Path, scale: Scale, rng: random.Random) -> None:
+    """
+    Creates the schema at ``path`` and fills it with ``scale`` rows.
+
+    Projects are spread evenly over guilds and issues randomly over projects.
+    Each issue gets up to two assignees and up to two tags. The full-text and
+    issue count triggers run as they do in production.
+    """
+    engine = _sqlite_engine(path)
+    Base.metadata.create_all(engine)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    guild_ids = [str(10**17 + i) for i in range(scale.guilds)]
+    user_ids = [str(2 * 10**17 + i) for i in range(scale.users)]
+    tag_count = min(scale.tags_per_project, len(TAG_NAMES))
+
+    with engine.begin() as conn:
+        conn.execute(insert(Guild), [{"guild_id": g} for g in guild_ids])
+        conn.execute(insert(User), [{"user_id": u} for u in user_ids])
+        conn.execute(
+            insert(Project),
+            [
+                {
+                    "id": p + 1,
+                    "name": f"project-{p}",
+                    "guild_id": guild_ids[p % scale.guilds],
+                }
+                for p in range(scale.projects)
+            ],
+        )
+        conn.execute(
+            insert(Tag),
+            [
+                {"id": p * tag_count + t + 1, "name": TAG_NAMES[t], "project_id": p + 1}
+                for p in range(scale.projects)
+                for t in range(tag_count)
+            ],
+        )
+
+    last_ids = [0] * scale.projects
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+
+    def issue_rows() -> Iterator[dict]:
+        for issue_id in range(1, scale.issues + 1):
+            project = rng.randrange(scale.projects)
+            last_ids[project] += 1
+            status = rng.choices(statuses, weights)[0]
+            created_at = now - datetime.timedelta(minutes=rng.randrange(525_600))
+            yield {
+                "id": issue_id,
+                "project_issue_id": last_ids[project],
+                "project_id": project + 1,
+                "title": _sentence(rng, 3, 8),
+                "description": _sentence(rng, 5, 30),
+                "status": status,
+                "creator_id": rng.choice(user_ids),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "closed_at": created_at if status == IssueStatus.CLOSED else None,
+            }
+
+    for chunk in _chunks(issue_rows()):
+        assignees, tags = [], []
+        for row in chunk:
+            for user_id in set(rng.choices(user_ids, k=rng.randint(0, 2))):
+                assignees.append({"issue_id": row["id"], "user_id": user_id})
+            if tag_count:
+                first_tag = (row["project_id"] - 1) * tag_count + 1
+                for offset in set(rng.choices(range(tag_count), k=rng.randint(0, 2))):
+                    tags.append({"issue_id": row["id"], "tag_id": first_tag + offset})
+        with engine.begin() as conn:
+            conn.execute(insert(Issue), chunk)
+            if assignees:
+                conn.execute(insert(issue_assignees), assignees)
+            if tags:
+                conn.execute(insert(issue_tags), tags)
+
+    with engine.begin() as conn:
+        conn.execute(
+            update(Project)
+            .where(Project.id == bindparam("project_id"))
+            .values(last_project_issue_id=bindparam("last")),
+            [
+                {"project_id": p + 1, "last": last}
+                for p, last in enumerate(last_ids)
+                if last
+            ],
+        )
+        conn.exec_driver_sql("ANALYZE")
+    engine.dispose()
+
+
+def load(path: Path) -> Dataset:
+    """Reads back what the benchmarks need from a seeded database."""
+    engine = _sqlite_engine(path)
+    with engine.connect() as conn:
+        guild_ids = list(conn.scalars(select(Guild.guild_id)))
+        projects = [
+            ProjectInfo(*row)
+            for row in conn.execute(
+                select(
+                    Project.id,
+                    Project.guild_id,
+                    Project.name,
+                    Project.last_project_issue_id,
+                ).where(Project.deleted_at.is_(None))
+            )
+        ]
+        tags: dict[int, list[tuple[int, str]]] = {}
+        for tag_id, project_id, name in conn.execute(
+            select(Tag.id, Tag.project_id, Tag.name)
+        ):
+            tags.setdefault(project_id, []).append((tag_id, name))
+        user_ids = list(conn.scalars(select(User.user_id)))
+        max_issue_id = conn.scalar(select(Issue.id).order_by(Issue.id.desc())) or 0
+    engine.dispose()
+    return Dataset(guild_ids, projects, tags, user_ids, max_issue_id)
@@ -0,0 +1,541 @@
+"""
+Times every repository method and autocomplete callback against a seeded
+SQLite database and writes p50/p95/p99 latencies as JSON.
+
+Usage:
+    python -m benchmarks.repository_benchmark [--scale small] [--output FILE]
+        [--database FILE] [--iterations N] [--compare BASELINE]
+
+Results from two commits can be compared with ``--compare``, which exits with
+status 1 if any benchmark's p95 grew by more than ``--tolerance``.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import datetime
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from discord_issues.cache.autocomplete_index import autocomplete_index
+from discord_issues.cogs.issue_command import issue_autocomplete
+from discord_issues.cogs.project_command import project_autocomplete
+from discord_issues.cogs.tag_command import tag_autocomplete
+from discord_issues.db import database
+from discord_issues.db.instrumentation import QueryScope, current_scope
+from discord_issues.db.models import IssueStatus
+from discord_issues.db.writer import WriteQueue
+from discord_issues.repo import base_repository
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRecord, IssueRepository
+from discord_issues.repo.project_repository import (
+    ProjectRepository,
+    project_name_cache,
+)
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+
+from .dataset import SCALES, WORDS, Dataset, Scale, load, seed
+
+# A benchmark prepares its arguments untimed and returns the call to time.
+Prepare = Callable[[random.Random], Awaitable[Callable[[], Awaitable[Any]]]]
+
+_BENCHMARKS: list[tuple[str, str]] = []
+
+
+def benchmark(name: str):
+    """Registers a RepositoryBenchmarks method under ``name``."""
+
+    def register(method):
+        _BENCHMARKS.append((name, method.__name__))
+        return method
+
+    return register
+
+
+def clear_caches() -> None:
+    """Empties every in-process cache, so a call has to reach the database."""
+    autocomplete_index.clear()
+    project_name_cache.clear()
+    UserRepository.cache.clear()
+    GuildRepository.cache.clear()
+
+
+def _interaction(guild_id: str, project_name: Optional[str] = None):
+    return SimpleNamespace(
+        guild_id=guild_id, namespace=SimpleNamespace(project_name=project_name)
+    )
+
+
+class RepositoryBenchmarks:
+    """The benchmarks, sharing repositories and a dataset to draw arguments from."""
+
+    def __init__(self, data: Dataset):
+        self.data = data
+        self.issues = IssueRepository()
+        self.projects = ProjectRepository()
+        self.tags = TagRepository()
+        self.users = UserRepository()
+
+    def _number_ranges(self, rng: random.Random, project) -> list[tuple[int, int]]:
+        start = rng.randint(1, project.issues)
+        return [(start, min(project.issues, start + 19))]
+
+    async def _new_project(self, rng: random.Random) -> int:
+        project = await self.projects.create(
+            name=f"bench-{uuid.uuid4().hex[:12]}",
+            guild_id=rng.choice(self.data.guild_ids),
+        )
+        return project.id
+
+    @benchmark("BaseRepository.get")
+    async def get(self, rng):
+        tag_id, _ = self.data.random_tag(rng, self.data.random_project(rng).id)
+        return lambda: self.tags.get(tag_id)
+
+    @benchmark("BaseRepository.get_all")
+    async def get_all(self, rng):
+        skip = rng.randrange(max(1, self.data.max_issue_id - 100))
+        return lambda: self.issues.get_all(skip=skip, limit=100)
+
+    @benchmark("BaseRepository.create")
+    async def create(self, rng):
+        project = self.data.random_project(rng)
+        name = f"tag-{uuid.uuid4().hex[:12]}"
+        return lambda: self.tags.create(name=name, project_id=project.id)
+
+    @benchmark("BaseRepository.get_or_create")
+    async def get_or_create(self, rng):
+        clear_caches()
+        user_id = rng.choice(self.data.user_ids)
+        return lambda: self.users.get_or_create(user_id=user_id)
+
+    @benchmark("BaseRepository.update")
+    async def update(self, rng):
+        issue_id = rng.randint(1, self.data.max_issue_id)
+        title = " ".join(rng.choices(WORDS, k=5))
+        return lambda: self.issues.update(issue_id, title=title)
+
+    @benchmark("BaseRepository.delete")
+    async def delete(self, rng):
+        project = self.data.random_project(rng)
+        tag = await self.tags.create(
+            name=f"tag-{uuid.uuid4().hex[:12]}", project_id=project.id
+        )
+        return lambda: self.tags.delete(tag.id)
+
+    @benchmark("ProjectRepository.find_by_name")
+    async def find_by_name(self, rng):
+        clear_caches()
+        project = self.data.random_project(rng)
+        return lambda: self.projects.find_by_name(project.guild_id, project.name)
+
+    @benchmark("ProjectRepository.find_by_guild_id")
+    async def find_by_guild_id(self, rng):
+        guild_id = rng.choice(self.data.guild_ids)
+        return lambda: self.projects.find_by_guild_id(guild_id)
+
+    @benchmark("ProjectRepository.issue_counts")
+    async def issue_counts(self, rng):
+        guild_id = self.data.random_project(rng).guild_id
+        ids = [p.id for p in self.data.projects if p.guild_id == guild_id]
+        return lambda: self.projects.issue_counts(ids)
+
+    @benchmark("ProjectRepository.soft_delete")
+    async def soft_delete(self, rng):
+        project_id = await self._new_project(rng)
+        return lambda: self.projects.soft_delete(project_id)
+
+    @benchmark("ProjectRepository.purge_deleted")
+    async def purge_deleted(self, rng):
+        project_id = await self._new_project(rng)
+        await self.issues.import_issues(
+            project_id,
+            [IssueRecord(title="doomed", description=None, creator_id="1")] * 20,
+        )
+        await self.projects.soft_delete(project_id)
+        return lambda: self.projects.purge_deleted()
+
+    @benchmark("TagRepository.find_by_project_id")
+    async def find_tags_by_project_id(self, rng):
+        project_id = self.data.random_project(rng).id
+        return lambda: self.tags.find_by_project_id(project_id)
+
+    @benchmark("TagRepository.find_by_name")
+    async def find_tag_by_name(self, rng):
+        project_id = self.data.random_project(rng).id
+        _, name = self.data.random_tag(rng, project_id)
+        return lambda: self.tags.find_by_name(project_id, name)
+
+    @benchmark("TagRepository.delete_by_names")
+    async def delete_tags_by_names(self, rng):
+        project_id = self.data.random_project(rng).id
+        names = [f"tag-{uuid.uuid4().hex[:12]}" for _ in range(3)]
+        for name in names:
+            await self.tags.create(name=name, project_id=project_id)
+        return lambda: self.tags.delete_by_names(project_id, names)
+
+    @benchmark("IssueRepository.find_by_project_issue_id")
+    async def find_by_project_issue_id(self, rng):
+        project = self.data.random_project(rng)
+        number = rng.randint(1, project.issues)
+        return lambda: self.issues.find_by_project_issue_id(project.id, number)
+
+    @benchmark("IssueRepository.get_version")
+    async def get_version(self, rng):
+        project = self.data.random_project(rng)
+        number = rng.randint(1, project.issues)
+        return lambda: self.issues.get_version(project.id, number)
+
+    @benchmark("IssueRepository.find_titles_by_project")
+    async def find_titles_by_project(self, rng):
+        project_id = self.data.random_project(rng).id
+        return lambda: self.issues.find_titles_by_project(project_id)
+
+    @benchmark("IssueRepository.search")
+    async def search(self, rng):
+        project_id = self.data.random_project(rng).id
+        query = " ".join(rng.choices(WORDS, k=2))
+        return lambda: self.issues.search(project_id, query)
+
+    @benchmark("IssueRepository.list_issues")
+    async def list_issues(self, rng):
+        project_id = self.data.random_project(rng).id
+        return lambda: self.issues.list_issues(project_id)
+
+    @benchmark("IssueRepository.list_issues (status, tag)")
+    async def list_issues_filtered(self, rng):
+        project_id = self.data.random_project(rng).id
+        _, tag_name = self.data.random_tag(rng, project_id)
+        return lambda: self.issues.list_issues(
+            project_id, status=IssueStatus.OPEN, tag_name=tag_name
+        )
+
+    @benchmark("IssueRepository.list_issues (assignee)")
+    async def list_issues_by_assignee(self, rng):
+        project_id = self.data.random_project(rng).id
+        user_id = rng.choice(self.data.user_ids)
+        return lambda: self.issues.list_issues(project_id, assignee_id=user_id)
+
+    @benchmark("IssueRepository.bulk_set_status")
+    async def bulk_set_status(self, rng):
+        project = self.data.random_project(rng)
+        numbers = self._number_ranges(rng, project)
+        status = rng.choice(list(IssueStatus))
+        return lambda: self.issues.bulk_set_status(project.id, status, numbers=numbers)
+
+    @benchmark("IssueRepository.bulk_assign")
+    async def bulk_assign(self, rng):
+        project = self.data.random_project(rng)
+        numbers = self._number_ranges(rng, project)
+        user_id = rng.choice(self.data.user_ids)
+        return lambda: self.issues.bulk_assign(project.id, user_id, numbers=numbers)
+
+    @benchmark("IssueRepository.bulk_tag")
+    async def bulk_tag(self, rng):
+        project = self.data.random_project(rng)
+        numbers = self._number_ranges(rng, project)
+        tag_id, _ = self.data.random_tag(rng, project.id)
+        return lambda: self.issues.bulk_tag(project.id, tag_id, numbers=numbers)
+
+    @benchmark("IssueRepository.create_issue")
+    async def create_issue(self, rng):
+        project = await self.projects.get(self.data.random_project(rng).id)
+        creator = await self.users.get_or_create(user_id=rng.choice(self.data.user_ids))
+        assignee = await self.users.get_or_create(
+            user_id=rng.choice(self.data.user_ids)
+        )
+        title = " ".join(rng.choices(WORDS, k=6))
+        return lambda: self.issues.create_issue(
+            project, creator, title, "Created by the benchmark.", [assignee]
+        )
+
+    @benchmark("IssueRepository.import_issues (50)")
+    async def import_issues(self, rng):
+        project_id = self.data.random_project(rng).id
+        tag_names = [name for _, name in self.data.tags[project_id]]
+        records = [
+            IssueRecord(
+                title=" ".join(rng.choices(WORDS, k=6)),
+                description=None,
+                creator_id=rng.choice(self.data.user_ids),
+                assignee_ids=(rng.choice(self.data.user_ids),),
+                tag_names=(rng.choice(tag_names),),
+            )
+            for _ in range(50)
+        ]
+        return lambda: self.issues.import_issues(project_id, records)
+
+    @benchmark("IssueRepository.add_assignee")
+    async def add_assignee(self, rng):
+        issue_id = rng.randint(1, self.data.max_issue_id)
+        # A fresh user measures the insert rather than the already-assigned path.
+        user = await self.users.get_or_create(user_id=str(uuid.uuid4().int >> 68))
+        return lambda: self.issues.add_assignee(issue_id, user)
+
+    @benchmark("IssueRepository.stream_for_export")
+    async def stream_for_export(self, rng):
+        project_id = self.data.random_project(rng).id
+
+        async def export():
+            async for _ in self.issues.stream_for_export(project_id):
+                pass
+
+        return export
+
+    async def _autocomplete(self, rng, callback, warm: bool):
+        project = self.data.random_project(rng)
+        interaction = _interaction(project.guild_id, project.name)
+        current = rng.choice(WORDS)[:3]
+        clear_caches()
+        if warm:
+            await callback(interaction, current)
+        return lambda: callback(interaction, current)
+
+    @benchmark("project_autocomplete (cold)")
+    async def project_autocomplete_cold(self, rng):
+        return await self._autocomplete(rng, project_autocomplete, warm=False)
+
+    @benchmark("project_autocomplete (warm)")
+    async def project_autocomplete_warm(self, rng):
+        return await self._autocomplete(rng, project_autocomplete, warm=True)
+
+    @benchmark("tag_autocomplete (cold)")
+    async def tag_autocomplete_cold(self, rng):
+        return await self._autocomplete(rng, tag_autocomplete, warm=False)
+
+    @benchmark("tag_autocomplete (warm)")
+    async def tag_autocomplete_warm(self, rng):
+        return await self._autocomplete(rng, tag_autocomplete, warm=True)
+
+    @benchmark("issue_autocomplete (cold)")
+    async def issue_autocomplete_cold(self, rng):
+        return await self._autocomplete(rng, issue_autocomplete, warm=False)
+
+    @benchmark("issue_autocomplete (warm)")
+    async def issue_autocomplete_warm(self, rng):
+        return await self._autocomplete(rng, issue_autocomplete, warm=True)
+
+
+@contextlib.asynccontextmanager
+async def use_database(path: Path) -> AsyncIterator[None]:
+    """Points every repository at ``path`` with the production engine setup."""
+    url = f"sqlite+aiosqlite:///{path}"
+    engine = database.make_engine(url)
+    read_engine = database.make_engine(
+        url, query_only=True, pool_size=database.READER_POOL_SIZE
+    )
+    queue = WriteQueue(
+        async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False),
+        max_batch_size=database.WRITE_BATCH_SIZE,
+        max_latency=database.WRITE_BATCH_LATENCY,
+    )
+    previous = base_repository.write_queue, base_repository.ReadSessionLocal
+    base_repository.write_queue = queue
+    base_repository.ReadSessionLocal = async_sessionmaker(
+        bind=read_engine, autoflush=False, expire_on_commit=False
+    )
+    clear_caches()
+    try:
+        yield
+    finally:
+        base_repository.write_queue, base_repository.ReadSessionLocal = previous
+        clear_caches()
+        await queue.close()
+        await engine.dispose()
+        await read_engine.dispose()
+
+
+def summarize(samples: list[float], queries: list[int]) -> dict[str, float]:
+    """Returns latency percentiles in milliseconds and the mean query count."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "iterations": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "queries": statistics.fmean(queries),
+    }
+
+
+async def run_benchmarks(
+    data: Dataset,
+    iterations: int,
+    warmup: int,
+    rng: random.Random,
+    only: Optional[str] = None,
+) -> dict[str, dict[str, float]]:
+    """
+    Runs each registered benchmark ``warmup + iterations`` times.
+
+    Returns:
+        The summary of every benchmark, keyed by name.
+    """
+    benchmarks = RepositoryBenchmarks(data)
+    results = {}
+    for name, method in _BENCHMARKS:
+        if only and only not in name:
+            continue
+        prepare: Prepare = getattr(benchmarks, method)
+        samples, queries = [], []
+        for i in range(warmup + iterations):
+            call = await prepare(rng)
+            scope = QueryScope(name)
+            token = current_scope.set(scope)
+            try:
+                start = time.perf_counter()
+                await call()
+                elapsed = time.perf_counter() - start
+            finally:
+                current_scope.reset(token)
+            if i >= warmup:
+                samples.append(elapsed)
+                queries.append(scope.queries)
+        results[name] = summarize(samples, queries)
+        print(
+            f"{name:48} p50 {results[name]['p50_ms']:8.2f} ms  "
+            f"p95 {results[name]['p95_ms']:8.2f} ms  "
+            f"p99 {results[name]['p99_ms']:8.2f} ms  "
+            f"{results[name]['queries']:5.1f} queries",
+            file=sys.stderr,
+        )
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Prints each benchmark's p50 and p95 relative to a baseline run.
+
+    Returns:
+        The names of benchmarks whose p95 grew by more than ``tolerance``.
+    """
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        p50 = result["p50_ms"] / before["p50_ms"] if before["p50_ms"] else 1.0
+        p95 = result["p95_ms"] / before["p95_ms"] if before["p95_ms"] else 1.0
+        flag = ""
+        if p95 > 1 + tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:48} p50 x{p50:5.2f}  p95 x{p95:5.2f}{flag}")
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Seeds (if needed) and benchmarks a database, returning the report."""
+    scale = SCALES[args.scale]._replace(
+        **{
+            field: getattr(args, field)
+            for field in Scale._fields
+            if getattr(args, field) is not None
+        }
+    )
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "benchmark.sqlite3"
+        seed_seconds = None
+        if not path.exists():
+            print(f"Seeding {path} with {scale}...", file=sys.stderr)
+            start = time.perf_counter()
+            seed(path, scale, rng)
+            seed_seconds = time.perf_counter() - start
+        data = load(path)
+        async with use_database(path):
+            results = await run_benchmarks(
+                data, args.iterations, args.warmup, rng, args.only
+            )
+
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale._asdict(),
+        "seed": args.seed,
+        "seed_seconds": seed_seconds,
+        "results": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.repository_benchmark")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    for field in Scale._fields:
+        parser.add_argument(
+            f"--{field.replace('_', '-')}",
+            dest=field,
+            type=int,
+            help=f"Override the scale's number of {field.replace('_', ' ')}.",
+        )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--database",
+        type=Path,
+        help="Benchmark this file, seeding it first if it does not exist. "
+        "Benchmarks write to it.",
+    )
+    parser.add_argument("--only", help="Only run benchmarks whose name contains this.")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    parser.add_argument("--compare", type=Path, help="A previous JSON report.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed p95 growth over the baseline, as a fraction.",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.iterations < 2:
+        print("--iterations must be at least 2.", file=sys.stderr)
+        return 2
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        if compare(report["results"], baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,19 @@
+import asyncio
 import os
 import logging
+import pkgutil
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+from . import cogs
+from .command_sync import sync_if_changed
+from .command_tree import InstrumentedCommandTree
+from .db.database import write_queue
+from .metrics.exporter import MetricsServer
+from .metrics.loop_monitor import loop_monitor
+from .repo.purger import project_purger
 
 # --- Basic Logging Setup ---
 # This provides more detailed output than print() for debugging.
@@ -15,6 +24,10 @@ logging.basicConfig(level=logging.INFO)
 load_dotenv()
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 
+# Where Prometheus metrics are served. An empty METRICS_PORT turns them off.
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = os.getenv("METRICS_PORT", "9464")
+
 
 class IssueTrackerBot(commands.Bot):
     def __init__(self):
@@ -22,31 +35,66 @@ class IssueTrackerBot(commands.Bot):
         intents.members = True
         intents.message_content = True
 
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(
+            command_prefix="!", intents=intents, tree_cls=InstrumentedCommandTree
+        )
+        self.metrics_server = (
+            MetricsServer(self, METRICS_HOST, int(METRICS_PORT))
+            if METRICS_PORT
+            else None
+        )
 
     async def setup_hook(self):
         logging.info("Running setup hook...")
 
         # TODO: Figure out best way to set up db here
 
-        # Load all command cogs from the cogs directory
+        # Log the stack of anything that blocks the event loop.
+        loop_monitor.start()
+
+        if self.metrics_server is not None:
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                logging.error(f"Failed to start the metrics server: {e}")
+
+        # Resume purging projects deleted before the last shutdown.
+        project_purger.wake()
+
+        # Load every cog module in the cogs package concurrently.
         logging.info("Loading cogs...")
-        for filename in os.listdir("./discord_issues/cogs"):
-            if filename.endswith(".py") and not filename.startswith("__"):
-                try:
-                    cog_path = f"discord_issues.cogs.{filename[:-3]}"
-                    await self.load_extension(cog_path)
-                    logging.info(f"Successfully loaded cog: {cog_path}")
-                except Exception as e:
-                    logging.error(f"Failed to load cog {filename}: {e}")
-
-        # Sync slash commands to Discord.
+        await asyncio.gather(
+            *(
+                self._load_cog(f"{cogs.__name__}.{module.name}")
+                for module in pkgutil.iter_modules(cogs.__path__)
+                if not module.name.startswith("_")
+            )
+        )
+
+        # Sync slash commands to Discord, but only if they changed.
         try:
-            synced = await self.tree.sync()
-            logging.info(f"Synced {len(synced)} application command(s).")
+            synced = await sync_if_changed(self.tree)
+            if synced is not None:
+                logging.info(f"Synced {len(synced)} application command(s).")
         except Exception as e:
             logging.error(f"Failed to sync application commands: {e}")
 
+    async def _load_cog(self, cog_path: str):
+        try:
+            await self.load_extension(cog_path)
+            logging.info(f"Successfully loaded cog: {cog_path}")
+        except Exception as e:
+            logging.error(f"Failed to load cog {cog_path}: {e}")
+
+    async def close(self):
+        # Commit any queued writes before the connection goes away.
+        await project_purger.close()
+        await loop_monitor.close()
+        if self.metrics_server is not None:
+            await self.metrics_server.close()
+        await write_queue.close()
+        await super().close()
+
     async def on_ready(self):
         if not self.user:
             logging.error("Bot user is not set. Exiting...")
@@ -0,0 +1,220 @@
+import bisect
+import sys
+from itertools import islice
+from typing import Iterable, Optional
+
+from .lru import LRUCache
+
+MAX_CHOICES = 25
+
+# Entries the substring pass of a search looks at, so a keystroke stays cheap
+# in a large index. Prefix matches are found by binary search regardless, and
+# issue autocomplete tops up with full-text matches.
+SUBSTRING_SCAN_LIMIT = 2000
+
+# Memory budget for the resident issue indexes, as estimated when loaded.
+ISSUE_INDEX_BYTES = 32 * 1024 * 1024
+
+
+class NameIndex:
+    """
+    A case-insensitive, sorted index of (label, value) pairs.
+
+    Prefix matches are found by binary search; substring matches among the
+    first ``SUBSTRING_SCAN_LIMIT`` entries fill up the remaining slots in label
+    order.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()):
+        self._entries: list[tuple[str, str, str]] = sorted(
+            (label.casefold(), label, value) for label, value in entries
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def nbytes(self) -> int:
+        """Estimates the memory held by the index in bytes."""
+        return sys.getsizeof(self._entries) + sum(
+            sys.getsizeof(entry) + sum(map(sys.getsizeof, entry))
+            for entry in self._entries
+        )
+
+    def add(self, label: str, value: str) -> None:
+        """Inserts an entry, keeping the index sorted."""
+        bisect.insort(self._entries, (label.casefold(), label, value))
+
+    def remove(self, label: str, value: str) -> None:
+        """Removes an entry if present."""
+        entry = (label.casefold(), label, value)
+        i = bisect.bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> list[tuple[str, str]]:
+        """Returns up to ``limit`` entries, prefix matches before substring ones."""
+        needle = query.casefold()
+        results = []
+
+        i = bisect.bisect_left(self._entries, (needle,))
+        while (
+            i < len(self._entries)
+            and len(results) < limit
+            and self._entries[i][0].startswith(needle)
+        ):
+            results.append(self._entries[i][1:])
+            i += 1
+
+        if len(results) < limit and needle:
+            for key, label, value in islice(self._entries, SUBSTRING_SCAN_LIMIT):
+                if needle in key and not key.startswith(needle):
+                    results.append((label, value))
+                    if len(results) == limit:
+                        break
+        return results
+
+
+class IssueIndex:
+    """Indexes a project's issues by their ``#id: title`` label."""
+
+    def __init__(self, issues: Iterable[tuple[int, str]] = ()):
+        # Insertion order follows project_issue_id, so reversing yields newest first.
+        self._titles: dict[int, str] = dict(sorted(issues))
+        self._names = NameIndex(
+            (self.label(number, title), str(number))
+            for number, title in self._titles.items()
+        )
+
+    @staticmethod
+    def label(number: int, title: str) -> str:
+        return f"#{number}: {title}"
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def nbytes(self) -> int:
+        """Estimates the memory held by the index in bytes."""
+        return (
+            sys.getsizeof(self._titles)
+            + sum(map(sys.getsizeof, self._titles.values()))
+            + self._names.nbytes()
+        )
+
+    def add(self, number: int, title: str) -> None:
+        """Adds an issue, or replaces the title of an existing one."""
+        if number in self._titles:
+            self._names.remove(self.label(number, self._titles[number]), str(number))
+        self._titles[number] = title
+        self._names.add(self.label(number, title), str(number))
+
+    def remove(self, number: int) -> None:
+        """Removes an issue if present."""
+        title = self._titles.pop(number, None)
+        if title is not None:
+            self._names.remove(self.label(number, title), str(number))
+
+    def search(self, query: str, limit: int = MAX_CHOICES) -> list[tuple[str, str]]:
+        """Returns the newest issues for an empty query, otherwise label matches."""
+        if not query.strip():
+            return [
+                (self.label(number, title), str(number))
+                for number, title in islice(reversed(self._titles.items()), limit)
+            ]
+        return self._names.search(query.strip(), limit)
+
+
+class AutocompleteIndex:
+    """
+    Resident per-guild indexes backing the autocomplete callbacks.
+
+    Each index is built lazily by the caller on first use and then kept up to
+    date incrementally. Updates to an index that is not loaded are ignored,
+    since the next lazy load reads the current state from the database.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_issue_bytes: int = ISSUE_INDEX_BYTES):
+        """
+        Initializes empty indexes.
+
+        Args:
+            maxsize: The most indexes of each kind kept before evicting.
+            max_issue_bytes: The memory budget for all issue indexes, which
+                grow with a project's issue count.
+        """
+        self._projects: LRUCache[str, NameIndex] = LRUCache(maxsize)
+        self._tags: LRUCache[int, NameIndex] = LRUCache(maxsize)
+        self._issues: LRUCache[int, IssueIndex] = LRUCache(
+            maxsize, max_bytes=max_issue_bytes, sizeof=IssueIndex.nbytes
+        )
+
+    def clear(self) -> None:
+        self._projects.clear()
+        self._tags.clear()
+        self._issues.clear()
+
+    # --- Projects ---
+    def projects(self, guild_id: str) -> Optional[NameIndex]:
+        return self._projects.get(guild_id)
+
+    def load_projects(self, guild_id: str, names: Iterable[str]) -> NameIndex:
+        index = NameIndex((name, name) for name in names)
+        self._projects.set(guild_id, index)
+        return index
+
+    def add_project(self, guild_id: str, name: str) -> None:
+        if (index := self._projects.get(guild_id)) is not None:
+            index.add(name, name)
+
+    def rename_project(self, guild_id: str, old_name: str, new_name: str) -> None:
+        if (index := self._projects.get(guild_id)) is not None:
+            index.remove(old_name, old_name)
+            index.add(new_name, new_name)
+
+    def remove_project(self, guild_id: str, name: str, project_id: int) -> None:
+        if (index := self._projects.get(guild_id)) is not None:
+            index.remove(name, name)
+        self.invalidate_project(project_id)
+
+    def invalidate_project(self, project_id: int) -> None:
+        """Drops a project's tag and issue indexes, e.g. after a bulk change."""
+        self._tags.invalidate(project_id)
+        self._issues.invalidate(project_id)
+
+    # --- Tags ---
+    def tags(self, project_id: int) -> Optional[NameIndex]:
+        return self._tags.get(project_id)
+
+    def load_tags(self, project_id: int, names: Iterable[str]) -> NameIndex:
+        index = NameIndex((name, name) for name in names)
+        self._tags.set(project_id, index)
+        return index
+
+    def add_tag(self, project_id: int, name: str) -> None:
+        if (index := self._tags.get(project_id)) is not None:
+            index.add(name, name)
+
+    def remove_tag(self, project_id: int, name: str) -> None:
+        if (index := self._tags.get(project_id)) is not None:
+            index.remove(name, name)
+
+    # --- Issues ---
+    def issues(self, project_id: int) -> Optional[IssueIndex]:
+        return self._issues.get(project_id)
+
+    def load_issues(
+        self, project_id: int, issues: Iterable[tuple[int, str]]
+    ) -> IssueIndex:
+        index = IssueIndex(issues)
+        self._issues.set(project_id, index)
+        return index
+
+    def add_issue(self, project_id: int, number: int, title: str) -> None:
+        if (index := self._issues.get(project_id)) is not None:
+            index.add(number, title)
+
+    def remove_issue(self, project_id: int, number: int) -> None:
+        if (index := self._issues.get(project_id)) is not None:
+            index.remove(number)
+
+
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,45 @@
+from typing import Any, Hashable, Optional
+
+from .lru import LRUCache
+
+
+class EmbedCache:
+    """
+    Serialized embed payloads keyed by record id and tagged with a version.
+
+    A payload is only served while the version it was rendered from still
+    matches, so a changed ``updated_at`` makes the stale payload miss without
+    any explicit invalidation. Changes that do not touch the version should
+    call ``invalidate``.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self._payloads: LRUCache[int, tuple[Hashable, dict[str, Any]]] = LRUCache(
+            maxsize=maxsize
+        )
+
+    def get(self, record_id: int, version: Hashable) -> Optional[dict[str, Any]]:
+        """Returns the payload rendered from ``version``, if one is cached."""
+        entry = self._payloads.get(record_id)
+        if entry is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def set(self, record_id: int, version: Hashable, payload: dict[str, Any]) -> None:
+        """Stores the payload rendered from ``version``."""
+        self._payloads.set(record_id, (version, payload))
+
+    def invalidate(self, record_id: int) -> None:
+        """Drops the payload cached for a record."""
+        self._payloads.invalidate(record_id)
+
+    def clear(self) -> None:
+        """Drops every payload."""
+        self._payloads.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Returns the hit and miss counts of the underlying cache."""
+        return self._payloads.stats()
+
+
+issue_embed_cache = EmbedCache()
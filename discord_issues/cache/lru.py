@@ -0,0 +1,118 @@
+import math
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Entry(NamedTuple):
+    value: object
+    expires_at: float
+    size: int
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A bounded in-process cache that evicts the least recently used entry once
+    it holds more than ``maxsize`` entries. Lookups are counted so callers can
+    report hit rates.
+
+    Entries can optionally expire ``ttl`` seconds after they were stored, and
+    the cache can be held under ``max_bytes`` as measured by ``sizeof``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[V], int] = sys.getsizeof,
+    ):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize: The maximum number of entries kept before evicting.
+            ttl: Seconds after which an entry expires, or None to keep it.
+            max_bytes: The memory budget for all entries, or None for no budget.
+            sizeof: Estimates the size in bytes of a value.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.total_bytes = 0
+        self._data: OrderedDict[K, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the cached value for ``key``, or None on a miss."""
+        entry = self._data.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: K, value: V) -> None:
+        """Stores ``value`` under ``key``, evicting the oldest entries if full."""
+        self._remove(key)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else math.inf
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        self._data[key] = _Entry(value, expires_at, size)
+        self.total_bytes += size
+        while len(self._data) > self.maxsize or (
+            self.max_bytes is not None and self.total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Removes ``key`` from the cache if present."""
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        self._data.clear()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> dict[str, float]:
+        """Returns the entry count, estimated bytes, counters and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _remove(self, key: K) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
@@ -0,0 +1,6 @@
+from typing import Union
+
+
+def mention(user_id: Union[int, str]) -> str:
+    """Renders a user mention without looking the user up."""
+    return f"<@{user_id}>"
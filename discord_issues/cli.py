@@ -0,0 +1,107 @@
+"""
+Offline maintenance commands that run against the database without the bot.
+
+Usage:
+    python -m discord_issues.cli import <guild_id> <project> <file> [--creator ID]
+    python -m discord_issues.cli export <guild_id> <project> <file> [--format FMT]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import Optional
+
+from .db.database import write_queue
+from .repo.project_repository import ProjectRepository
+from .transfer.issue_import import (
+    IMPORT_CHUNK_SIZE,
+    ImportFormatError,
+    detect_format,
+    import_issues,
+    parse_issues,
+)
+from .transfer.project_export import export_issues
+
+
+async def run_import(args: argparse.Namespace) -> int:
+    fmt = args.format or detect_format(args.file.name)
+    if fmt is None:
+        print(f"Cannot tell the format of {args.file}; pass --format.", file=sys.stderr)
+        return 2
+
+    project = await ProjectRepository().find_by_name(args.guild_id, args.project)
+    if not project:
+        print(f"Project '{args.project}' not found.", file=sys.stderr)
+        return 1
+
+    async def report(total: int) -> None:
+        print(f"Imported {total} issue(s)...", file=sys.stderr)
+
+    with args.file.open(encoding="utf-8-sig", newline="") as fp:
+        records = parse_issues(fp, fmt, args.creator)
+        try:
+            total = await import_issues(
+                project.id, records, chunk_size=args.chunk_size, progress=report
+            )
+        except ImportFormatError as e:
+            print(f"Import stopped: {e}", file=sys.stderr)
+            return 1
+
+    print(f"Imported {total} issue(s) into '{project.name}'.")
+    return 0
+
+
+async def run_export(args: argparse.Namespace) -> int:
+    fmt = args.format or ("csv" if ".csv" in args.file.suffixes else "jsonl")
+    project = await ProjectRepository().find_by_name(args.guild_id, args.project)
+    if not project:
+        print(f"Project '{args.project}' not found.", file=sys.stderr)
+        return 1
+
+    with args.file.open("wb") as fp:
+        total = await export_issues(project.id, fp, fmt)
+
+    print(f"Exported {total} issue(s) from '{project.name}' to {args.file}.")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m discord_issues.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser(
+        "import", help="Import issues from a CSV or JSON lines file."
+    )
+    import_parser.add_argument("guild_id")
+    import_parser.add_argument("project", help="The project name.")
+    import_parser.add_argument("file", type=Path)
+    import_parser.add_argument("--format", choices=["csv", "jsonl"])
+    import_parser.add_argument(
+        "--creator", help="User ID recorded for rows without a creator_id."
+    )
+    import_parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    import_parser.set_defaults(handler=run_import)
+
+    export_parser = commands.add_parser(
+        "export", help="Export a project's issues to a gzip-compressed file."
+    )
+    export_parser.add_argument("guild_id")
+    export_parser.add_argument("project", help="The project name.")
+    export_parser.add_argument("file", type=Path, help="e.g. issues.jsonl.gz")
+    export_parser.add_argument("--format", choices=["csv", "jsonl"])
+    export_parser.set_defaults(handler=run_export)
+
+    return parser
+
+
+async def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return await args.handler(args)
+    finally:
+        await write_queue.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
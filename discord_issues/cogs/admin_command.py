@@ -2,6 +2,51 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from ..command_sync import sync_if_changed
+from ..db.instrumentation import QueryStats, query_stats
+
+# Statements are cut to this many characters in /admin dbstats.
+STATEMENT_PREVIEW_LENGTH = 150
+
+
+def format_dbstats(stats: QueryStats, top: int, max_queries: int) -> str:
+    """
+    Renders the most expensive statements and the chattiest commands.
+
+    Args:
+        stats: The statistics to render.
+        top: How many statements to list.
+        max_queries: List commands that issued more queries than this in a
+            single invocation, which usually means an N+1 pattern.
+
+    Returns:
+        Markdown fit for an embed description.
+    """
+    lines = [f"**Top {top} statements by total time**"]
+    for statement, s in stats.top_statements(top):
+        preview = statement[:STATEMENT_PREVIEW_LENGTH]
+        if len(statement) > STATEMENT_PREVIEW_LENGTH:
+            preview += "…"
+        lines.append(
+            f"{s.seconds * 1000:.1f} ms total · {s.count} call(s) · "
+            f"p95 {s.latency.percentile(95) * 1000:.2f} ms · {s.rows} row(s) changed"
+            f"\n```sql\n{preview}\n```"
+        )
+    if len(lines) == 1:
+        lines.append("No queries recorded yet.")
+
+    lines.append(f"**Commands issuing more than {max_queries} queries**")
+    chatty = stats.chatty_commands(max_queries)
+    for name, c in chatty:
+        lines.append(
+            f"`{name}`: up to {c.max_queries} queries, "
+            f"median {c.queries_per_invocation.percentile(50):.0f} "
+            f"over {c.invocations} call(s)"
+        )
+    if not chatty:
+        lines.append("None.")
+    return "\n".join(lines)
+
 
 class AdminCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -13,12 +58,41 @@ class AdminCog(commands.Cog):
 
     @admin_group.command(name="sync", description="Sync tree commands for development")
     @app_commands.checks.has_permissions(administrator=True)
-    async def sync(self, interaction: discord.Interaction):
+    @app_commands.describe(force="Sync even if the commands have not changed")
+    async def sync(self, interaction: discord.Interaction, force: bool = False):
         await interaction.response.defer(ephemeral=True)
 
-        await self.bot.tree.sync(guild=interaction.guild)
+        synced = await sync_if_changed(
+            self.bot.tree, guild=interaction.guild, force=force
+        )
+        if synced is None:
+            await interaction.followup.send(
+                "Command tree unchanged; skipped sync.", ephemeral=True
+            )
+            return
         await interaction.followup.send("Command tree synced.", ephemeral=True)
 
+    @admin_group.command(
+        name="dbstats", description="Show the most expensive database queries"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        top="How many statements to show",
+        max_queries="Flag commands issuing more queries than this per call",
+    )
+    async def dbstats(
+        self,
+        interaction: discord.Interaction,
+        top: app_commands.Range[int, 1, 10] = 10,
+        max_queries: app_commands.Range[int, 1] = 10,
+    ):
+        embed = discord.Embed(
+            title="Database statistics",
+            description=format_dbstats(query_stats, top, max_queries)[:4096],
+            color=discord.Color.blue(),
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AdminCog(bot))
@@ -1,15 +1,22 @@
+import abc
+import io
 import logging
-from typing import List, Any
+import tempfile
+from typing import List, Any, Optional, Union
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from ..db.models import IssueStatus
+from ..cache.autocomplete_index import MAX_CHOICES, IssueIndex, autocomplete_index
+from ..cache.embed_cache import issue_embed_cache
+from ..cache.user_resolver import mention
+from ..db.models import Issue, IssueStatus, Project
 from ..repo.issue_repository import IssueRepository
 from ..repo.project_repository import ProjectRepository
 from ..repo.tag_repository import TagRepository
 from ..repo.user_repository import UserRepository
 from .project_command import project_autocomplete
+from .tag_command import tag_autocomplete
 
 
 async def issue_autocomplete(
@@ -19,32 +26,192 @@ async def issue_autocomplete(
     if not project_name:
         return []
 
-    project_repo = ProjectRepository()
-    project = project_repo.find_by_name(str(interaction.guild_id), project_name)
+    project = await ProjectRepository().find_by_name(
+        str(interaction.guild_id), project_name
+    )
     if not project:
         return []
 
-    # A repository method for searching would be more efficient here in a larger app
-    with IssueRepository().session_factory() as session:
-        issues = (
-            session.query(IssueRepository().model)
-            .filter_by(project_id=project.id)
-            .order_by(IssueRepository().model.project_issue_id.desc())
-            .limit(25)
-            .all()
-        )
-
-    choices = []
-    for issue in issues:
-        choice_name = f"#{issue.project_issue_id}: {issue.title}"
-        if current.lower() in choice_name.lower():
-            # The value must be a string for discord.py's autocomplete type hints
-            choices.append(
-                app_commands.Choice(
-                    name=choice_name[:100], value=str(issue.project_issue_id)
+    issue_repo = IssueRepository()
+    index = autocomplete_index.issues(project.id)
+    if index is None:
+        issues = await issue_repo.find_titles_by_project(project.id)
+        index = autocomplete_index.load_issues(project.id, issues)
+    matches = index.search(current)
+
+    # Titles alone came up short, so top up with full-text matches that also
+    # cover descriptions.
+    if len(matches) < MAX_CHOICES and current.strip() and current[0] != "#":
+        seen = {value for _, value in matches}
+        for issue in await issue_repo.search(project.id, current, limit=MAX_CHOICES):
+            value = str(issue.project_issue_id)
+            if value not in seen and len(matches) < MAX_CHOICES:
+                matches.append(
+                    (IssueIndex.label(issue.project_issue_id, issue.title), value)
                 )
+
+    # The value must be a string for discord.py's autocomplete type hints
+    return [
+        app_commands.Choice(name=name[:100], value=value) for name, value in matches
+    ]
+
+
+MAX_BULK_RANGES = 100
+
+
+def parse_issue_numbers(text: str) -> list[tuple[int, int]]:
+    """
+    Parses a list of issue numbers and ranges such as ``"1-5, 8, 12"``.
+
+    Returns:
+        Inclusive (first, last) ranges.
+
+    Raises:
+        ValueError: If the text is not a valid list.
+    """
+    ranges = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        first, _, last = part.lstrip("#").partition("-")
+        first, last = int(first), int(last.lstrip("#") or first)
+        if first < 1 or last < first:
+            raise ValueError(f"invalid range '{part}'")
+        ranges.append((first, last))
+    if not ranges:
+        raise ValueError("no issue numbers given")
+    if len(ranges) > MAX_BULK_RANGES:
+        raise ValueError(f"at most {MAX_BULK_RANGES} numbers or ranges are allowed")
+    return ranges
+
+
+class IssuePageView(discord.ui.View, abc.ABC):
+    """
+    A view that pages through a list of issues, fetching each page only when
+    the user navigates to it. Subclasses implement ``fetch_page``.
+    """
+
+    PAGE_SIZE = 10
+
+    def __init__(
+        self, author: Union[discord.User, discord.Member], project: Project, title: str
+    ):
+        super().__init__(timeout=180.0)
+        self.author = author
+        self.project = project
+        self.embed_title = title
+        self.page = 0
+        self.issues: list[Issue] = []
+
+    @abc.abstractmethod
+    async def fetch_page(self, page: int) -> tuple[list[Issue], bool]:
+        """Returns the issues on ``page`` and whether another page follows."""
+
+    async def load_page(self, page: int) -> discord.Embed:
+        """Fetches ``page``, updates the buttons and renders the page's embed."""
+        self.issues, has_next = await self.fetch_page(page)
+        self.page = page
+        self.previous_button.disabled = page == 0
+        self.next_button.disabled = not has_next
+        return self.build_embed()
+
+    def build_embed(self) -> discord.Embed:
+        embed = discord.Embed(title=self.embed_title, color=discord.Color.blue())
+        embed.description = "\n".join(self.format_issue(issue) for issue in self.issues)
+        embed.set_footer(text=f"Page {self.page + 1}")
+        return embed
+
+    def format_issue(self, issue: Issue) -> str:
+        return f"**#{issue.project_issue_id}** {issue.title} — `{issue.status.value}`"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Ensures only the original command author can interact with the view."""
+        if interaction.user.id != self.author.id:
+            await interaction.response.send_message(
+                "You are not authorized to perform this action.", ephemeral=True
             )
-    return choices
+            return False
+        return True
+
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        embed = await self.load_page(self.page - 1)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(
+        self, interaction: discord.Interaction, button: discord.ui.Button
+    ):
+        embed = await self.load_page(self.page + 1)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+
+class IssueSearchView(IssuePageView):
+    """Pages through full-text search results, best match first."""
+
+    def __init__(
+        self,
+        author: Union[discord.User, discord.Member],
+        issue_repo: IssueRepository,
+        project: Project,
+        query: str,
+    ):
+        super().__init__(
+            author, project, f"🔎 [{project.name}] Issues matching '{query}'"
+        )
+        self.issue_repo = issue_repo
+        self.query = query
+
+    async def fetch_page(self, page: int) -> tuple[list[Issue], bool]:
+        # Fetch one extra row to learn whether a next page exists.
+        issues = await self.issue_repo.search(
+            self.project.id,
+            self.query,
+            limit=self.PAGE_SIZE + 1,
+            offset=page * self.PAGE_SIZE,
+        )
+        return issues[: self.PAGE_SIZE], len(issues) > self.PAGE_SIZE
+
+
+class IssueListView(IssuePageView):
+    """Pages through a filtered issue list using keyset pagination."""
+
+    def __init__(
+        self,
+        author: Union[discord.User, discord.Member],
+        issue_repo: IssueRepository,
+        project: Project,
+        filters: dict[str, Any],
+    ):
+        super().__init__(author, project, f"📋 Issues in {project.name}")
+        self.issue_repo = issue_repo
+        self.filters = filters
+        # cursors[n] is the last project_issue_id shown before page n.
+        self.cursors: list[Optional[int]] = [None]
+
+    async def fetch_page(self, page: int) -> tuple[list[Issue], bool]:
+        # Fetch one extra row to learn whether a next page exists.
+        issues = await self.issue_repo.list_issues(
+            self.project.id,
+            after=self.cursors[page],
+            limit=self.PAGE_SIZE + 1,
+            **self.filters,
+        )
+        has_next = len(issues) > self.PAGE_SIZE
+        issues = issues[: self.PAGE_SIZE]
+        if has_next and len(self.cursors) == page + 1:
+            self.cursors.append(issues[-1].project_issue_id)
+        return issues, has_next
+
+    def format_issue(self, issue: Issue) -> str:
+        assignees = ", ".join(mention(user.user_id) for user in issue.assignees)
+        tags = ", ".join(f"`{tag.name}`" for tag in issue.tags)
+        return (
+            f"{super().format_issue(issue)}\n"
+            f"-# 👤 {assignees or 'Unassigned'} · 🏷️ {tags or 'No tags'}"
+        )
 
 
 class IssueCreateModal(discord.ui.Modal, title="Create New Issue"):
@@ -70,12 +237,15 @@ class IssueCreateModal(discord.ui.Modal, title="Create New Issue"):
     async def on_submit(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         try:
-            issue = self.issue_repo.create_issue(
+            issue = await self.issue_repo.create_issue(
                 project=self.project,
                 creator=self.creator,
                 title=self.title_input.value,
                 description=self.description_input.value,
             )
+            autocomplete_index.add_issue(
+                self.project.id, issue.project_issue_id, issue.title
+            )
             embed = discord.Embed(
                 title=f"✅ Issue Created: #{issue.project_issue_id}",
                 description=f"Successfully created a new issue in project **{self.project.name}**.",
@@ -107,7 +277,7 @@ class IssueCog(commands.Cog):
     @app_commands.autocomplete(project_name=project_autocomplete)
     async def create_issue(self, interaction: discord.Interaction, project_name: str):
         """Opens a modal to create a new issue."""
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
@@ -116,9 +286,7 @@ class IssueCog(commands.Cog):
             )
             return
 
-        creator = self.user_repo.get(str(interaction.user.id))
-        if not creator:
-            creator = self.user_repo.create(user_id=str(interaction.user.id))
+        creator = await self.user_repo.get_or_create(user_id=str(interaction.user.id))
 
         modal = IssueCreateModal(self.issue_repo, project, creator)
         await interaction.response.send_modal(modal)
@@ -135,7 +303,7 @@ class IssueCog(commands.Cog):
         """Displays a detailed embed for a single issue."""
         await interaction.response.defer()
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
@@ -144,7 +312,16 @@ class IssueCog(commands.Cog):
             )
             return
 
-        issue = self.issue_repo.find_by_project_issue_id(project.id, issue_id)
+        version = await self.issue_repo.get_version(project.id, issue_id)
+        issue = None
+        if version:
+            # Project renames change the title without touching the issue.
+            cache_version = (version[1], project.name)
+            payload = issue_embed_cache.get(version[0], cache_version)
+            if payload is not None:
+                await interaction.followup.send(embed=discord.Embed.from_dict(payload))
+                return
+            issue = await self.issue_repo.find_by_project_issue_id(project.id, issue_id)
         if not issue:
             await interaction.followup.send(
                 f"❌ Issue #{issue_id} not found in project '{project_name}'.",
@@ -163,13 +340,11 @@ class IssueCog(commands.Cog):
             color=color,
         )
 
-        creator_user = await self.bot.fetch_user(int(issue.creator_id))
-
         embed.add_field(name="Status", value=f"`{issue.status.value}`", inline=True)
-        embed.add_field(name="Creator", value=creator_user.mention, inline=True)
+        embed.add_field(name="Creator", value=mention(issue.creator_id), inline=True)
 
         assignees_str = (
-            ", ".join([f"<@{assignee.user_id}>" for assignee in issue.assignees])
+            ", ".join([mention(assignee.user_id) for assignee in issue.assignees])
             or "None"
         )
         embed.add_field(name="Assignees", value=assignees_str, inline=False)
@@ -184,8 +359,288 @@ class IssueCog(commands.Cog):
         embed.add_field(name="Created", value=f"<t:{created_ts}:F>", inline=True)
         embed.add_field(name="Updated", value=f"<t:{updated_ts}:F>", inline=True)
 
+        issue_embed_cache.set(
+            issue.id, (issue.updated_at, project.name), embed.to_dict()
+        )
         await interaction.followup.send(embed=embed)
 
+    @issue_group.command(
+        name="list", description="Lists a project's issues, optionally filtered."
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete, tag=tag_autocomplete)
+    async def list_issues(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        assignee: Optional[discord.User] = None,
+        status: Optional[IssueStatus] = None,
+        tag: Optional[str] = None,
+    ):
+        """Shows the matching issues, one page at a time."""
+        await interaction.response.defer(ephemeral=True)
+
+        project = await self.project_repo.find_by_name(
+            str(interaction.guild_id), project_name
+        )
+        if not project:
+            await interaction.followup.send(f"❌ Project '{project_name}' not found.")
+            return
+
+        filters: dict[str, Any] = {
+            "assignee_id": str(assignee.id) if assignee else None,
+            "status": status,
+            "tag_name": tag,
+        }
+        view = IssueListView(interaction.user, self.issue_repo, project, filters)
+        embed = await view.load_page(0)
+        if not view.issues:
+            await interaction.followup.send(
+                f"No issues in project '{project_name}' match these filters."
+            )
+            return
+
+        await interaction.followup.send(embed=embed, view=view)
+
+    @issue_group.command(
+        name="search", description="Searches issue titles and descriptions."
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete)
+    async def search_issues(
+        self, interaction: discord.Interaction, project_name: str, query: str
+    ):
+        """Shows ranked full-text search results, one page at a time."""
+        await interaction.response.defer(ephemeral=True)
+
+        project = await self.project_repo.find_by_name(
+            str(interaction.guild_id), project_name
+        )
+        if not project:
+            await interaction.followup.send(f"❌ Project '{project_name}' not found.")
+            return
+
+        view = IssueSearchView(interaction.user, self.issue_repo, project, query)
+        embed = await view.load_page(0)
+        if not view.issues:
+            await interaction.followup.send(
+                f"No issues in project '{project_name}' match '{query}'."
+            )
+            return
+
+        await interaction.followup.send(embed=embed, view=view)
+
+    @issue_group.command(
+        name="import", description="Imports issues from a CSV or JSON lines file."
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete)
+    async def import_issues(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        file: discord.Attachment,
+    ):
+        """Bulk-imports issues, reporting progress as chunks are committed."""
+        # Imports are rare, so their machinery is loaded on first use rather
+        # than at startup.
+        from ..transfer.issue_import import (
+            ImportFormatError,
+            detect_format,
+            import_issues,
+            parse_issues,
+        )
+
+        await interaction.response.defer(ephemeral=True)
+
+        project = await self.project_repo.find_by_name(
+            str(interaction.guild_id), project_name
+        )
+        if not project:
+            await interaction.followup.send(f"❌ Project '{project_name}' not found.")
+            return
+
+        fmt = detect_format(file.filename)
+        if fmt is None:
+            await interaction.followup.send(
+                "❌ Unsupported file type. Upload a `.csv` or `.jsonl` file."
+            )
+            return
+
+        imported = 0
+
+        async def report(total: int) -> None:
+            nonlocal imported
+            imported = total
+            await interaction.edit_original_response(
+                content=f"⏳ Imported {total} issue(s) into '{project.name}'..."
+            )
+
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as raw:
+                await file.save(raw)
+                raw.seek(0)
+                with io.TextIOWrapper(raw, encoding="utf-8-sig", newline="") as fp:
+                    records = parse_issues(fp, fmt, str(interaction.user.id))
+                    await import_issues(project.id, records, progress=report)
+        except (ImportFormatError, UnicodeDecodeError) as e:
+            await interaction.followup.send(
+                f"❌ Import stopped after {imported} issue(s): {e}"
+            )
+            return
+        except Exception as e:
+            logging.error(f"Error importing issues: {e}")
+            await interaction.followup.send(
+                "❌ An unexpected error occurred while importing issues."
+            )
+            return
+
+        await interaction.followup.send(
+            f"✅ Imported {imported} issue(s) into '{project.name}'."
+        )
+
+    async def _bulk_selection(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        issues: Optional[str],
+        status: Optional[IssueStatus],
+        tag: Optional[str],
+    ) -> Optional[tuple[Project, dict[str, Any]]]:
+        """
+        Resolves the project and issue filters shared by the bulk commands,
+        replying with an error and returning None if they are invalid.
+        """
+        if issues is None and status is None and tag is None:
+            await interaction.followup.send(
+                "❌ Select issues by number, status or tag."
+            )
+            return None
+
+        numbers = None
+        if issues is not None:
+            try:
+                numbers = parse_issue_numbers(issues)
+            except ValueError as e:
+                await interaction.followup.send(f"❌ Invalid issue numbers: {e}.")
+                return None
+
+        project = await self.project_repo.find_by_name(
+            str(interaction.guild_id), project_name
+        )
+        if not project:
+            await interaction.followup.send(f"❌ Project '{project_name}' not found.")
+            return None
+
+        return project, {"numbers": numbers, "status": status, "tag_name": tag}
+
+    @issue_group.command(
+        name="bulk-status", description="Changes the status of many issues at once."
+    )
+    @app_commands.describe(
+        issues="Issue numbers and ranges, e.g. 1-5, 8",
+        status="Only change issues with this status",
+        tag="Only change issues with this tag",
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete, tag=tag_autocomplete)
+    async def bulk_status_issues(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        new_status: IssueStatus,
+        issues: Optional[str] = None,
+        status: Optional[IssueStatus] = None,
+        tag: Optional[str] = None,
+    ):
+        """Sets the status of every selected issue in one statement."""
+        await interaction.response.defer(ephemeral=True)
+        selection = await self._bulk_selection(
+            interaction, project_name, issues, status, tag
+        )
+        if selection is None:
+            return
+        project, filters = selection
+
+        changed = await self.issue_repo.bulk_set_status(
+            project.id, new_status, **filters
+        )
+        await interaction.followup.send(
+            f"✅ Changed the status of {changed} issue(s) to **{new_status.value}**."
+        )
+
+    @issue_group.command(
+        name="bulk-assign", description="Assigns a user to many issues at once."
+    )
+    @app_commands.describe(
+        issues="Issue numbers and ranges, e.g. 1-5, 8",
+        status="Only assign issues with this status",
+        tag="Only assign issues with this tag",
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete, tag=tag_autocomplete)
+    async def bulk_assign_issues(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        user: discord.User,
+        issues: Optional[str] = None,
+        status: Optional[IssueStatus] = None,
+        tag: Optional[str] = None,
+    ):
+        """Assigns a user to every selected issue in one statement."""
+        await interaction.response.defer(ephemeral=True)
+        selection = await self._bulk_selection(
+            interaction, project_name, issues, status, tag
+        )
+        if selection is None:
+            return
+        project, filters = selection
+
+        assigned = await self.issue_repo.bulk_assign(
+            project.id, str(user.id), **filters
+        )
+        await interaction.followup.send(
+            f"✅ Assigned {user.mention} to {assigned} more issue(s)."
+        )
+
+    @issue_group.command(name="bulk-tag", description="Tags many issues at once.")
+    @app_commands.describe(
+        new_tag="The tag to add",
+        issues="Issue numbers and ranges, e.g. 1-5, 8",
+        status="Only tag issues with this status",
+        tag="Only tag issues that already have this tag",
+    )
+    @app_commands.autocomplete(
+        project_name=project_autocomplete,
+        new_tag=tag_autocomplete,
+        tag=tag_autocomplete,
+    )
+    async def bulk_tag_issues(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        new_tag: str,
+        issues: Optional[str] = None,
+        status: Optional[IssueStatus] = None,
+        tag: Optional[str] = None,
+    ):
+        """Adds a tag to every selected issue in one statement."""
+        await interaction.response.defer(ephemeral=True)
+        selection = await self._bulk_selection(
+            interaction, project_name, issues, status, tag
+        )
+        if selection is None:
+            return
+        project, filters = selection
+
+        db_tag = await self.tag_repo.find_by_name(project.id, new_tag)
+        if not db_tag:
+            await interaction.followup.send(
+                f"❌ Tag '{new_tag}' not found in project '{project.name}'."
+            )
+            return
+
+        tagged = await self.issue_repo.bulk_tag(project.id, db_tag.id, **filters)
+        await interaction.followup.send(
+            f"✅ Tagged {tagged} more issue(s) with `{db_tag.name}`."
+        )
+
     @issue_group.command(name="assign", description="Assigns a user to an issue.")
     @app_commands.autocomplete(
         project_name=project_autocomplete, issue_id=issue_autocomplete
@@ -199,31 +654,27 @@ class IssueCog(commands.Cog):
     ):
         # ... (This command's logic is unchanged) ...
         await interaction.response.defer(ephemeral=True)
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
             return await interaction.followup.send(
                 f"❌ Project '{project_name}' not found."
             )
-        issue = self.issue_repo.find_by_project_issue_id(project.id, issue_id)
+        issue = await self.issue_repo.find_by_project_issue_id(project.id, issue_id)
         if not issue:
             return await interaction.followup.send(f"❌ Issue #{issue_id} not found.")
-        db_user = self.user_repo.get(str(user.id))
-        if not db_user:
-            db_user = self.user_repo.create(user_id=str(user.id))
-        if db_user in issue.assignees:
+        db_user = await self.user_repo.get_or_create(user_id=str(user.id))
+        assigned = await self.issue_repo.add_assignee(issue.id, db_user)
+        if assigned is None:
+            return await interaction.followup.send(
+                f"❌ Issue #{issue_id} not found in the database."
+            )
+        if not assigned:
             return await interaction.followup.send(
                 f"{user.mention} is already assigned to issue #{issue.project_issue_id}."
             )
-        with self.issue_repo.session_factory() as session:
-            with session.begin():
-                session_issue = session.get(self.issue_repo.model, issue.id)
-                if not session_issue:
-                    return await interaction.followup.send(
-                        f"❌ Issue #{issue_id} not found in the database."
-                    )
-                session_issue.assignees.append(db_user)
+        issue_embed_cache.invalidate(issue.id)
         await interaction.followup.send(
             f"✅ Assigned {user.mention} to issue #{issue.project_issue_id}."
         )
@@ -242,7 +693,7 @@ class IssueCog(commands.Cog):
         """Changes an issue's status using a hardcoded enum."""
         await interaction.response.defer(ephemeral=True)
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
@@ -250,7 +701,7 @@ class IssueCog(commands.Cog):
                 f"❌ Project '{project_name}' not found."
             )
 
-        issue = self.issue_repo.find_by_project_issue_id(project.id, issue_id)
+        issue = await self.issue_repo.find_by_project_issue_id(project.id, issue_id)
         if not issue:
             return await interaction.followup.send(f"❌ Issue #{issue_id} not found.")
 
@@ -264,7 +715,8 @@ class IssueCog(commands.Cog):
         elif new_status != IssueStatus.CLOSED and issue.closed_at:
             update_data["closed_at"] = None
 
-        self.issue_repo.update(pk=issue.id, **update_data)
+        await self.issue_repo.update(pk=issue.id, **update_data)
+        issue_embed_cache.invalidate(issue.id)
 
         await interaction.followup.send(
             f"✅ Issue #{issue.project_issue_id} status changed to **{new_status.value}**."
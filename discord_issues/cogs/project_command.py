@@ -1,24 +1,47 @@
 import logging
-from typing import Union
+import tempfile
+from typing import Literal, Union
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from discord_issues.cache.autocomplete_index import autocomplete_index
+from discord_issues.db.models import IssueStatus
 from discord_issues.repo.guild_repository import GuildRepository
 from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.purger import project_purger
 
 
 async def project_autocomplete(
     interaction: discord.Interaction, current: str
 ) -> list[app_commands.Choice[str]]:
     """Autocompletes the project name for the current guild."""
-    project_repo = ProjectRepository()
-    projects = project_repo.find_by_guild_id(str(interaction.guild_id))
+    guild_id = str(interaction.guild_id)
+    index = autocomplete_index.projects(guild_id)
+    if index is None:
+        projects = await ProjectRepository().find_by_guild_id(guild_id)
+        index = autocomplete_index.load_projects(
+            guild_id, [project.name for project in projects]
+        )
     return [
-        app_commands.Choice(name=project.name, value=str(project.name))
-        for project in projects
-        if current.lower() in project.name.lower()
-    ][:25]
+        app_commands.Choice(name=name, value=value)
+        for name, value in index.search(current)
+    ]
+
+
+STATUS_EMOJI = {
+    IssueStatus.OPEN: "🔴",
+    IssueStatus.IN_PROGRESS: "🟡",
+    IssueStatus.CLOSED: "🟢",
+}
+
+
+def format_issue_counts(counts: dict[IssueStatus, int]) -> str:
+    """Formats per-status issue counts as a single line."""
+    return " · ".join(
+        f"{STATUS_EMOJI[status]} {counts.get(status, 0)} {status.value.lower()}"
+        for status in IssueStatus
+    )
 
 
 class ConfirmDeleteView(discord.ui.View):
@@ -52,8 +75,16 @@ class ConfirmDeleteView(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         try:
-            success = self.project_repo.delete(pk=self.project_id)
+            # Hide the project now; its issues and tags are purged in chunks.
+            success = await self.project_repo.soft_delete(pk=self.project_id)
+            self.project_repo.invalidate_name(
+                str(interaction.guild_id), self.project_name
+            )
             if success:
+                project_purger.wake()
+                autocomplete_index.remove_project(
+                    str(interaction.guild_id), self.project_name, self.project_id
+                )
                 embed = discord.Embed(
                     title="🗑️ Project Deleted",
                     description=f"The project **{self.project_name}** and all its associated data have been permanently deleted.",
@@ -108,21 +139,21 @@ class ProjectCog(commands.Cog):
         guild_id_str = str(interaction.guild_id)
 
         # Ensure the guild exists in our database
-        guild = self.guild_repo.get(guild_id_str)
-        if not guild:
-            guild = self.guild_repo.create(guild_id=guild_id_str)
+        await self.guild_repo.get_or_create(guild_id=guild_id_str)
 
         # Check for duplicate project name in this guild
-        if self.project_repo.find_by_name(guild_id_str, name):
+        if await self.project_repo.find_by_name(guild_id_str, name):
             await interaction.followup.send(
                 f"❌ A project named '{name}' already exists in this server."
             )
             return
 
         try:
-            new_project = self.project_repo.create(
+            new_project = await self.project_repo.create(
                 name=name, description=description, guild_id=guild_id_str
             )
+            self.project_repo.invalidate_name(guild_id_str, name)
+            autocomplete_index.add_project(guild_id_str, name)
             embed = discord.Embed(
                 title="✅ Project Created",
                 description=f"Successfully created project **{new_project.name}**.",
@@ -141,7 +172,7 @@ class ProjectCog(commands.Cog):
     async def list_projects(self, interaction: discord.Interaction):
         """Handler for the /project list command."""
         await interaction.response.defer(ephemeral=True)
-        projects = self.project_repo.find_by_guild_id(str(interaction.guild_id))
+        projects = await self.project_repo.find_by_guild_id(str(interaction.guild_id))
 
         if not projects:
             await interaction.followup.send(
@@ -149,13 +180,64 @@ class ProjectCog(commands.Cog):
             )
             return
 
+        counts = await self.project_repo.issue_counts(p.id for p in projects)
         embed = discord.Embed(
             title="Projects in this Server", color=discord.Color.blue()
         )
         for project in projects:
             desc = project.description or "No description provided."
-            embed.add_field(name=f"📂 {project.name}", value=f"{desc}", inline=False)
+            embed.add_field(
+                name=f"📂 {project.name}",
+                value=f"{desc}\n{format_issue_counts(counts[project.id])}",
+                inline=False,
+            )
+
+        await interaction.followup.send(embed=embed)
 
+    @project_group.command(
+        name="stats", description="Shows issue counts per status for projects."
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete)
+    async def project_stats(
+        self, interaction: discord.Interaction, project_name: str | None = None
+    ):
+        """Handler for the /project stats command."""
+        await interaction.response.defer(ephemeral=True)
+        guild_id = str(interaction.guild_id)
+
+        if project_name:
+            project = await self.project_repo.find_by_name(guild_id, project_name)
+            if not project:
+                await interaction.followup.send(
+                    f"❌ Project '{project_name}' not found."
+                )
+                return
+            projects = [project]
+        else:
+            projects = await self.project_repo.find_by_guild_id(guild_id)
+            if not projects:
+                await interaction.followup.send("This server has no projects yet.")
+                return
+
+        counts = await self.project_repo.issue_counts(p.id for p in projects)
+        totals = {
+            status: sum(counts[p.id][status] for p in projects)
+            for status in IssueStatus
+        }
+        embed = discord.Embed(
+            title=f"📊 Issue Statistics for {project_name}"
+            if project_name
+            else "📊 Issue Statistics",
+            description=f"**Total:** {format_issue_counts(totals)}",
+            color=discord.Color.blue(),
+        )
+        if not project_name:
+            for project in projects[:25]:  # Discord's embed field limit.
+                embed.add_field(
+                    name=f"📂 {project.name}",
+                    value=format_issue_counts(counts[project.id]),
+                    inline=False,
+                )
         await interaction.followup.send(embed=embed)
 
     @project_group.command(
@@ -178,7 +260,7 @@ class ProjectCog(commands.Cog):
             )
             return
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
@@ -188,7 +270,9 @@ class ProjectCog(commands.Cog):
         update_data = {}
         if new_name:
             # Check for name collision
-            if self.project_repo.find_by_name(str(interaction.guild_id), new_name):
+            if await self.project_repo.find_by_name(
+                str(interaction.guild_id), new_name
+            ):
                 await interaction.followup.send(
                     f"❌ A project named '{new_name}' already exists."
                 )
@@ -198,7 +282,12 @@ class ProjectCog(commands.Cog):
             update_data["description"] = new_description
 
         try:
-            self.project_repo.update(pk=project.id, **update_data)
+            await self.project_repo.update(pk=project.id, **update_data)
+            self.project_repo.invalidate_name(str(interaction.guild_id), project_name)
+            if new_name:
+                autocomplete_index.rename_project(
+                    str(interaction.guild_id), project_name, new_name
+                )
             embed = discord.Embed(
                 title="✅ Project Updated",
                 description=f"Successfully updated project **{project_name}**.",
@@ -211,13 +300,60 @@ class ProjectCog(commands.Cog):
                 "❌ An unexpected error occurred while updating the project."
             )
 
+    @project_group.command(
+        name="export", description="Exports all issues of a project to a file."
+    )
+    @app_commands.autocomplete(project_name=project_autocomplete)
+    async def export_project(
+        self,
+        interaction: discord.Interaction,
+        project_name: str,
+        format: Literal["jsonl", "csv"] = "jsonl",
+    ):
+        """Handler for the /project export command."""
+        # Exports are rare, so their machinery is loaded on first use rather
+        # than at startup.
+        from discord_issues.transfer.project_export import export_issues
+
+        await interaction.response.defer(ephemeral=True)
+
+        project = await self.project_repo.find_by_name(
+            str(interaction.guild_id), project_name
+        )
+        if not project:
+            await interaction.followup.send(f"❌ Project '{project_name}' not found.")
+            return
+
+        try:
+            # Spills to disk past 8 MiB, so large exports do not grow memory.
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as fp:
+                count = await export_issues(project.id, fp, format)
+                size = fp.tell()
+                limit = interaction.guild.filesize_limit if interaction.guild else 0
+                if limit and size > limit:
+                    await interaction.followup.send(
+                        f"❌ The export is {size // 1024} KiB, which is over this "
+                        "server's upload limit. Use the offline CLI instead."
+                    )
+                    return
+                fp.seek(0)
+                await interaction.followup.send(
+                    f"✅ Exported {count} issue(s) from '{project.name}'.",
+                    file=discord.File(fp, filename=f"{project.name}.{format}.gz"),
+                )
+        except Exception as e:
+            logging.error(f"Error exporting project: {e}")
+            await interaction.followup.send(
+                "❌ An unexpected error occurred while exporting the project."
+            )
+
     @project_group.command(
         name="delete", description="Deletes a project and all of its data."
     )
     @app_commands.autocomplete(project_name=project_autocomplete)
     async def delete_project(self, interaction: discord.Interaction, project_name: str):
         """Handler for the /project delete command."""
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
@@ -2,6 +2,8 @@ import discord
 import logging
 from discord import app_commands
 from discord.ext import commands
+from ..cache.autocomplete_index import autocomplete_index
+from ..cache.embed_cache import issue_embed_cache
 from ..repo.project_repository import ProjectRepository
 from ..repo.tag_repository import TagRepository
 from .project_command import project_autocomplete
@@ -15,22 +17,20 @@ async def tag_autocomplete(
     if not project_name:
         return []
 
-    project_repo = ProjectRepository()
-    tag_repo = TagRepository()
-
-    project = project_repo.find_by_name(str(interaction.guild_id), project_name)
+    project = await ProjectRepository().find_by_name(
+        str(interaction.guild_id), project_name
+    )
     if not project:
         return []
 
-    tags = tag_repo.find_by_project_id(project.id)
+    index = autocomplete_index.tags(project.id)
+    if index is None:
+        tags = await TagRepository().find_by_project_id(project.id)
+        index = autocomplete_index.load_tags(project.id, [tag.name for tag in tags])
     return [
-        app_commands.Choice(
-            name=tag.name,
-            value=str(tag.name),
-        )
-        for tag in tags
-        if current.lower() in tag.name.lower()
-    ][:25]
+        app_commands.Choice(name=name, value=value)
+        for name, value in index.search(current)
+    ]
 
 
 class TagCog(commands.Cog):
@@ -48,14 +48,14 @@ class TagCog(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
             await interaction.followup.send(f"❌ Project '{project_name}' not found.")
             return
 
-        existing_tag = self.tag_repo.find_by_name(project.id, tag_name)
+        existing_tag = await self.tag_repo.find_by_name(project.id, tag_name)
         if existing_tag:
             await interaction.followup.send(
                 f"❌ A tag named '{tag_name}' already exists in project '{project_name}'."
@@ -63,7 +63,8 @@ class TagCog(commands.Cog):
             return
 
         try:
-            new_tag = self.tag_repo.create(name=tag_name, project_id=project.id)
+            new_tag = await self.tag_repo.create(name=tag_name, project_id=project.id)
+            autocomplete_index.add_tag(project.id, new_tag.name)
             logging.info(
                 f"Created new tag '{new_tag.name}' for project '{project.name}' in guild {interaction.guild_id}"
             )
@@ -88,14 +89,14 @@ class TagCog(commands.Cog):
         """Handler for the /tag list command."""
         await interaction.response.defer(ephemeral=True)
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
             await interaction.followup.send(f"❌ Project '{project_name}' not found.")
             return
 
-        tags = self.tag_repo.find_by_project_id(project.id)
+        tags = await self.tag_repo.find_by_project_id(project.id)
 
         if not tags:
             embed = discord.Embed(
@@ -113,7 +114,8 @@ class TagCog(commands.Cog):
 
         await interaction.followup.send(embed=embed)
 
-    @tag_group.command(name="delete", description="Deletes a tag from a project.")
+    @tag_group.command(name="delete", description="Deletes tags from a project.")
+    @app_commands.describe(tag_name="A tag, or several separated by commas")
     @app_commands.autocomplete(
         project_name=project_autocomplete, tag_name=tag_autocomplete
     )
@@ -123,39 +125,51 @@ class TagCog(commands.Cog):
         """Handler for the /tag delete command."""
         await interaction.response.defer(ephemeral=True)
 
-        project = self.project_repo.find_by_name(
+        project = await self.project_repo.find_by_name(
             str(interaction.guild_id), project_name
         )
         if not project:
             await interaction.followup.send(f"❌ Project '{project_name}' not found.")
             return
 
-        tag_to_delete = self.tag_repo.find_by_name(project.id, tag_name)
-        if not tag_to_delete:
+        names = list(dict.fromkeys(n.strip() for n in tag_name.split(",") if n.strip()))
+        try:
+            deleted = await self.tag_repo.delete_by_names(project.id, names)
+        except Exception as e:
+            logging.error(f"Error deleting tag: {e}")
             await interaction.followup.send(
-                f"❌ Tag '{tag_name}' not found in project '{project_name}'."
+                "❌ An unexpected error occurred while deleting the tag."
             )
             return
 
-        try:
-            success = self.tag_repo.delete(pk=tag_to_delete.id)
-            if success:
-                logging.info(
-                    f"Deleted tag '{tag_name}' from project '{project.name}' in guild {interaction.guild_id}"
-                )
-                embed = discord.Embed(
-                    title="🗑️ Tag Deleted",
-                    description=f"Successfully deleted tag **{tag_name}** from project **{project.name}**.",
-                    color=discord.Color.orange(),
-                )
-                await interaction.followup.send(embed=embed)
-            else:
-                await interaction.followup.send("❌ Failed to delete the tag.")
-        except Exception as e:
-            logging.error(f"Error deleting tag: {e}")
+        if not deleted:
             await interaction.followup.send(
-                "❌ An unexpected error occurred. This tag might be in use by an issue."
+                f"❌ Tag '{tag_name}' not found in project '{project_name}'."
             )
+            return
+
+        for name in deleted:
+            autocomplete_index.remove_tag(project.id, name)
+        # Rendered issue views list their tags.
+        issue_embed_cache.clear()
+        logging.info(
+            f"Deleted tag(s) {deleted} from project '{project.name}' in guild {interaction.guild_id}"
+        )
+
+        deleted_str = ", ".join(f"**{name}**" for name in deleted)
+        description = (
+            f"Successfully deleted tag{'s' if len(deleted) > 1 else ''} "
+            f"{deleted_str} from project **{project.name}**."
+        )
+        missing = [name for name in names if name not in deleted]
+        if missing:
+            description += "\nNot found: " + ", ".join(f"`{n}`" for n in missing)
+        embed = discord.Embed(
+            title="🗑️ Tag Deleted",
+            description=description,
+            color=discord.Color.orange(),
+        )
+        await interaction.followup.send(embed=embed)
 
 
 async def setup(bot: commands.Bot):
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+# Where the hash of the last synced command tree is kept, per scope. Like the
+# database, it lives in the bot's working directory.
+SYNC_STATE_PATH = Path("command_sync.json")
+
+
+def tree_hash(
+    tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None
+) -> str:
+    """Hashes the payload ``tree.sync(guild=guild)`` would upload."""
+    payload = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+    payload.sort(key=lambda command: (command.get("type", 1), command["name"]))
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _load_state(path: Path) -> dict[str, str]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+async def sync_if_changed(
+    tree: app_commands.CommandTree,
+    guild: Optional[discord.abc.Snowflake] = None,
+    *,
+    force: bool = False,
+    state_path: Optional[Path] = None,
+) -> Optional[list[app_commands.AppCommand]]:
+    """
+    Syncs the command tree to Discord only if it changed since the last sync.
+
+    Syncing is a slow and heavily rate-limited REST call, so the hash of the
+    last synced tree is persisted and compared on every boot instead.
+
+    Args:
+        tree: The command tree to sync.
+        guild: The guild to sync, or None for the global commands.
+        force: Sync even if the hash is unchanged.
+        state_path: Where hashes are persisted; defaults to SYNC_STATE_PATH.
+
+    Returns:
+        The synced commands, or None if syncing was skipped.
+    """
+    state_path = state_path or SYNC_STATE_PATH
+    scope = str(guild.id) if guild else "global"
+    digest = tree_hash(tree, guild)
+    state = _load_state(state_path)
+    if not force and state.get(scope) == digest:
+        logging.info(f"Command tree for {scope} is unchanged; skipping sync.")
+        return None
+
+    synced = await tree.sync(guild=guild)
+    state[scope] = digest
+    try:
+        state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    except OSError as e:
+        # Not fatal: the next boot simply syncs again.
+        logging.warning(f"Could not persist command tree hash: {e}")
+    return synced
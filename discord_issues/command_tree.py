@@ -0,0 +1,129 @@
+import functools
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from .db.instrumentation import QueryScope, current_scope, query_stats
+from .metrics.interaction_metrics import interaction_metrics
+
+_NESTED_OPTION_TYPES = (
+    discord.AppCommandOptionType.subcommand.value,
+    discord.AppCommandOptionType.subcommand_group.value,
+)
+
+
+def command_name(interaction: discord.Interaction) -> str:
+    """
+    Names the command an interaction invokes, e.g. "/issue view".
+
+    Autocomplete requests are named after the option being completed, e.g.
+    "/issue view [autocomplete project_name]".
+    """
+    data = interaction.data or {}
+    parts = [data.get("name", "?")]
+    options = data.get("options", [])
+    while options and options[0].get("type") in _NESTED_OPTION_TYPES:
+        parts.append(options[0]["name"])
+        options = options[0].get("options", [])
+
+    name = "/" + " ".join(parts)
+    if interaction.type is discord.InteractionType.autocomplete:
+        focused = next((o["name"] for o in options if o.get("focused")), "?")
+        name += f" [autocomplete {focused}]"
+    return name
+
+
+_DEFERRED_TYPES = (
+    discord.InteractionResponseType.deferred_channel_message,
+    discord.InteractionResponseType.deferred_message_update,
+)
+
+
+class TimedInteractionResponse(discord.InteractionResponse):
+    """An interaction response that notes when it was first sent."""
+
+    __slots__ = ("received_at", "acknowledged_at")
+
+    def __init__(self, parent: discord.Interaction):
+        super().__init__(parent)
+        self.received_at = time.monotonic()
+        self.acknowledged_at: Optional[float] = None
+
+    @property
+    def acknowledged_after(self) -> Optional[float]:
+        """Seconds from receipt until the first response, or None if unanswered."""
+        if self.acknowledged_at is None:
+            return None
+        return self.acknowledged_at - self.received_at
+
+
+def _timed(name: str):
+    method = getattr(discord.InteractionResponse, name)
+
+    @functools.wraps(method)
+    async def wrapper(self: TimedInteractionResponse, *args, **kwargs):
+        result = await method(self, *args, **kwargs)
+        if self.acknowledged_at is None:
+            self.acknowledged_at = time.monotonic()
+        return result
+
+    return wrapper
+
+
+# Every way of answering an interaction for the first time.
+for _name in (
+    "defer",
+    "send_message",
+    "edit_message",
+    "send_modal",
+    "autocomplete",
+    "launch_activity",
+    "pong",
+):
+    setattr(TimedInteractionResponse, _name, _timed(_name))
+
+
+class InstrumentedCommandTree(app_commands.CommandTree):
+    """
+    A command tree that measures every interaction it dispatches.
+
+    Each interaction runs in a fresh QueryScope; when it finishes, the query
+    count, rows and time spent in the database are added to ``query_stats``,
+    and its latency, acknowledgement time and outcome to
+    ``interaction_metrics``, under the command's name.
+
+    discord.py has no public hook around the whole dispatch, nor one that sees
+    when an interaction was first answered, so this overrides the private
+    ``_call`` and pre-fills the private ``_cs_response`` slot. discord.py is
+    pinned below the next minor release, and ``tests/metrics_test.py`` fails
+    if either changes shape.
+    """
+
+    async def _call(self, interaction: discord.Interaction) -> None:
+        # Pre-fill the cached response, as the base class does for the command.
+        response = TimedInteractionResponse(interaction)
+        interaction._cs_response = response
+        name = command_name(interaction)
+        scope = QueryScope(name)
+        token = current_scope.set(scope)
+        failed = True
+        try:
+            await super()._call(interaction)
+            # Autocomplete errors are logged and swallowed by the base class,
+            # leaving the interaction unanswered.
+            failed = interaction.command_failed or (
+                interaction.type is discord.InteractionType.autocomplete
+                and not response.is_done()
+            )
+        finally:
+            current_scope.reset(token)
+            query_stats.record_command(scope)
+            interaction_metrics.record(
+                name,
+                duration=time.monotonic() - response.received_at,
+                acknowledged_after=response.acknowledged_after,
+                deferred=response.type in _DEFERRED_TYPES,
+                failed=failed,
+            )
@@ -0,0 +1,176 @@
+import re
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# How many recent samples each histogram keeps.
+HISTOGRAM_WINDOW = 512
+
+# Distinct statements tracked before the rest are pooled under OTHER_STATEMENT,
+# so ad hoc SQL cannot grow the table without bound.
+MAX_STATEMENTS = 1000
+OTHER_STATEMENT = "<other>"
+
+# `IN (?, ?, ?)` renders differently for every list length; fold them together.
+_PLACEHOLDER_RUN = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+class RollingHistogram:
+    """Keeps the most recent ``window`` samples and reports their percentiles."""
+
+    def __init__(self, window: int = HISTOGRAM_WINDOW):
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+
+    def percentile(self, q: float) -> float:
+        """Returns the ``q``-th percentile (0-100) of the window, or 0 if empty."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(q / 100 * len(ordered)))
+        return ordered[index]
+
+
+class StatementStats:
+    """Totals for one SQL statement across every execution."""
+
+    def __init__(self):
+        self.count = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.latency = RollingHistogram()
+
+    def record(self, seconds: float, rows: int) -> None:
+        self.count += 1
+        self.rows += rows
+        self.seconds += seconds
+        self.latency.add(seconds)
+
+
+class CommandStats:
+    """Totals for one slash command or autocomplete across its invocations."""
+
+    def __init__(self):
+        self.invocations = 0
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+        self.max_queries = 0
+        self.queries_per_invocation = RollingHistogram()
+        self.latency = RollingHistogram()
+
+    def record(self, scope: "QueryScope") -> None:
+        self.invocations += 1
+        self.queries += scope.queries
+        self.rows += scope.rows
+        self.seconds += scope.seconds
+        self.max_queries = max(self.max_queries, scope.queries)
+        self.queries_per_invocation.add(scope.queries)
+        self.latency.add(scope.seconds)
+
+
+class QueryScope:
+    """The queries issued by one command invocation so far."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+
+# The invocation queries are attributed to. Set by the command tree for every
+# interaction and carried into the write queue alongside each operation.
+current_scope: ContextVar[Optional[QueryScope]] = ContextVar(
+    "current_scope", default=None
+)
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapses whitespace and placeholder lists so equal queries share a key."""
+    return _PLACEHOLDER_RUN.sub("?, ...", " ".join(statement.split()))
+
+
+class QueryStats:
+    """Aggregates query counts, rows changed and latency per statement and command."""
+
+    def __init__(self):
+        self.statements: dict[str, StatementStats] = {}
+        self.commands: dict[str, CommandStats] = {}
+
+    def record_query(self, statement: str, seconds: float, rows: int) -> None:
+        """Records one executed statement against it and the current scope."""
+        key = normalize_statement(statement)
+        stats = self.statements.get(key)
+        if stats is None:
+            if len(self.statements) >= MAX_STATEMENTS:
+                key = OTHER_STATEMENT
+            stats = self.statements.setdefault(key, StatementStats())
+        stats.record(seconds, rows)
+
+        scope = current_scope.get()
+        if scope is not None:
+            scope.queries += 1
+            scope.rows += rows
+            scope.seconds += seconds
+
+    def record_command(self, scope: QueryScope) -> None:
+        """Records a finished invocation's totals under its command name."""
+        self.commands.setdefault(scope.name, CommandStats()).record(scope)
+
+    def top_statements(self, n: int = 10) -> list[tuple[str, StatementStats]]:
+        """Returns the ``n`` statements with the most total time spent in them."""
+        ranked = sorted(
+            self.statements.items(), key=lambda item: item[1].seconds, reverse=True
+        )
+        return ranked[:n]
+
+    def chatty_commands(self, max_queries: int) -> list[tuple[str, CommandStats]]:
+        """Returns the commands that issued more than ``max_queries`` in one call."""
+        chatty = [
+            (name, stats)
+            for name, stats in self.commands.items()
+            if stats.max_queries > max_queries
+        ]
+        return sorted(chatty, key=lambda item: item[1].max_queries, reverse=True)
+
+    def clear(self) -> None:
+        self.statements.clear()
+        self.commands.clear()
+
+
+query_stats = QueryStats()
+
+
+def _row_count(cursor) -> int:
+    # SQLite only reports a row count for INSERT, UPDATE and DELETE; it is -1
+    # for SELECTs, which are counted as changing no rows.
+    return max(cursor.rowcount, 0)
+
+
+def instrument(engine: AsyncEngine, stats: Optional[QueryStats] = None) -> None:
+    """
+    Records every statement an engine executes in ``stats``.
+
+    Args:
+        engine: The engine to instrument.
+        stats: Where to record; defaults to the process-wide ``query_stats``.
+    """
+    stats = stats or query_stats
+
+    # The start time lives on the execution context rather than the connection,
+    # since a failed statement never reaches after_cursor_execute.
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        stats.record_query(statement, elapsed, _row_count(cursor))
@@ -3,15 +3,19 @@ import enum
 from typing import List, Optional
 
 from sqlalchemy import (
+    DDL,
     Column,
     Enum as SQLAlchemyEnum,
     ForeignKey,
+    Index,
     Integer,
     MetaData,
     String,
     Table,
     Text,
     DateTime,
+    event,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -33,15 +37,33 @@ class Base(DeclarativeBase):
 issue_tags = Table(
     "issue_tags",
     Base.metadata,
-    Column("issue_id", Integer, ForeignKey("issues.id"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
+    Column(
+        "issue_id",
+        Integer,
+        ForeignKey("issues.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "tag_id",
+        Integer,
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
 )
 
 issue_assignees = Table(
     "issue_assignees",
     Base.metadata,
-    Column("issue_id", Integer, ForeignKey("issues.id"), primary_key=True),
-    Column("user_id", Integer, ForeignKey("users.user_id"), primary_key=True),
+    Column(
+        "issue_id",
+        Integer,
+        ForeignKey("issues.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "user_id", String, ForeignKey("users.user_id"), primary_key=True, index=True
+    ),
 )
 
 
@@ -73,34 +95,71 @@ class User(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # Only live projects reserve their name; deleted ones await the purge.
+        Index(
+            "ix_projects_guild_id_name",
+            "guild_id",
+            "name",
+            unique=True,
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_projects_deleted_at",
+            "deleted_at",
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(100))
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # The highest project_issue_id handed out so far, bumped atomically per issue.
+    last_project_issue_id: Mapped[int] = mapped_column(
+        default=0, server_default=text("0")
+    )
+    # Set when the project is deleted; its rows are then purged in the background.
+    deleted_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     guild_id: Mapped[str] = mapped_column(ForeignKey("guilds.guild_id"))
     guild: Mapped["Guild"] = relationship(back_populates="projects")
 
+    # Children are removed by ON DELETE CASCADE rather than loaded and deleted.
     issues: Mapped[List["Issue"]] = relationship(
-        back_populates="project", cascade="all, delete-orphan"
+        back_populates="project", cascade="all, delete-orphan", passive_deletes=True
     )
     tags: Mapped[List["Tag"]] = relationship(
-        back_populates="project", cascade="all, delete-orphan"
+        back_populates="project", cascade="all, delete-orphan", passive_deletes=True
     )
 
 
 class Tag(Base):
     __tablename__ = "tags"
+    __table_args__ = (
+        Index("ix_tags_project_id_name", "project_id", "name", unique=True),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(50))
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE")
+    )
     project: Mapped["Project"] = relationship(back_populates="tags")
     issues: Mapped[List["Issue"]] = relationship(
-        secondary=issue_tags, back_populates="tags"
+        secondary=issue_tags, back_populates="tags", passive_deletes=True
     )
 
 
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index(
+            "ix_issues_project_id_project_issue_id",
+            "project_id",
+            "project_issue_id",
+            unique=True,
+        ),
+    )
     id: Mapped[int] = mapped_column(primary_key=True)
     project_issue_id: Mapped[int] = mapped_column()
     title: Mapped[str] = mapped_column(String(255))
@@ -113,7 +172,9 @@ class Issue(Base):
     )
 
     creator_id: Mapped[str] = mapped_column(ForeignKey("users.user_id"))
-    project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE")
+    )
 
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
@@ -134,8 +195,103 @@ class Issue(Base):
         foreign_keys=[creator_id], back_populates="created_issues"
     )
     assignees: Mapped[List["User"]] = relationship(
-        secondary=issue_assignees, back_populates="assigned_issues"
+        secondary=issue_assignees,
+        back_populates="assigned_issues",
+        passive_deletes=True,
     )
     tags: Mapped[List["Tag"]] = relationship(
-        secondary=issue_tags, back_populates="issues"
+        secondary=issue_tags, back_populates="issues", passive_deletes=True
+    )
+
+
+class ProjectIssueCount(Base):
+    """
+    How many issues a project has in each status, so per-project statistics
+    never need to aggregate over issues. Maintained by the ISSUE_COUNT_DDL
+    triggers in the same transaction as every change to issues.
+    """
+
+    __tablename__ = "project_issue_counts"
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[IssueStatus] = mapped_column(
+        SQLAlchemyEnum(IssueStatus, name="issue_status_enum"), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+
+
+# --- Full-text search ---
+# issues_fts is an external-content FTS5 index over issues.title/description.
+# The triggers keep it in sync; the same DDL is applied by migration 7c1f0a9d3e25.
+ISSUE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE issues_fts USING fts5(
+        title,
+        description,
+        content='issues',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
     )
+    """,
+    """
+    CREATE TRIGGER issues_fts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO issues_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_ad AFTER DELETE ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN
+        INSERT INTO issues_fts(issues_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO issues_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+for _statement in ISSUE_FTS_DDL:
+    event.listen(Issue.__table__, "after_create", DDL(_statement))
+event.listen(Issue.__table__, "before_drop", DDL("DROP TABLE IF EXISTS issues_fts"))
+
+
+# --- Issue counters ---
+# Triggers keep project_issue_counts in step with issues, whichever code path
+# (or ON DELETE CASCADE) changes them; the same DDL is applied by migration
+# 3f8e61b2c4a7. Rebuilding the issues table (e.g. in a batch migration) drops
+# these and the FTS triggers, so such migrations must recreate them.
+ISSUE_COUNT_DDL = [
+    """
+    CREATE TRIGGER issue_counts_ai AFTER INSERT ON issues BEGIN
+        INSERT INTO project_issue_counts(project_id, status, count)
+        VALUES (new.project_id, new.status, 1)
+        ON CONFLICT(project_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER issue_counts_ad AFTER DELETE ON issues BEGIN
+        UPDATE project_issue_counts SET count = count - 1
+        WHERE project_id = old.project_id AND status = old.status;
+    END
+    """,
+    """
+    CREATE TRIGGER issue_counts_au AFTER UPDATE OF status, project_id ON issues
+    WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id
+    BEGIN
+        UPDATE project_issue_counts SET count = count - 1
+        WHERE project_id = old.project_id AND status = old.status;
+        INSERT INTO project_issue_counts(project_id, status, count)
+        VALUES (new.project_id, new.status, 1)
+        ON CONFLICT(project_id, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+]
+
+for _statement in ISSUE_COUNT_DDL:
+    event.listen(Issue.__table__, "after_create", DDL(_statement))
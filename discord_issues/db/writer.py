@@ -0,0 +1,164 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .instrumentation import QueryScope, current_scope
+
+T = TypeVar("T")
+
+WriteOperation = Callable[[AsyncSession], Awaitable[T]]
+
+
+def _in_scope(operation: WriteOperation[T], scope: QueryScope) -> WriteOperation[T]:
+    """Attributes an operation's queries to the scope it was submitted from."""
+
+    async def scoped(session: AsyncSession) -> T:
+        token = current_scope.set(scope)
+        try:
+            return await operation(session)
+        finally:
+            current_scope.reset(token)
+
+    return scoped
+
+
+class WriteQueue:
+    """
+    Funnels every mutation through a single writer task.
+
+    Callers submit an operation (a coroutine function taking a session) and
+    await its result. The writer drains the queue and runs whatever has
+    accumulated, up to ``max_batch_size`` operations or ``max_latency``
+    seconds after the first one arrived, inside one transaction with a single
+    commit. When a batch holds several operations, each runs in its own
+    SAVEPOINT, so a failing operation is rolled back and reported to its
+    caller without affecting the others.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int = 64,
+        max_latency: float = 0.002,
+    ):
+        """
+        Initializes the queue. The writer task starts on the first submission.
+
+        Args:
+            session_factory: Creates the sessions batches are committed in.
+            max_batch_size: The most operations committed in one transaction.
+            max_latency: How long, in seconds, to wait for more operations
+                after the first one of a batch arrives.
+        """
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.batches = 0
+        self.operations = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, operation: WriteOperation[T]) -> T:
+        """
+        Queues an operation and waits until its batch has been committed.
+
+        Returns:
+            Whatever the operation returned.
+
+        Raises:
+            Whatever the operation raised, or the error that failed the commit.
+        """
+        self._ensure_started()
+        # The writer task has its own context, so carry the caller's scope.
+        scope = current_scope.get()
+        if scope is not None:
+            operation = _in_scope(operation, scope)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((operation, future))
+        return await future
+
+    async def close(self) -> None:
+        """Commits everything already queued, then stops the writer task."""
+        if self._task is None or self._task.done():
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name="db-writer")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                # Take whatever is already waiting without sleeping at all.
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._commit(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _commit(self, batch: list[tuple[WriteOperation[Any], asyncio.Future]]):
+        outcomes: list[tuple[asyncio.Future, Any, Optional[BaseException]]] = []
+        failed_operation: Optional[BaseException] = None
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    for operation, future in batch:
+                        if len(batch) == 1:
+                            # Nothing to protect, so skip the savepoint and let
+                            # a failure roll back the whole transaction.
+                            try:
+                                result = await operation(session)
+                            except Exception as e:
+                                failed_operation = e
+                                raise
+                            outcomes.append((future, result, None))
+                            continue
+                        try:
+                            async with session.begin_nested():
+                                result = await operation(session)
+                            outcomes.append((future, result, None))
+                        except Exception as e:
+                            outcomes.append((future, None, e))
+        except Exception as e:
+            # An operation's own error is its caller's to handle, as it is when
+            # a savepoint rolls back; only failures of the batch are logged.
+            if e is not failed_operation:
+                logging.error(f"Write batch of {len(batch)} operation(s) failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.operations += len(batch)
+        for future, result, error in outcomes:
+            if future.done():  # The caller gave up waiting.
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
@@ -0,0 +1,185 @@
+import logging
+import math
+from typing import Optional
+
+from aiohttp import web
+from discord.ext import commands
+
+from ..db.instrumentation import QueryStats, query_stats
+from .interaction_metrics import Histogram, InteractionMetrics, interaction_metrics
+from .loop_monitor import LoopLagMonitor, loop_monitor
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _header(lines: list[str], name: str, kind: str, help: str) -> None:
+    lines.append(f"# HELP {name} {help}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _histogram_series(
+    lines: list[str], name: str, histogram: Histogram, **labels: str
+) -> None:
+    for bound, count in histogram.cumulative():
+        lines.append(f"{name}_bucket{_labels(**labels, le=str(bound))} {count}")
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+
+def _histogram(
+    lines: list[str], name: str, help: str, histograms: dict[str, Histogram]
+) -> None:
+    _header(lines, name, "histogram", help)
+    for command, histogram in sorted(histograms.items()):
+        _histogram_series(lines, name, histogram, command=command)
+
+
+def _counter(lines: list[str], name: str, help: str, values: dict[str, float]) -> None:
+    _header(lines, name, "counter", help)
+    for command, value in sorted(values.items()):
+        lines.append(f"{name}{_labels(command=command)} {value}")
+
+
+def render_metrics(
+    latency: Optional[float] = None,
+    metrics: Optional[InteractionMetrics] = None,
+    stats: Optional[QueryStats] = None,
+    monitor: Optional[LoopLagMonitor] = None,
+) -> str:
+    """
+    Renders every metric in the Prometheus text exposition format.
+
+    Args:
+        latency: The gateway heartbeat latency in seconds, if known.
+        metrics: Interaction metrics; defaults to ``interaction_metrics``.
+        stats: Query statistics; defaults to ``query_stats``.
+        monitor: Event loop lag; defaults to ``loop_monitor``.
+
+    Returns:
+        The exposition text.
+    """
+    metrics = metrics or interaction_metrics
+    stats = stats or query_stats
+    monitor = monitor or loop_monitor
+    lines: list[str] = []
+
+    _histogram(
+        lines,
+        "discord_interaction_duration_seconds",
+        "Time from receiving an interaction until its handler returned.",
+        metrics.duration,
+    )
+    _histogram(
+        lines,
+        "discord_interaction_ack_seconds",
+        "Time from receiving an interaction until its first response.",
+        metrics.ack,
+    )
+    _histogram(
+        lines,
+        "discord_interaction_followup_seconds",
+        "Time from deferring an interaction until its handler returned.",
+        metrics.followup,
+    )
+    _counter(
+        lines,
+        "discord_interaction_errors_total",
+        "Interactions whose handler failed.",
+        metrics.errors,
+    )
+    _counter(
+        lines,
+        "discord_interaction_missed_deadline_total",
+        "Interactions acknowledged after the 3 second deadline, or never.",
+        metrics.missed_deadline,
+    )
+    _counter(
+        lines,
+        "discord_command_db_queries_total",
+        "Database queries issued by each command.",
+        {name: c.queries for name, c in stats.commands.items()},
+    )
+    _counter(
+        lines,
+        "discord_command_db_seconds_total",
+        "Time each command spent waiting on database queries.",
+        {name: c.seconds for name, c in stats.commands.items()},
+    )
+
+    _header(
+        lines,
+        "discord_event_loop_lag_seconds",
+        "histogram",
+        "How late the event loop ran a timer, sampled continuously.",
+    )
+    _histogram_series(lines, "discord_event_loop_lag_seconds", monitor.lag)
+    _counter(
+        lines,
+        "discord_event_loop_stalls_total",
+        "Stalls over the lag threshold, by the command that was running.",
+        monitor.stalls,
+    )
+    _counter(
+        lines,
+        "discord_event_loop_stalled_seconds_total",
+        "Time the event loop spent stalled, by the command that was running.",
+        monitor.stalled_seconds,
+    )
+
+    if latency is not None and math.isfinite(latency):
+        _header(
+            lines,
+            "discord_gateway_latency_seconds",
+            "gauge",
+            "Latency between a gateway heartbeat and its acknowledgement.",
+        )
+        lines.append(f"discord_gateway_latency_seconds {latency}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves ``render_metrics`` at /metrics from inside the bot's event loop."""
+
+    def __init__(self, bot: commands.Bot, host: str, port: int):
+        """
+        Initializes the server. Nothing is bound until ``start``.
+
+        Args:
+            bot: The bot whose gateway latency is reported.
+            host: The interface to listen on; keep it local.
+            port: The TCP port to listen on.
+        """
+        self.bot = bot
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logging.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = render_metrics(self.bot.latency)
+        return web.Response(body=body.encode(), headers={"Content-Type": CONTENT_TYPE})
@@ -0,0 +1,90 @@
+from bisect import bisect_left
+from typing import Optional
+
+# Upper bounds, in seconds, of the latency histogram buckets. They are dense
+# around Discord's 3 second acknowledgement deadline.
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 2.5, 3.0, 5.0, 10.0)
+
+# Interactions not acknowledged within this many seconds fail on Discord's side.
+ACK_DEADLINE = 3.0
+
+
+class Histogram:
+    """A fixed-bucket histogram in the shape Prometheus expects."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Returns (upper bound, observations at or below it) for every bucket."""
+        total, result = 0, []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class InteractionMetrics:
+    """Latency and error counts of interactions, per command."""
+
+    def __init__(self):
+        # Receipt until the handler returned.
+        self.duration: dict[str, Histogram] = {}
+        # Receipt until the first response (a reply, deferral or choices).
+        self.ack: dict[str, Histogram] = {}
+        # Deferral until the handler returned, i.e. time spent on followups.
+        self.followup: dict[str, Histogram] = {}
+        self.errors: dict[str, int] = {}
+        # Acknowledged after ACK_DEADLINE, or never.
+        self.missed_deadline: dict[str, int] = {}
+
+    def record(
+        self,
+        command: str,
+        duration: float,
+        acknowledged_after: Optional[float],
+        deferred: bool,
+        failed: bool,
+    ) -> None:
+        """
+        Records one finished interaction.
+
+        Args:
+            command: The command name, as returned by ``command_name``.
+            duration: Seconds from receipt until the handler returned.
+            acknowledged_after: Seconds from receipt until the first response,
+                or None if the interaction was never responded to.
+            deferred: Whether the first response was a deferral.
+            failed: Whether the handler raised or the command failed.
+        """
+        self.duration.setdefault(command, Histogram()).observe(duration)
+        if acknowledged_after is not None:
+            self.ack.setdefault(command, Histogram()).observe(acknowledged_after)
+            if deferred:
+                self.followup.setdefault(command, Histogram()).observe(
+                    duration - acknowledged_after
+                )
+        if acknowledged_after is None or acknowledged_after > ACK_DEADLINE:
+            self.missed_deadline[command] = self.missed_deadline.get(command, 0) + 1
+        if failed:
+            self.errors[command] = self.errors.get(command, 0) + 1
+
+    def clear(self) -> None:
+        self.duration.clear()
+        self.ack.clear()
+        self.followup.clear()
+        self.errors.clear()
+        self.missed_deadline.clear()
+
+
+interaction_metrics = InteractionMetrics()
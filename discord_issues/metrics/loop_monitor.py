@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from ..db.instrumentation import current_scope
+from .interaction_metrics import Histogram
+
+# Upper bounds, in seconds, of the scheduling lag histogram buckets.
+LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Stalls outside any command are counted under this label. Task names are
+# only logged, since default ones (Task-1234) would grow the label set forever.
+NO_COMMAND = "<no command>"
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs a timer, and reports long stalls.
+
+    A task on the loop wakes every ``interval`` seconds and records how late
+    it woke. A watchdog thread notices when that task has not run for
+    ``threshold`` seconds past its timer, and captures the loop thread's stack
+    and the command running at that moment. Once the loop recovers, the stall
+    is logged with its full duration and counted per command.
+    """
+
+    def __init__(
+        self, threshold: float = 0.25, interval: float = 0.1, stack_limit: int = 30
+    ):
+        """
+        Initializes the monitor. It starts measuring on ``start``.
+
+        Args:
+            threshold: Lag, in seconds, from which a stall is reported.
+            interval: How often, in seconds, the loop is sampled.
+            stack_limit: The most stack frames logged per stall.
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.stack_limit = stack_limit
+        self.lag = Histogram(LAG_BUCKETS)
+        self.stalls: dict[str, int] = {}
+        self.stalled_seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_beat = 0.0
+        self._captured: Optional[tuple[str, str, str]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id = 0
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts sampling the running loop and watching it from a thread."""
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._beat(), name="loop-lag-monitor")
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def close(self) -> None:
+        """Stops sampling and joins the watchdog thread."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def _beat(self) -> None:
+        while True:
+            before = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - before - self.interval)
+            self._last_beat = now
+            self.lag.observe(lag)
+
+            with self._lock:
+                captured, self._captured = self._captured, None
+            if captured is not None:
+                self._report(lag, *captured)
+
+    def _report(self, lag: float, command: str, running: str, stack: str) -> None:
+        self.stalls[command] = self.stalls.get(command, 0) + 1
+        self.stalled_seconds[command] = self.stalled_seconds.get(command, 0.0) + lag
+        logging.warning(
+            f"Event loop blocked for {lag * 1000:.0f} ms during {running}:\n{stack}"
+        )
+
+    def _watch(self) -> None:
+        captured_beat = None
+        while not self._stop.wait(self.threshold / 4):
+            beat = self._last_beat
+            overdue = time.monotonic() - beat - self.interval
+            if overdue < self.threshold or beat == captured_beat:
+                continue
+            # Capture once per stall, while the loop is still blocked.
+            captured_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame, limit=self.stack_limit))
+            with self._lock:
+                self._captured = (*self._current_command(), stack)
+
+    def _current_command(self) -> tuple[str, str]:
+        """
+        Names what the loop is running; called from the watchdog thread.
+
+        Returns:
+            The command label stalls are counted under, and a description of
+            what was running for the log.
+        """
+        task = asyncio.current_task(self._loop)
+        if task is None:
+            return NO_COMMAND, "a callback"
+        scope = task.get_context().get(current_scope)
+        if scope is None:
+            return NO_COMMAND, f"task {task.get_name()}"
+        return scope.name, scope.name
+
+
+loop_monitor = LoopLagMonitor()
@@ -1,16 +1,39 @@
+import sys
 from typing import TypeVar, Type, Generic, Optional, Any
-from discord_issues.db.database import SessionLocal
+from sqlalchemy import inspect, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from discord_issues.cache.lru import LRUCache
+from discord_issues.db.database import ReadSessionLocal, write_queue
 from discord_issues.db.models import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+def estimate_row_size(db_obj: Base) -> int:
+    """Estimates the memory held by a loaded model instance, in bytes."""
+    return sys.getsizeof(db_obj) + sum(
+        sys.getsizeof(value) for value in vars(db_obj).values()
+    )
+
+
 class BaseRepository(Generic[ModelType]):
     """
     A generic base repository that provides basic CRUD (Create, Read, Update, Delete)
     functionality for a given SQLAlchemy model.
+
+    All methods are coroutines backed by an ``AsyncSession``, so database I/O
+    never blocks the bot's event loop. Reads go through the query_only reader
+    pool. Writes are submitted to the write queue, which commits concurrent
+    mutations together in one transaction on the single writer connection.
+
+    Subclasses can opt into a read-through cache for ``get`` by setting the
+    ``cache`` class attribute. The cache is shared by every instance of the
+    subclass, and writes through this repository invalidate its entries.
     """
 
+    cache: Optional[LRUCache[Any, Any]] = None
+
     def __init__(self, model: Type[ModelType]):
         """
         Initializes the repository with a specific SQLAlchemy model.
@@ -19,9 +42,10 @@ class BaseRepository(Generic[ModelType]):
             model: The SQLAlchemy model class (e.g., Issue, User).
         """
         self.model = model
-        self.session_factory = SessionLocal
+        self.read_session_factory = ReadSessionLocal
+        self.write_queue = write_queue
 
-    def get(self, pk: Any) -> Optional[ModelType]:
+    async def get(self, pk: Any) -> Optional[ModelType]:
         """
         Retrieves a single record by its primary key.
 
@@ -31,10 +55,16 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             The model instance if found, otherwise None.
         """
-        with self.session_factory() as session:
-            return session.query(self.model).get(pk)
+        if self.cache is not None and (db_obj := self.cache.get(pk)) is not None:
+            return db_obj
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
+        async with self.read_session_factory() as session:
+            db_obj = await session.get(self.model, pk)
+        if self.cache is not None and db_obj is not None:
+            self.cache.set(pk, db_obj)
+        return db_obj
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
         """
         Retrieves all records, with optional pagination.
 
@@ -45,10 +75,11 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             A list of model instances.
         """
-        with self.session_factory() as session:
-            return session.query(self.model).offset(skip).limit(limit).all()
+        async with self.read_session_factory() as session:
+            result = await session.scalars(select(self.model).offset(skip).limit(limit))
+            return list(result.all())
 
-    def create(self, **kwargs: Any) -> ModelType:
+    async def create(self, **kwargs: Any) -> ModelType:
         """
         Creates a new record in the database.
 
@@ -58,16 +89,55 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             The newly created model instance.
         """
-        with self.session_factory() as session:
-            # Use session.begin() to ensure the transaction is atomic.
-            # It automatically commits on success or rolls back on error.
-            with session.begin():
-                db_obj = self.model(**kwargs)
-                session.add(db_obj)
-            session.refresh(db_obj)
+
+        async def operation(session: AsyncSession) -> ModelType:
+            db_obj = self.model(**kwargs)
+            session.add(db_obj)
+            await session.flush()
+            await session.refresh(db_obj)
             return db_obj
 
-    def update(self, pk: Any, **kwargs: Any) -> Optional[ModelType]:
+        return await self.write_queue.submit(operation)
+
+    async def get_or_create(self, **kwargs: Any) -> ModelType:
+        """
+        Returns the record with the given attributes, inserting it if missing.
+
+        The insert is a single ``INSERT ... ON CONFLICT DO NOTHING RETURNING``
+        statement, so the first-touch path is one round trip and concurrent
+        callers cannot race each other into a duplicate key error. The primary
+        key must be among the attributes.
+
+        Args:
+            **kwargs: A dictionary of attributes for the record, including its
+                primary key.
+
+        Returns:
+            The newly created or already existing model instance.
+        """
+
+        pk = tuple(kwargs[column.key] for column in inspect(self.model).primary_key)
+        cache_key = pk[0] if len(pk) == 1 else pk
+        if self.cache is not None and (db_obj := self.cache.get(cache_key)) is not None:
+            return db_obj
+
+        async def operation(session: AsyncSession) -> ModelType:
+            db_obj = await session.scalar(
+                insert(self.model)
+                .values(**kwargs)
+                .on_conflict_do_nothing()
+                .returning(self.model)
+            )
+            if db_obj is None:
+                db_obj = await session.get(self.model, pk)
+            return db_obj
+
+        db_obj = await self.write_queue.submit(operation)
+        if self.cache is not None:
+            self.cache.set(cache_key, db_obj)
+        return db_obj
+
+    async def update(self, pk: Any, **kwargs: Any) -> Optional[ModelType]:
         """
         Updates an existing record identified by its primary key.
 
@@ -78,21 +148,26 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             The updated model instance, or None if the record was not found.
         """
-        with self.session_factory() as session:
-            with session.begin():
-                db_obj = session.query(self.model).get(pk)
-                if db_obj is None:
-                    return None
 
-                for key, value in kwargs.items():
-                    if hasattr(db_obj, key):
-                        setattr(db_obj, key, value)
+        async def operation(session: AsyncSession) -> Optional[ModelType]:
+            db_obj = await session.get(self.model, pk)
+            if db_obj is None:
+                return None
 
-                session.add(db_obj)
-            session.refresh(db_obj)
+            for key, value in kwargs.items():
+                if hasattr(db_obj, key):
+                    setattr(db_obj, key, value)
+
+            await session.flush()
+            await session.refresh(db_obj)
             return db_obj
 
-    def delete(self, pk: Any) -> bool:
+        try:
+            return await self.write_queue.submit(operation)
+        finally:
+            self.invalidate(pk)
+
+    async def delete(self, pk: Any) -> bool:
         """
         Deletes a record by its primary key.
 
@@ -102,10 +177,37 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if the deletion was successful, False otherwise.
         """
-        with self.session_factory() as session:
-            with session.begin():
-                db_obj = session.query(self.model).get(pk)
-                if db_obj is None:
-                    return False
-                session.delete(db_obj)
+
+        async def operation(session: AsyncSession) -> bool:
+            db_obj = await session.get(self.model, pk)
+            if db_obj is None:
+                return False
+            await session.delete(db_obj)
             return True
+
+        try:
+            return await self.write_queue.submit(operation)
+        finally:
+            self.invalidate(pk)
+
+    def invalidate(self, pk: Any) -> None:
+        """
+        Drops a record from this repository's cache, if it has one.
+
+        Args:
+            pk: The primary key of the record.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(pk)
+
+    @staticmethod
+    def cache_stats() -> dict[str, dict[str, float]]:
+        """Returns the cache statistics of every repository that has a cache."""
+        stats = {}
+        pending = list(BaseRepository.__subclasses__())
+        while pending:
+            repository = pending.pop()
+            pending.extend(repository.__subclasses__())
+            if repository.cache is not None:
+                stats[repository.__name__] = repository.cache.stats()
+        return stats
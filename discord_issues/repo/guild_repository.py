@@ -1,7 +1,15 @@
+from discord_issues.cache.lru import LRUCache
 from discord_issues.db.models import Guild
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, estimate_row_size
 
 
 class GuildRepository(BaseRepository[Guild]):
+    cache = LRUCache(
+        maxsize=1_000,
+        ttl=600.0,
+        max_bytes=1024 * 1024,
+        sizeof=estimate_row_size,
+    )
+
     def __init__(self):
         super().__init__(Guild)
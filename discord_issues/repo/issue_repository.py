@@ -1,46 +1,381 @@
-from typing import Optional
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
-from discord_issues.db.models import Issue, Project, Tag, User, IssueStatus
+import datetime
+import json
+from itertools import batched
+from typing import Any, AsyncIterator, NamedTuple, Optional
+from sqlalchemy import (
+    ColumnElement,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from discord_issues.db.models import (
+    Issue,
+    IssueStatus,
+    Project,
+    Tag,
+    User,
+    issue_assignees,
+    issue_tags,
+)
 from .base_repository import BaseRepository
 
 
+# The FTS5 index created alongside the issues table; see ISSUE_FTS_DDL.
+issues_fts = table("issues_fts", column("rowid"))
+
+# Issue ids bound per UPDATE when bumping newly linked issues, well under
+# SQLite's limit on host parameters.
+BULK_UPDATE_CHUNK_SIZE = 500
+
+
+class IssueRecord(NamedTuple):
+    """An issue to be bulk-inserted, with users and tags referred to by key."""
+
+    title: str
+    description: Optional[str]
+    creator_id: str
+    status: IssueStatus = IssueStatus.OPEN
+    assignee_ids: tuple[str, ...] = ()
+    tag_names: tuple[str, ...] = ()
+    created_at: Optional[datetime.datetime] = None
+    closed_at: Optional[datetime.datetime] = None
+
+
+def to_fts_query(text: str) -> str:
+    """
+    Turns free text into an FTS5 query that matches every word as a prefix.
+
+    Each word is quoted, so characters that are FTS5 syntax in raw user input
+    (quotes, dashes, colons, ...) are matched literally instead of raising.
+    """
+    words = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{word}"*' for word in words)
+
+
 class IssueRepository(BaseRepository[Issue]):
     def __init__(self):
         super().__init__(Issue)
 
-    def get_next_project_issue_id(self, project_id: int, session) -> int:
+    async def get_next_project_issue_id(
+        self, project_id: int, session: AsyncSession
+    ) -> int:
+        """
+        Reserves the next available issue ID for a given project.
+        This should be called within an active transaction, which then owns the
+        reservation until it commits or rolls back.
         """
-        Calculates the next available issue ID for a given project.
-        This should be called within an active session.
+        return await self.reserve_project_issue_ids(project_id, 1, session)
+
+    async def reserve_project_issue_ids(
+        self, project_id: int, count: int, session: AsyncSession
+    ) -> int:
         """
-        max_id = (
-            session.query(func.max(self.model.project_issue_id))
-            .filter(self.model.project_id == project_id)
-            .scalar()
+        Reserves ``count`` consecutive issue IDs for a given project in one
+        statement, with the same transaction semantics as
+        ``get_next_project_issue_id``.
+
+        Returns:
+            The first reserved ID.
+        """
+        last = await session.scalar(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(last_project_issue_id=Project.last_project_issue_id + count)
+            .returning(Project.last_project_issue_id)
         )
-        return (max_id or 0) + 1
+        return last - count + 1
 
-    def find_by_project_issue_id(
+    async def find_by_project_issue_id(
         self, project_id: int, project_issue_id: int
     ) -> Optional[Issue]:
         """
         Finds a single issue by its user-facing ID within a specific project.
         e.g., finds issue #12 in project with id=1.
         """
-        with self.session_factory() as session:
-            return (
-                session.query(self.model)
+        async with self.read_session_factory() as session:
+            # Collections use selectinload so each is one indexed IN query
+            # instead of a cartesian join across assignees and tags.
+            return await session.scalar(
+                select(self.model)
                 .options(
-                    joinedload(self.model.assignees),
-                    joinedload(self.model.tags),
+                    selectinload(self.model.assignees),
+                    selectinload(self.model.tags),
                     joinedload(self.model.creator),
                 )
                 .filter_by(project_id=project_id, project_issue_id=project_issue_id)
-                .first()
             )
 
-    def create_issue(
+    async def get_version(
+        self, project_id: int, project_issue_id: int
+    ) -> Optional[tuple[int, datetime.datetime]]:
+        """
+        Looks up an issue's primary key and last update time.
+
+        This is a single indexed lookup, cheap enough to check whether a
+        rendered view of the issue is still current.
+
+        Returns:
+            (id, updated_at), or None if the issue does not exist.
+        """
+        async with self.read_session_factory() as session:
+            result = await session.execute(
+                select(self.model.id, self.model.updated_at).filter_by(
+                    project_id=project_id, project_issue_id=project_issue_id
+                )
+            )
+            row = result.first()
+            return tuple(row) if row else None
+
+    async def find_titles_by_project(self, project_id: int) -> list[tuple[int, str]]:
+        """Returns (project_issue_id, title) for every issue in a project, in order."""
+        async with self.read_session_factory() as session:
+            result = await session.execute(
+                select(self.model.project_issue_id, self.model.title)
+                .where(self.model.project_id == project_id)
+                .order_by(self.model.project_issue_id)
+            )
+            return [(number, title) for number, title in result]
+
+    async def search(
+        self, project_id: int, text: str, limit: int = 10, offset: int = 0
+    ) -> list[Issue]:
+        """
+        Full-text searches a project's issue titles and descriptions.
+
+        Results are ranked by BM25 relevance, best match first.
+        """
+        query = to_fts_query(text)
+        if not query:
+            return []
+
+        async with self.read_session_factory() as session:
+            result = await session.scalars(
+                select(self.model)
+                .join(issues_fts, issues_fts.c.rowid == self.model.id)
+                .where(
+                    literal_column("issues_fts").op("MATCH")(query),
+                    self.model.project_id == project_id,
+                )
+                .order_by(literal_column("bm25(issues_fts)"))
+                .limit(limit)
+                .offset(offset)
+            )
+            return list(result.all())
+
+    async def list_issues(
+        self,
+        project_id: int,
+        *,
+        assignee_id: Optional[str] = None,
+        status: Optional[IssueStatus] = None,
+        tag_name: Optional[str] = None,
+        after: Optional[int] = None,
+        limit: int = 10,
+    ) -> list[Issue]:
+        """
+        Lists a project's issues in project_issue_id order, filtered in SQL.
+
+        Pages are keyset-paginated: pass the last project_issue_id of the
+        previous page as ``after`` to continue. Without a status filter, closed
+        issues are left out. Assignees and tags are selectin-loaded.
+        """
+        stmt = (
+            select(self.model)
+            .where(self.model.project_id == project_id)
+            .options(selectinload(self.model.assignees), selectinload(self.model.tags))
+            .order_by(self.model.project_issue_id)
+            .limit(limit)
+        )
+        if status is not None:
+            stmt = stmt.where(self.model.status == status)
+        else:
+            stmt = stmt.where(self.model.status != IssueStatus.CLOSED)
+        if assignee_id is not None:
+            # (issue_id, user_id) is the primary key, so this never duplicates rows.
+            stmt = stmt.join(
+                issue_assignees, issue_assignees.c.issue_id == self.model.id
+            ).where(issue_assignees.c.user_id == assignee_id)
+        if tag_name is not None:
+            # Tag names are unique per project, so this never duplicates rows.
+            stmt = (
+                stmt.join(issue_tags, issue_tags.c.issue_id == self.model.id)
+                .join(Tag, Tag.id == issue_tags.c.tag_id)
+                .where(Tag.project_id == project_id, Tag.name == tag_name)
+            )
+        if after is not None:
+            stmt = stmt.where(self.model.project_issue_id > after)
+
+        async with self.read_session_factory() as session:
+            result = await session.scalars(stmt)
+            return list(result.all())
+
+    def _bulk_filter(
+        self,
+        project_id: int,
+        numbers: Optional[list[tuple[int, int]]],
+        status: Optional[IssueStatus],
+        tag_name: Optional[str],
+    ) -> list[ColumnElement[bool]]:
+        """Builds the WHERE clauses selecting the issues of a bulk operation."""
+        clauses = [self.model.project_id == project_id]
+        if numbers:
+            clauses.append(
+                or_(
+                    *(
+                        self.model.project_issue_id.between(first, last)
+                        for first, last in numbers
+                    )
+                )
+            )
+        if status is not None:
+            clauses.append(self.model.status == status)
+        if tag_name is not None:
+            clauses.append(
+                self.model.id.in_(
+                    select(issue_tags.c.issue_id)
+                    .join(Tag, Tag.id == issue_tags.c.tag_id)
+                    .where(Tag.project_id == project_id, Tag.name == tag_name)
+                )
+            )
+        return clauses
+
+    async def bulk_set_status(
+        self,
+        project_id: int,
+        new_status: IssueStatus,
+        *,
+        numbers: Optional[list[tuple[int, int]]] = None,
+        status: Optional[IssueStatus] = None,
+        tag_name: Optional[str] = None,
+    ) -> int:
+        """
+        Changes the status of every matching issue with one UPDATE.
+
+        Issues are matched by ``numbers`` (inclusive project_issue_id ranges),
+        current ``status`` and ``tag_name``, all combined. ``closed_at`` is set
+        when an issue becomes closed and cleared when it is reopened.
+
+        Returns:
+            The number of issues whose status changed.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        closed_at = (
+            func.coalesce(self.model.closed_at, now)
+            if new_status == IssueStatus.CLOSED
+            else None
+        )
+        stmt = (
+            update(self.model)
+            .where(
+                *self._bulk_filter(project_id, numbers, status, tag_name),
+                self.model.status != new_status,
+            )
+            .values(status=new_status, closed_at=closed_at, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        async def operation(session: AsyncSession) -> int:
+            return (await session.execute(stmt)).rowcount
+
+        return await self.write_queue.submit(operation)
+
+    async def bulk_assign(
+        self,
+        project_id: int,
+        user_id: str,
+        *,
+        numbers: Optional[list[tuple[int, int]]] = None,
+        status: Optional[IssueStatus] = None,
+        tag_name: Optional[str] = None,
+    ) -> int:
+        """
+        Assigns a user to every matching issue with one INSERT ... SELECT.
+
+        Issues are matched as in ``bulk_set_status``. The user is created if
+        needed, and issues it is already assigned to are skipped.
+
+        Returns:
+            The number of issues the user was newly assigned to.
+        """
+        return await self._bulk_link(
+            issue_assignees,
+            issue_assignees.c.user_id,
+            user_id,
+            self._bulk_filter(project_id, numbers, status, tag_name),
+            ensure_user=True,
+        )
+
+    async def bulk_tag(
+        self,
+        project_id: int,
+        tag_id: int,
+        *,
+        numbers: Optional[list[tuple[int, int]]] = None,
+        status: Optional[IssueStatus] = None,
+        tag_name: Optional[str] = None,
+    ) -> int:
+        """
+        Adds a tag to every matching issue with one INSERT ... SELECT.
+
+        Issues are matched as in ``bulk_set_status``; issues that already
+        have the tag are skipped.
+
+        Returns:
+            The number of issues the tag was newly added to.
+        """
+        return await self._bulk_link(
+            issue_tags,
+            issue_tags.c.tag_id,
+            tag_id,
+            self._bulk_filter(project_id, numbers, status, tag_name),
+        )
+
+    async def _bulk_link(
+        self,
+        link_table,
+        link_column,
+        value: Any,
+        clauses: list[ColumnElement[bool]],
+        ensure_user: bool = False,
+    ) -> int:
+        """Links ``value`` to every issue matching ``clauses`` in ``link_table``."""
+        matching = select(self.model.id, literal(value)).where(*clauses)
+        link = (
+            insert(link_table)
+            .from_select([link_table.c.issue_id, link_column], matching)
+            .on_conflict_do_nothing()
+            .returning(link_table.c.issue_id)
+        )
+
+        async def operation(session: AsyncSession) -> int:
+            if ensure_user:
+                await session.execute(
+                    insert(User).values(user_id=value).on_conflict_do_nothing()
+                )
+            # Skipped conflicts return nothing, so only new links are listed.
+            linked = list((await session.scalars(link)).all())
+            # Bump versions so cached views of these issues are re-rendered.
+            now = datetime.datetime.now(datetime.timezone.utc)
+            for chunk in batched(linked, BULK_UPDATE_CHUNK_SIZE):
+                await session.execute(
+                    update(self.model)
+                    .where(self.model.id.in_(chunk))
+                    .values(updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            return len(linked)
+
+        return await self.write_queue.submit(operation)
+
+    async def create_issue(
         self,
         project: Project,
         creator: User,
@@ -52,26 +387,191 @@ class IssueRepository(BaseRepository[Issue]):
         """
         Creates a new issue and handles all its relationships.
         """
-        with self.session_factory() as session:
-            with session.begin():
-                next_id = self.get_next_project_issue_id(project.id, session)
-
-                new_issue = Issue(
-                    project_issue_id=next_id,
-                    title=title,
-                    description=description,
-                    project_id=project.id,
-                    creator_id=creator.user_id,
-                    status=IssueStatus.OPEN,
-                )
 
-                if assignees:
-                    new_issue.assignees.extend(assignees)
+        async def operation(session: AsyncSession) -> Issue:
+            next_id = await self.get_next_project_issue_id(project.id, session)
+
+            new_issue = Issue(
+                project_issue_id=next_id,
+                title=title,
+                description=description,
+                project_id=project.id,
+                creator_id=creator.user_id,
+                status=IssueStatus.OPEN,
+            )
 
-                if tags:
-                    new_issue.tags.extend(tags)
+            # Merge rather than add: the batch session may already hold these.
+            for user in assignees:
+                new_issue.assignees.append(await session.merge(user, load=False))
 
-                session.add(new_issue)
+            for tag in tags:
+                new_issue.tags.append(await session.merge(tag, load=False))
 
-            session.refresh(new_issue)
+            session.add(new_issue)
+            await session.flush()
+            await session.refresh(new_issue)
             return new_issue
+
+        return await self.write_queue.submit(operation)
+
+    async def stream_for_export(
+        self, project_id: int, batch_size: int = 500
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Streams every issue of a project with its assignee and tag lists.
+
+        Rows are fetched from a server-side cursor ``batch_size`` at a time on
+        a reader connection, so memory stays flat and writers are not blocked.
+        Assignees and tags are aggregated per issue by correlated subqueries
+        over the link tables' primary keys.
+        """
+        assignees = (
+            select(func.json_group_array(issue_assignees.c.user_id))
+            .where(issue_assignees.c.issue_id == self.model.id)
+            .scalar_subquery()
+        )
+        tags = (
+            select(func.json_group_array(Tag.name))
+            .join(issue_tags, issue_tags.c.tag_id == Tag.id)
+            .where(issue_tags.c.issue_id == self.model.id)
+            .scalar_subquery()
+        )
+        statement = (
+            select(
+                self.model.project_issue_id,
+                self.model.title,
+                self.model.description,
+                self.model.status,
+                self.model.creator_id,
+                assignees.label("assignees"),
+                tags.label("tags"),
+                self.model.created_at,
+                self.model.updated_at,
+                self.model.closed_at,
+            )
+            .where(self.model.project_id == project_id)
+            .order_by(self.model.project_issue_id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.read_session_factory() as session:
+            result = await session.stream(statement)
+            async for row in result.mappings():
+                yield {
+                    **row,
+                    "assignees": json.loads(row["assignees"]),
+                    "tags": json.loads(row["tags"]),
+                }
+
+    async def import_issues(
+        self, project_id: int, records: list[IssueRecord]
+    ) -> list[str]:
+        """
+        Bulk-inserts issues into a project in a single transaction.
+
+        Missing users and tags are created, a block of issue IDs is reserved
+        up front, and issues and their links are inserted with executemany.
+        Callers importing large inputs should split them into chunks.
+
+        Returns:
+            The names of the tags that had to be created.
+        """
+
+        async def operation(session: AsyncSession) -> list[str]:
+            if not records:
+                return []
+
+            user_ids = {record.creator_id for record in records}
+            user_ids.update(u for record in records for u in record.assignee_ids)
+            await session.execute(
+                insert(User).on_conflict_do_nothing(),
+                [{"user_id": user_id} for user_id in user_ids],
+            )
+
+            tag_names = {name for record in records for name in record.tag_names}
+            created_tags = []
+            tag_ids = {}
+            if tag_names:
+                created_tags = list(
+                    await session.scalars(
+                        insert(Tag)
+                        .values(
+                            [{"name": n, "project_id": project_id} for n in tag_names]
+                        )
+                        .on_conflict_do_nothing()
+                        .returning(Tag.name)
+                    )
+                )
+                tag_ids = dict(
+                    (
+                        await session.execute(
+                            select(Tag.name, Tag.id).where(
+                                Tag.project_id == project_id, Tag.name.in_(tag_names)
+                            )
+                        )
+                    ).all()
+                )
+
+            first_id = await self.reserve_project_issue_ids(
+                project_id, len(records), session
+            )
+            now = datetime.datetime.now(datetime.timezone.utc)
+            issue_ids = await session.scalars(
+                insert(Issue).returning(Issue.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "project_issue_id": first_id + i,
+                        "title": record.title,
+                        "description": record.description,
+                        "status": record.status,
+                        "creator_id": record.creator_id,
+                        "project_id": project_id,
+                        "created_at": record.created_at or now,
+                        "updated_at": record.created_at or now,
+                        "closed_at": record.closed_at,
+                    }
+                    for i, record in enumerate(records)
+                ],
+            )
+
+            assignee_rows, tag_rows = [], []
+            for issue_id, record in zip(issue_ids, records):
+                assignee_rows.extend(
+                    {"issue_id": issue_id, "user_id": user_id}
+                    for user_id in dict.fromkeys(record.assignee_ids)
+                )
+                tag_rows.extend(
+                    {"issue_id": issue_id, "tag_id": tag_ids[name]}
+                    for name in dict.fromkeys(record.tag_names)
+                )
+            if assignee_rows:
+                await session.execute(insert(issue_assignees), assignee_rows)
+            if tag_rows:
+                await session.execute(insert(issue_tags), tag_rows)
+            return created_tags
+
+        return await self.write_queue.submit(operation)
+
+    async def add_assignee(self, issue_id: int, user: User) -> Optional[bool]:
+        """
+        Assigns a user to an issue, doing nothing if they already are.
+
+        Returns:
+            True if the user was assigned, False if they were already assigned,
+            or None if the issue does not exist.
+        """
+
+        async def operation(session: AsyncSession) -> Optional[bool]:
+            issue = await session.get(
+                self.model, issue_id, options=[selectinload(self.model.assignees)]
+            )
+            if issue is None:
+                return None
+            # ``user`` belongs to another session, so compare by primary key.
+            if any(a.user_id == user.user_id for a in issue.assignees):
+                return False
+            issue.assignees.append(await session.merge(user, load=False))
+            # The association row alone would not bump the issue's version.
+            issue.updated_at = datetime.datetime.now(datetime.timezone.utc)
+            return True
+
+        return await self.write_queue.submit(operation)
@@ -1,26 +1,133 @@
-from typing import Optional
-from discord_issues.db.models import Project
+import datetime
+from typing import Iterable, Optional
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from discord_issues.cache.lru import LRUCache
+from discord_issues.db.models import (
+    Issue,
+    IssueStatus,
+    Project,
+    ProjectIssueCount,
+    Tag,
+)
 from .base_repository import BaseRepository
-from sqlalchemy.orm import joinedload
-import logging
+
+# Resolves (guild_id, name) to a detached Project. Shared by every repository
+# instance; callers that rename or delete a project must invalidate its name.
+project_name_cache: LRUCache[tuple[str, str], Project] = LRUCache(maxsize=2048)
 
 
 class ProjectRepository(BaseRepository[Project]):
     def __init__(self):
         super().__init__(Project)
 
-    def find_by_name(self, guild_id: str, name: str) -> Optional[Project]:
-        """Finds a project within a guild by its name."""
-        with self.session_factory() as session:
-            return (
-                session.query(self.model)
-                .filter_by(guild_id=guild_id, name=name)
-                .first()
+    async def find_by_name(self, guild_id: str, name: str) -> Optional[Project]:
+        """Finds a project within a guild by its name, serving repeats from cache."""
+        project = project_name_cache.get((guild_id, name))
+        if project is not None:
+            return project
+
+        async with self.read_session_factory() as session:
+            project = await session.scalar(
+                select(self.model).filter_by(
+                    guild_id=guild_id, name=name, deleted_at=None
+                )
             )
+        if project is not None:
+            project_name_cache.set((guild_id, name), project)
+        return project
 
-    def find_by_guild_id(self, guild_id: str) -> list[Project]:
+    def invalidate_name(self, guild_id: str, name: str) -> None:
+        """Drops a cached name resolution after the project changes."""
+        project_name_cache.invalidate((guild_id, name))
+
+    async def find_by_guild_id(self, guild_id: str) -> list[Project]:
         """Finds all projects associated with a specific guild ID."""
-        with self.session_factory() as session:
-            return (
-                session.query(self.model).filter(self.model.guild_id == guild_id).all()
+        async with self.read_session_factory() as session:
+            result = await session.scalars(
+                select(self.model).where(
+                    self.model.guild_id == guild_id, self.model.deleted_at.is_(None)
+                )
+            )
+            return list(result.all())
+
+    async def issue_counts(
+        self, project_ids: Iterable[int]
+    ) -> dict[int, dict[IssueStatus, int]]:
+        """
+        Returns each project's number of issues per status.
+
+        Reads the trigger-maintained counters, so this costs one primary-key
+        lookup per project and status, regardless of how many issues exist.
+        Statuses without issues are reported as 0.
+        """
+        project_ids = list(project_ids)
+        counts = {
+            project_id: dict.fromkeys(IssueStatus, 0) for project_id in project_ids
+        }
+        async with self.read_session_factory() as session:
+            result = await session.execute(
+                select(
+                    ProjectIssueCount.project_id,
+                    ProjectIssueCount.status,
+                    ProjectIssueCount.count,
+                ).where(ProjectIssueCount.project_id.in_(project_ids))
+            )
+            for project_id, status, count in result:
+                counts[project_id][status] = count
+        return counts
+
+    async def soft_delete(self, pk: int) -> bool:
+        """
+        Hides a project immediately and leaves its rows for ``purge_deleted``.
+
+        Returns:
+            True if the project was deleted, False if it did not exist.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == pk, self.model.deleted_at.is_(None))
+            .values(deleted_at=datetime.datetime.now(datetime.timezone.utc))
+        )
+
+        async def operation(session: AsyncSession) -> bool:
+            return (await session.execute(stmt)).rowcount > 0
+
+        try:
+            return await self.write_queue.submit(operation)
+        finally:
+            self.invalidate(pk)
+
+    async def purge_deleted(self, batch_size: int = 500) -> int:
+        """
+        Removes one chunk of a soft-deleted project's rows in a short transaction.
+
+        Issues go first, then tags, then the project itself; link rows follow
+        through ON DELETE CASCADE. Call repeatedly until it returns 0.
+
+        Returns:
+            The number of issues, tags or projects removed by this chunk.
+        """
+
+        async def operation(session: AsyncSession) -> int:
+            project_id = await session.scalar(
+                select(self.model.id).where(self.model.deleted_at.is_not(None)).limit(1)
             )
+            if project_id is None:
+                return 0
+            for model in (Issue, Tag):
+                chunk = (
+                    select(model.id)
+                    .where(model.project_id == project_id)
+                    .limit(batch_size)
+                    .scalar_subquery()
+                )
+                removed = (
+                    await session.execute(delete(model).where(model.id.in_(chunk)))
+                ).rowcount
+                if removed:
+                    return removed
+            await session.execute(delete(self.model).where(self.model.id == project_id))
+            return 1
+
+        return await self.write_queue.submit(operation)
@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Optional
+
+from .project_repository import ProjectRepository
+
+
+class ProjectPurger:
+    """
+    Purges soft-deleted projects in the background.
+
+    Each chunk is its own short write, and the purger yields between chunks,
+    so other commands' writes are never stalled behind a large deletion.
+    """
+
+    def __init__(self, batch_size: int = 500, pause: float = 0.05):
+        """
+        Initializes the purger. Its task starts on the first ``wake``.
+
+        Args:
+            batch_size: The most rows deleted per chunk.
+            pause: Seconds to wait between chunks.
+        """
+        self.batch_size = batch_size
+        self.pause = pause
+        self.purged = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def wake(self) -> None:
+        """Starts purging whatever projects are currently marked deleted."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="project-purger")
+        self._wakeup.set()
+
+    async def close(self) -> None:
+        """Stops the purger; unfinished projects are resumed on the next wake."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        project_repo = ProjectRepository()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                while removed := await project_repo.purge_deleted(self.batch_size):
+                    self.purged += removed
+                    await asyncio.sleep(self.pause)
+            except Exception as e:
+                logging.error(f"Project purge failed, will retry: {e}")
+                await asyncio.sleep(self.pause * 100)
+                self._wakeup.set()
+
+
+project_purger = ProjectPurger()
@@ -1,5 +1,7 @@
-from typing import Optional
-from discord_issues.db.models import Tag
+from typing import Iterable, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from discord_issues.db.models import Tag, issue_tags
 from .base_repository import BaseRepository
 
 
@@ -7,20 +9,47 @@ class TagRepository(BaseRepository[Tag]):
     def __init__(self):
         super().__init__(Tag)
 
-    def find_by_project_id(self, project_id: int) -> list[Tag]:
+    async def find_by_project_id(self, project_id: int) -> list[Tag]:
         """Finds all tags belonging to a specific project."""
-        with self.session_factory() as session:
-            return (
-                session.query(self.model)
-                .filter(self.model.project_id == project_id)
-                .all()
+        async with self.read_session_factory() as session:
+            result = await session.scalars(
+                select(self.model).where(self.model.project_id == project_id)
             )
+            return list(result.all())
 
-    def find_by_name(self, project_id: int, name: str) -> Optional[Tag]:
+    async def find_by_name(self, project_id: int, name: str) -> Optional[Tag]:
         """Finds a tag within a project by its name."""
-        with self.session_factory() as session:
-            return (
-                session.query(self.model)
-                .filter_by(project_id=project_id, name=name)
-                .first()
+        async with self.read_session_factory() as session:
+            return await session.scalar(
+                select(self.model).filter_by(project_id=project_id, name=name).limit(1)
             )
+
+    async def delete_by_names(self, project_id: int, names: Iterable[str]) -> list[str]:
+        """
+        Deletes tags from a project and detaches them from every issue.
+
+        Runs as one transaction with two set-based statements, one for the
+        issue_tags rows and one for the tags, however many issues use them.
+
+        Returns:
+            The names of the tags that existed and were deleted.
+        """
+        names = list(names)
+        matching = (
+            select(self.model.id)
+            .where(self.model.project_id == project_id, self.model.name.in_(names))
+            .scalar_subquery()
+        )
+
+        async def operation(session: AsyncSession) -> list[str]:
+            await session.execute(
+                delete(issue_tags).where(issue_tags.c.tag_id.in_(matching))
+            )
+            result = await session.scalars(
+                delete(self.model)
+                .where(self.model.project_id == project_id, self.model.name.in_(names))
+                .returning(self.model.name)
+            )
+            return list(result.all())
+
+        return await self.write_queue.submit(operation)
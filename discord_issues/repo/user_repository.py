@@ -1,7 +1,15 @@
+from discord_issues.cache.lru import LRUCache
 from discord_issues.db.models import User
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, estimate_row_size
 
 
 class UserRepository(BaseRepository[User]):
+    cache = LRUCache(
+        maxsize=10_000,
+        ttl=600.0,
+        max_bytes=4 * 1024 * 1024,
+        sizeof=estimate_row_size,
+    )
+
     def __init__(self):
         super().__init__(User)
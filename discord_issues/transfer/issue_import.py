@@ -0,0 +1,160 @@
+import csv
+import datetime
+import json
+from itertools import islice
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, TextIO
+
+from ..cache.autocomplete_index import autocomplete_index
+from ..db.models import IssueStatus
+from ..repo.issue_repository import IssueRecord, IssueRepository
+
+IMPORT_CHUNK_SIZE = 500
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+
+class ImportFormatError(ValueError):
+    """Raised when a record in an import file cannot be understood."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"Line {line}: {message}")
+        self.line = line
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Returns the import format implied by a file name, if it is supported."""
+    for extension, fmt in FORMATS.items():
+        if filename.lower().endswith(extension):
+            return fmt
+    return None
+
+
+def _parse_list(value: Any) -> tuple[str, ...]:
+    """Accepts a JSON list or a comma/semicolon separated string."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.replace(";", ",").split(",")
+    return tuple(str(item).strip() for item in value if str(item).strip())
+
+
+def _parse_status(value: Any) -> IssueStatus:
+    if not value:
+        return IssueStatus.OPEN
+    key = str(value).strip().casefold().replace("_", " ")
+    for status in IssueStatus:
+        if key in (status.value.casefold(), status.name.casefold().replace("_", " ")):
+            return status
+    raise ValueError(f"unknown status '{value}'")
+
+
+def _parse_datetime(value: Any) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    parsed = datetime.datetime.fromisoformat(str(value).strip())
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def to_record(row: dict[str, Any], default_creator_id: Optional[str]) -> IssueRecord:
+    """
+    Converts one parsed CSV row or JSON object into an IssueRecord.
+
+    Raises:
+        ValueError: If a field is missing or malformed.
+    """
+    title = str(row.get("title") or "").strip()
+    if not title:
+        raise ValueError("missing title")
+    creator_id = str(row.get("creator_id") or default_creator_id or "").strip()
+    if not creator_id:
+        raise ValueError("missing creator_id")
+
+    status = _parse_status(row.get("status"))
+    created_at = _parse_datetime(row.get("created_at"))
+    closed_at = _parse_datetime(row.get("closed_at"))
+    if status == IssueStatus.CLOSED and closed_at is None:
+        closed_at = created_at or datetime.datetime.now(datetime.timezone.utc)
+    elif status != IssueStatus.CLOSED:
+        closed_at = None
+
+    return IssueRecord(
+        title=title[:255],
+        description=row.get("description") or None,
+        creator_id=creator_id,
+        status=status,
+        assignee_ids=_parse_list(row.get("assignees")),
+        tag_names=tuple(name[:50] for name in _parse_list(row.get("tags"))),
+        created_at=created_at,
+        closed_at=closed_at,
+    )
+
+
+def parse_issues(
+    fp: TextIO, fmt: str, default_creator_id: Optional[str] = None
+) -> Iterator[IssueRecord]:
+    """
+    Lazily parses issues from a CSV file with a header row or from JSON lines.
+
+    Recognized fields are title, description, status, creator_id, assignees,
+    tags, created_at and closed_at; unknown fields are ignored.
+
+    Raises:
+        ImportFormatError: On the first record that cannot be parsed.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(fp)
+        rows = ((reader.line_num, row) for row in reader)
+    elif fmt == "jsonl":
+        rows = (
+            (number, line) for number, line in enumerate(fp, start=1) if line.strip()
+        )
+    else:
+        raise ValueError(f"Unsupported import format '{fmt}'.")
+
+    for line, row in rows:
+        try:
+            if fmt == "jsonl":
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValueError("expected a JSON object")
+            yield to_record(row, default_creator_id)
+        except ValueError as e:
+            raise ImportFormatError(line, str(e)) from e
+
+
+async def import_issues(
+    project_id: int,
+    records: Iterable[IssueRecord],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Optional[Callable[[int], Awaitable[None]]] = None,
+) -> int:
+    """
+    Imports issues into a project, committing every ``chunk_size`` records.
+
+    Records are consumed lazily, so only one chunk is held in memory. Chunks
+    committed before an error are kept.
+
+    Args:
+        project_id: The project to import into.
+        records: The issues to import, e.g. from ``parse_issues``.
+        chunk_size: How many issues to insert per transaction.
+        progress: Awaited with the running total after each chunk.
+
+    Returns:
+        The number of issues imported.
+    """
+    issue_repo = IssueRepository()
+    records = iter(records)
+    total = 0
+    try:
+        while chunk := list(islice(records, chunk_size)):
+            await issue_repo.import_issues(project_id, chunk)
+            total += len(chunk)
+            if progress is not None:
+                await progress(total)
+    finally:
+        # New issues and tags are picked up by the next lazy load.
+        if total:
+            autocomplete_index.invalidate_project(project_id)
+    return total
@@ -0,0 +1,74 @@
+import csv
+import datetime
+import enum
+import gzip
+import io
+import json
+from typing import Any, BinaryIO
+
+from ..repo.issue_repository import IssueRepository
+
+# Field order of exported files; the importer accepts the same fields.
+EXPORT_FIELDS = [
+    "project_issue_id",
+    "title",
+    "description",
+    "status",
+    "creator_id",
+    "assignees",
+    "tags",
+    "created_at",
+    "updated_at",
+    "closed_at",
+]
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _to_csv_field(value: Any) -> Any:
+    if isinstance(value, list):
+        return ";".join(value)
+    return "" if value is None else value
+
+
+async def export_issues(project_id: int, fp: BinaryIO, fmt: str) -> int:
+    """
+    Writes a project's issues to ``fp`` as gzip-compressed CSV or JSON lines.
+
+    Rows are compressed as they are streamed from the database, so neither
+    the rows nor the uncompressed output are ever held in memory at once.
+    ``fp`` itself is left open.
+
+    Args:
+        project_id: The project to export.
+        fp: A binary file object receiving the compressed output.
+        fmt: Either "csv" or "jsonl".
+
+    Returns:
+        The number of issues written.
+    """
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported export format '{fmt}'.")
+
+    count = 0
+    with gzip.GzipFile(fileobj=fp, mode="wb") as compressed:
+        with io.TextIOWrapper(compressed, encoding="utf-8", newline="") as out:
+            writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+            if fmt == "csv":
+                writer.writeheader()
+            async for row in IssueRepository().stream_for_export(project_id):
+                row = {field: _to_plain(row[field]) for field in EXPORT_FIELDS}
+                if fmt == "csv":
+                    writer.writerow(
+                        {field: _to_csv_field(v) for field, v in row.items()}
+                    )
+                else:
+                    out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+    return count
@@ -0,0 +1,63 @@
+from discord_issues.cache.autocomplete_index import (
+    SUBSTRING_SCAN_LIMIT,
+    AutocompleteIndex,
+    IssueIndex,
+    NameIndex,
+)
+
+
+def test_name_index_ranks_prefix_before_substring():
+    index = NameIndex((name, name) for name in ["Backend", "API", "Frontend", "apps"])
+
+    assert index.search("ap") == [("API", "API"), ("apps", "apps")]
+    assert index.search("end") == [("Backend", "Backend"), ("Frontend", "Frontend")]
+    assert len(index.search("")) == 4
+
+
+def test_name_index_respects_limit():
+    index = NameIndex((f"tag{n}", f"tag{n}") for n in range(100))
+    assert len(index.search("tag")) == 25
+    assert len(index.search("1", limit=5)) == 5
+
+
+def test_name_index_caps_the_substring_scan():
+    names = [f"a{n:05}" for n in range(SUBSTRING_SCAN_LIMIT)] + ["zz-needle"]
+    index = NameIndex((name, name) for name in names)
+
+    assert index.search("needle") == []
+    assert index.search("zz") == [("zz-needle", "zz-needle")]
+
+
+def test_issue_index_lists_newest_first_and_tracks_edits():
+    index = IssueIndex([(1, "Login broken"), (2, "Dark mode"), (3, "Logout slow")])
+
+    assert [value for _, value in index.search("")] == ["3", "2", "1"]
+    assert index.search("log") == [("#1: Login broken", "1"), ("#3: Logout slow", "3")]
+    assert index.search("#2") == [("#2: Dark mode", "2")]
+
+    index.add(2, "Light mode")
+    index.remove(3)
+    assert index.search("mode") == [("#2: Light mode", "2")]
+    assert [value for _, value in index.search("")] == ["2", "1"]
+
+
+def test_autocomplete_index_ignores_updates_until_loaded():
+    index = AutocompleteIndex()
+    index.add_project("1", "Alpha")
+    assert index.projects("1") is None
+
+    index.load_projects("1", ["Alpha"])
+    index.rename_project("1", "Alpha", "Beta")
+    index.add_project("1", "Gamma")
+    assert [name for name, _ in index.projects("1").search("")] == ["Beta", "Gamma"]
+
+
+def test_issue_indexes_are_held_under_a_byte_budget():
+    one = IssueIndex((n, f"Issue number {n}") for n in range(1, 101))
+    index = AutocompleteIndex(max_issue_bytes=int(one.nbytes() * 2.5))
+
+    for project_id in range(1, 4):
+        index.load_issues(project_id, ((n, f"Issue number {n}") for n in range(1, 101)))
+
+    assert index.issues(1) is None
+    assert index.issues(2) is not None and index.issues(3) is not None
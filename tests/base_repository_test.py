@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+
+from discord_issues.repo.user_repository import UserRepository
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_inserts_with_one_statement(session_factory):
+    engine = session_factory.kw["bind"]
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("BEGIN"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        user = await UserRepository().get_or_create(user_id="10")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert user.user_id == "10"
+    assert len(statements) == 1
+    assert "ON CONFLICT DO NOTHING RETURNING" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_returns_existing_record(session_factory):
+    user_repo = UserRepository()
+    created = await user_repo.create(user_id="10")
+
+    first = await user_repo.get_or_create(user_id="10")
+    second = await user_repo.get_or_create(user_id="10")
+
+    assert first.user_id == second.user_id == created.user_id
+    assert len(await user_repo.get_all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_cache(session_factory):
+    engine = session_factory.kw["bind"]
+    user_repo = UserRepository()
+    await user_repo.create(user_id="10")
+    await user_repo.get("10")
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        user = await user_repo.get("10")
+        await user_repo.get_or_create(user_id="10")
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert user.user_id == "10"
+    assert statements == []
+    assert UserRepository.cache_stats()["UserRepository"]["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cache(session_factory):
+    user_repo = UserRepository()
+    await user_repo.create(user_id="10")
+    await user_repo.get("10")
+
+    await user_repo.delete("10")
+
+    assert "10" not in UserRepository.cache
+    assert await user_repo.get("10") is None
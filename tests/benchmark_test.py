@@ -0,0 +1,27 @@
+import json
+
+from benchmarks import repository_benchmark
+
+
+def test_benchmarks_run_and_compare(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    argv = ["--scale", "tiny", "--iterations", "2", "--warmup", "0"]
+
+    assert repository_benchmark.main([*argv, "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert report["scale"]["issues"] == 200
+    names = {name for name, _ in repository_benchmark._BENCHMARKS}
+    assert set(report["results"]) == names
+    for result in report["results"].values():
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+
+    # Against a baseline that was impossibly fast, every benchmark regressed.
+    baseline = {
+        name: {**result, "p50_ms": 1e-9, "p95_ms": 1e-9}
+        for name, result in report["results"].items()
+    }
+    assert repository_benchmark.compare(report["results"], baseline, 0.25) == list(
+        report["results"]
+    )
+    assert "REGRESSION" in capsys.readouterr().out
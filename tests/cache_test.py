@@ -0,0 +1,50 @@
+from discord_issues.cache.lru import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest entry
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    cache.invalidate("a")
+    cache.get("a")
+
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"]) == (0, 1, 2)
+    assert stats["hit_rate"] == 1 / 3
+
+
+def test_lru_cache_expires_entries_after_ttl(mocker):
+    clock = mocker.patch("discord_issues.cache.lru.time.monotonic", return_value=0.0)
+    cache = LRUCache(ttl=10.0)
+    cache.set("a", 1)
+
+    clock.return_value = 9.0
+    assert cache.get("a") == 1
+    clock.return_value = 10.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_lru_cache_stays_within_memory_budget():
+    cache = LRUCache(max_bytes=100, sizeof=len)
+    cache.set("a", "x" * 60)
+    cache.set("b", "y" * 30)
+    cache.set("c", "z" * 30)
+
+    assert "a" not in cache
+    assert cache.get("b") and cache.get("c")
+    assert cache.stats()["bytes"] == 60
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock
+
+import pytest
+import discord
+
+from discord_issues.command_sync import sync_if_changed, tree_hash
+
+
+@pytest.mark.asyncio
+async def test_sync_only_runs_when_tree_changes(bot, tmp_path):
+    state_path = tmp_path / "command_sync.json"
+    bot.tree.sync = AsyncMock(return_value=[])
+
+    @bot.tree.command(name="ping", description="Ping")
+    async def ping(interaction):
+        pass
+
+    assert await sync_if_changed(bot.tree, state_path=state_path) == []
+    assert await sync_if_changed(bot.tree, state_path=state_path) is None
+    assert await sync_if_changed(bot.tree, force=True, state_path=state_path) == []
+    assert bot.tree.sync.await_count == 2
+
+    before = tree_hash(bot.tree)
+    ping.description = "Ping the bot"
+    assert tree_hash(bot.tree) != before
+    assert await sync_if_changed(bot.tree, state_path=state_path) == []
+    assert bot.tree.sync.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_sync_hashes_each_guild_separately(bot, tmp_path):
+    state_path = tmp_path / "command_sync.json"
+    bot.tree.sync = AsyncMock(return_value=[])
+    guild = discord.Object(id=42)
+
+    await sync_if_changed(bot.tree, state_path=state_path)
+    await sync_if_changed(bot.tree, guild=guild, state_path=state_path)
+
+    assert bot.tree.sync.await_count == 2
+    bot.tree.sync.assert_awaited_with(guild=guild)
@@ -1,7 +1,29 @@
+import pytest
 import pytest_asyncio
 import discord
 from discord.ext import commands
 import discord.ext.test as dpytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from discord_issues.cache.autocomplete_index import autocomplete_index
+from discord_issues.cache.embed_cache import issue_embed_cache
+from discord_issues.db.database import configure_sqlite
+from discord_issues.db.models import Base
+from discord_issues.db.writer import WriteQueue
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.project_repository import project_name_cache
+from discord_issues.repo.user_repository import UserRepository
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Autocomplete indexes and embeds are process-wide, so start every test empty."""
+    autocomplete_index.clear()
+    issue_embed_cache.clear()
+    yield
+    autocomplete_index.clear()
+    issue_embed_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -13,3 +35,28 @@ async def bot():
     dpytest.configure(bot)
     yield bot
     await dpytest.empty_queue()
+
+
+@pytest_asyncio.fixture
+async def session_factory(monkeypatch):
+    """Points every repository at a fresh in-memory database."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    configure_sqlite(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    # A single shared in-memory connection serves as both reader and writer.
+    queue = WriteQueue(factory)
+    monkeypatch.setattr("discord_issues.repo.base_repository.write_queue", queue)
+    monkeypatch.setattr("discord_issues.repo.base_repository.ReadSessionLocal", factory)
+    project_name_cache.clear()
+    UserRepository.cache.clear()
+    GuildRepository.cache.clear()
+    yield factory
+    await queue.close()
+    await engine.dispose()
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from discord_issues.db.database import make_engine
+
+
+@pytest.mark.asyncio
+async def test_make_engine_applies_pragmas(tmp_path):
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}")
+    async with engine.connect() as conn:
+        journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+        synchronous = await conn.scalar(text("PRAGMA synchronous"))
+        busy_timeout = await conn.scalar(text("PRAGMA busy_timeout"))
+    await engine.dispose()
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == 5000
+
+
+@pytest.mark.asyncio
+async def test_query_only_engine_rejects_writes(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}"
+    writer = make_engine(url)
+    reader = make_engine(url, query_only=True, pool_size=2)
+
+    async with writer.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        await conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    async with reader.connect() as conn:
+        assert await conn.scalar(text("SELECT count(*) FROM t")) == 1
+        with pytest.raises(OperationalError):
+            await conn.execute(text("INSERT INTO t VALUES (2)"))
+
+    await reader.dispose()
+    await writer.dispose()
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+# Modules that must not be imported while the bot starts; they are loaded
+# on first use instead.
+LAZY_MODULES = ("alembic", "discord_issues.transfer")
+
+# Budgets in microseconds. They are generous enough for a slow CI machine
+# but catch a heavy dependency creeping onto the startup path.
+MODULE_BUDGET_US = 150_000  # self time of any one discord_issues module
+TOTAL_BUDGET_US = 4_000_000  # everything imported before the bot is ready
+
+# What `python -m discord_issues` imports before the bot is ready: the entry
+# point (imported as a module, so the bot does not start) and the cogs that
+# setup_hook loads.
+STARTUP_MODULES = (
+    "discord_issues.__main__",
+    "discord_issues.cogs.admin_command",
+    "discord_issues.cogs.issue_command",
+    "discord_issues.cogs.project_command",
+    "discord_issues.cogs.tag_command",
+)
+
+
+def import_times(*modules: str) -> tuple[dict[str, int], int]:
+    """
+    Imports modules in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        A mapping of every imported module to its own import time, and the
+        total import time, both in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times, total = {}, 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+        # Nested imports are indented; top-level ones already include them.
+        if not name.startswith("  "):
+            total += int(cumulative_us)
+    return times, total
+
+
+def test_entry_point_import_time_is_within_budget():
+    times, total_us = import_times(*STARTUP_MODULES)
+
+    eager = [
+        name
+        for name in times
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES)
+    ]
+    assert not eager, f"Imported at startup: {eager}"
+
+    slow = {
+        name: self_us
+        for name, self_us in times.items()
+        if name.startswith("discord_issues") and self_us > MODULE_BUDGET_US
+    }
+    assert not slow, f"Modules over the {MODULE_BUDGET_US} us budget: {slow}"
+
+    assert total_us <= TOTAL_BUDGET_US, f"Startup imports took {total_us} us"
@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import discord
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from discord_issues.cogs.admin_command import format_dbstats
+from discord_issues.command_tree import command_name
+from discord_issues.db.instrumentation import (
+    QueryScope,
+    QueryStats,
+    current_scope,
+    instrument,
+    normalize_statement,
+)
+from discord_issues.db.writer import WriteQueue
+
+
+@pytest_asyncio.fixture
+async def instrumented(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}")
+    stats = QueryStats()
+    instrument(engine, stats)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        await conn.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+    stats.clear()
+    yield engine, stats
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_queries_are_attributed_to_the_current_scope(instrumented):
+    engine, stats = instrumented
+    scope = QueryScope("/issue view")
+    token = current_scope.set(scope)
+    try:
+        async with engine.connect() as conn:
+            for _ in range(2):
+                await conn.execute(text("SELECT x FROM t WHERE x IN (1, 2)"))
+    finally:
+        current_scope.reset(token)
+    stats.record_command(scope)
+
+    assert (scope.queries, scope.rows) == (2, 0)
+    [(statement, statement_stats)] = stats.top_statements(1)
+    assert statement == "SELECT x FROM t WHERE x IN (1, 2)"
+    assert statement_stats.count == 2
+    assert stats.commands["/issue view"].max_queries == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_are_not_recorded(instrumented):
+    engine, stats = instrumented
+    async with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT y FROM t"))
+        await conn.execute(text("DELETE FROM t WHERE x = 1"))
+
+    [(statement, statement_stats)] = stats.top_statements(1)
+    assert statement == "DELETE FROM t WHERE x = 1"
+    assert (statement_stats.count, statement_stats.rows) == (1, 1)
+    assert "SELECT y FROM t" not in stats.statements
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_count_towards_the_submitting_scope(instrumented):
+    engine, stats = instrumented
+    queue = WriteQueue(async_sessionmaker(bind=engine))
+
+    async def operation(session):
+        await session.execute(text("UPDATE t SET x = x + 1"))
+
+    scope = QueryScope("/issue status")
+    token = current_scope.set(scope)
+    try:
+        await queue.submit(operation)
+    finally:
+        current_scope.reset(token)
+    await queue.close()
+
+    # BEGIN and COMMIT belong to the batch, not to the operation.
+    assert (scope.queries, scope.rows) == (1, 3)
+
+
+def test_normalize_statement_folds_placeholder_lists():
+    assert normalize_statement("SELECT *\n  FROM t WHERE x IN (?, ?,?)") == (
+        "SELECT * FROM t WHERE x IN (?, ...)"
+    )
+
+
+def test_command_name_includes_subcommands_and_autocomplete():
+    interaction = MagicMock()
+    interaction.type = discord.InteractionType.autocomplete
+    interaction.data = {
+        "name": "issue",
+        "options": [
+            {
+                "type": 1,
+                "name": "view",
+                "options": [{"type": 3, "name": "project_name", "focused": True}],
+            }
+        ],
+    }
+    assert command_name(interaction) == "/issue view [autocomplete project_name]"
+
+    interaction.type = discord.InteractionType.application_command
+    assert command_name(interaction) == "/issue view"
+
+
+def test_format_dbstats_flags_commands_over_the_query_limit():
+    stats = QueryStats()
+    stats.record_query("SELECT 1", 0.002, 1)
+    for name, queries in (("/issue assign", 5), ("/issue view", 2)):
+        scope = QueryScope(name)
+        scope.queries = queries
+        stats.record_command(scope)
+
+    report = format_dbstats(stats, top=5, max_queries=3)
+
+    assert "SELECT 1" in report
+    assert "`/issue assign`: up to 5 queries" in report
+    assert "/issue view" not in report
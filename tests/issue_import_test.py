@@ -0,0 +1,79 @@
+import io
+
+import pytest
+
+from discord_issues.db.models import IssueStatus
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRepository
+from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+from discord_issues.transfer.issue_import import (
+    ImportFormatError,
+    detect_format,
+    import_issues,
+    parse_issues,
+)
+
+CSV = """title,description,status,assignees,tags
+Crash on login,"Two
+lines",closed,20;30,bug
+Dark mode,,In Progress,,"ui, bug"
+"""
+
+
+def test_parse_csv_handles_quoted_newlines_and_lists():
+    first, second = parse_issues(io.StringIO(CSV), "csv", "10")
+
+    assert first.description == "Two\nlines"
+    assert first.status == IssueStatus.CLOSED and first.closed_at is not None
+    assert first.assignee_ids == ("20", "30")
+    assert second.status == IssueStatus.IN_PROGRESS
+    assert second.tag_names == ("ui", "bug")
+    assert second.creator_id == "10"
+
+
+def test_parse_jsonl_reports_bad_line():
+    data = '{"title": "Ok", "creator_id": "1"}\n\n{"title": ""}\n'
+    records = parse_issues(io.StringIO(data), "jsonl")
+
+    assert next(records).title == "Ok"
+    with pytest.raises(ImportFormatError, match="Line 3: missing title"):
+        next(records)
+
+
+def test_detect_format():
+    assert detect_format("issues.CSV") == "csv"
+    assert detect_format("issues.jsonl") == "jsonl"
+    assert detect_format("issues.txt") is None
+
+
+@pytest.mark.asyncio
+async def test_import_issues_in_chunks(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    await TagRepository().create(name="bug", project_id=project.id)
+    issue_repo = IssueRepository()
+    await issue_repo.create_issue(project, creator, "Existing", "")
+
+    header, body = CSV.split("\n", 1)
+    records = parse_issues(io.StringIO(header + "\n" + body * 4), "csv", "10")
+    reported = []
+
+    async def progress(total):
+        reported.append(total)
+
+    total = await import_issues(project.id, records, chunk_size=4, progress=progress)
+    assert total == reported[-1] == 8
+    assert reported == [4, 8]
+
+    tags = await TagRepository().find_by_project_id(project.id)
+    assert sorted(tag.name for tag in tags) == ["bug", "ui"]
+    issue = await issue_repo.find_by_project_issue_id(project.id, 2)
+    assert issue.title == "Crash on login"
+    assert sorted(user.user_id for user in issue.assignees) == ["20", "30"]
+    assert [tag.name for tag in issue.tags] == ["bug"]
+
+    created = await issue_repo.create_issue(project, creator, "After", "")
+    assert created.project_issue_id == 10
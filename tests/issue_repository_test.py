@@ -0,0 +1,238 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from discord_issues.db.database import make_engine
+from discord_issues.db.models import Base, IssueStatus
+from discord_issues.db.writer import WriteQueue
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRepository, to_fts_query
+from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+
+
+@pytest.mark.asyncio
+async def test_create_issue_numbers_per_project(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project_repo = ProjectRepository()
+    alpha = await project_repo.create(name="Alpha", guild_id="1")
+    beta = await project_repo.create(name="Beta", guild_id="1")
+
+    issue_repo = IssueRepository()
+    first = await issue_repo.create_issue(alpha, creator, "First", "")
+    second = await issue_repo.create_issue(alpha, creator, "Second", "")
+    other = await issue_repo.create_issue(beta, creator, "Other", "")
+
+    assert (first.project_issue_id, second.project_issue_id) == (1, 2)
+    assert other.project_issue_id == 1
+
+
+@pytest.mark.asyncio
+async def test_find_by_project_issue_id_loads_relationships(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    assignee = await UserRepository().create(user_id="20")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+
+    issue_repo = IssueRepository()
+    created = await issue_repo.create_issue(project, creator, "Title", "Body")
+    assert await issue_repo.add_assignee(created.id, assignee)
+
+    issue = await issue_repo.find_by_project_issue_id(project.id, 1)
+    assert issue.title == "Title"
+    assert issue.creator.user_id == "10"
+    assert [user.user_id for user in issue.assignees] == ["20"]
+    assert issue.tags == []
+
+
+@pytest.mark.asyncio
+async def test_get_version_changes_on_assignment(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+
+    issue_repo = IssueRepository()
+    created = await issue_repo.create_issue(project, creator, "Title", "")
+    issue_id, updated_at = await issue_repo.get_version(project.id, 1)
+    await issue_repo.add_assignee(created.id, creator)
+
+    assert issue_id == created.id
+    assert (await issue_repo.get_version(project.id, 1))[1] > updated_at
+    assert await issue_repo.get_version(project.id, 2) is None
+
+
+@pytest.mark.asyncio
+async def test_add_assignee_twice_is_a_no_op(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+
+    issue_repo = IssueRepository()
+    created = await issue_repo.create_issue(project, creator, "Title", "")
+    assert await issue_repo.add_assignee(created.id, creator) is True
+    assert await issue_repo.add_assignee(created.id, creator) is False
+
+    issue = await issue_repo.find_by_project_issue_id(project.id, 1)
+    assert [user.user_id for user in issue.assignees] == ["10"]
+
+
+@pytest.mark.asyncio
+async def test_add_assignee_missing_issue(session_factory):
+    user = await UserRepository().create(user_id="20")
+    assert await IssueRepository().add_assignee(999, user) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_create_issue_numbers_are_unique(tmp_path, monkeypatch):
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    queue = WriteQueue(factory)
+    monkeypatch.setattr("discord_issues.repo.base_repository.write_queue", queue)
+    monkeypatch.setattr("discord_issues.repo.base_repository.ReadSessionLocal", factory)
+
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+
+    issue_repo = IssueRepository()
+    issues = await asyncio.gather(
+        *(issue_repo.create_issue(project, creator, f"#{n}", "") for n in range(10))
+    )
+    await queue.close()
+    await engine.dispose()
+
+    assert sorted(issue.project_issue_id for issue in issues) == list(range(1, 11))
+
+
+def test_to_fts_query_quotes_words_as_prefixes():
+    assert to_fts_query('log-in "fails" ') == '"log-in"* """fails"""*'
+    assert to_fts_query("   ") == ""
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matches_and_follows_edits(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    other = await ProjectRepository().create(name="Beta", guild_id="1")
+
+    issue_repo = IssueRepository()
+    login = await issue_repo.create_issue(
+        project, creator, "Login button", "The login form crashes on login"
+    )
+    await issue_repo.create_issue(project, creator, "Dark mode", "Mentions login once")
+    await issue_repo.create_issue(other, creator, "Login elsewhere", "")
+
+    results = await issue_repo.search(project.id, "login")
+    assert [issue.title for issue in results] == ["Login button", "Dark mode"]
+    second_page = await issue_repo.search(project.id, "log", limit=1, offset=1)
+    assert [issue.title for issue in second_page] == ["Dark mode"]
+
+    await issue_repo.update(login.id, title="Sign-in button", description="")
+    assert [i.title for i in await issue_repo.search(project.id, "sign")] == [
+        "Sign-in button"
+    ]
+    assert [i.title for i in await issue_repo.search(project.id, "login")] == [
+        "Dark mode"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_issues_filters_and_pages_by_keyset(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    assignee = await UserRepository().create(user_id="20")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    bug = await TagRepository().create(name="bug", project_id=project.id)
+
+    issue_repo = IssueRepository()
+    for n in range(1, 8):
+        issue = await issue_repo.create_issue(
+            project, creator, f"Issue {n}", "", tags=[bug] if n % 2 else []
+        )
+        if n <= 3:
+            await issue_repo.add_assignee(issue.id, assignee)
+    await issue_repo.update(issue.id, status=IssueStatus.CLOSED)  # issue #7
+
+    first = await issue_repo.list_issues(project.id, limit=4)
+    rest = await issue_repo.list_issues(
+        project.id, after=first[-1].project_issue_id, limit=4
+    )
+    assert [i.project_issue_id for i in first] == [1, 2, 3, 4]
+    assert [i.project_issue_id for i in rest] == [5, 6]
+
+    tagged = await issue_repo.list_issues(project.id, tag_name="bug")
+    assert [i.project_issue_id for i in tagged] == [1, 3, 5]
+    assert [tag.name for tag in tagged[0].tags] == ["bug"]
+
+    assigned = await issue_repo.list_issues(
+        project.id, assignee_id="20", tag_name="bug"
+    )
+    assert [i.project_issue_id for i in assigned] == [1, 3]
+    assert [user.user_id for user in assigned[0].assignees] == ["20"]
+
+    closed = await issue_repo.list_issues(project.id, status=IssueStatus.CLOSED)
+    assert [i.project_issue_id for i in closed] == [7]
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_are_set_based(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    bug = await TagRepository().create(name="bug", project_id=project.id)
+    ui = await TagRepository().create(name="ui", project_id=project.id)
+    issue_repo = IssueRepository()
+    for number in range(1, 7):
+        await issue_repo.create_issue(
+            project, creator, f"Issue {number}", "", tags=[bug] if number > 3 else []
+        )
+
+    assert await issue_repo.bulk_tag(project.id, ui.id, numbers=[(1, 2), (5, 5)]) == 3
+    assert await issue_repo.bulk_tag(project.id, ui.id, numbers=[(1, 2)]) == 0
+    assert (
+        await issue_repo.bulk_set_status(
+            project.id, IssueStatus.CLOSED, tag_name="bug", numbers=[(5, 6)]
+        )
+        == 2
+    )
+    assert (
+        await issue_repo.bulk_assign(project.id, "20", status=IssueStatus.CLOSED) == 2
+    )
+    assert (
+        await issue_repo.bulk_set_status(project.id, IssueStatus.OPEN, numbers=[(6, 6)])
+        == 1
+    )
+
+    closed = await issue_repo.find_by_project_issue_id(project.id, 5)
+    assert closed.status == IssueStatus.CLOSED and closed.closed_at is not None
+    assert [user.user_id for user in closed.assignees] == ["20"]
+    assert sorted(tag.name for tag in closed.tags) == ["bug", "ui"]
+    reopened = await issue_repo.find_by_project_issue_id(project.id, 6)
+    assert reopened.status == IssueStatus.OPEN and reopened.closed_at is None
+    untouched = await issue_repo.find_by_project_issue_id(project.id, 3)
+    assert untouched.tags == [] and untouched.assignees == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_only_bumps_newly_tagged_issues(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    ui = await TagRepository().create(name="ui", project_id=project.id)
+    issue_repo = IssueRepository()
+    for number in range(1, 4):
+        await issue_repo.create_issue(project, creator, f"Issue {number}", "")
+
+    assert await issue_repo.bulk_tag(project.id, ui.id, numbers=[(1, 2)]) == 2
+    versions = [(await issue_repo.get_version(project.id, n))[1] for n in (1, 2, 3)]
+
+    assert await issue_repo.bulk_tag(project.id, ui.id, numbers=[(1, 3)]) == 1
+    after = [(await issue_repo.get_version(project.id, n))[1] for n in (1, 2, 3)]
+    assert after[:2] == versions[:2]
+    assert after[2] > versions[2]
@@ -0,0 +1,274 @@
+import datetime
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from discord import app_commands
+
+from discord_issues.cogs.issue_command import (
+    issue_autocomplete,
+    parse_issue_numbers,
+    IssueCog,
+    IssuePageView,
+)
+from discord_issues.db.models import IssueStatus
+
+
+def make_issue(number, title, status=IssueStatus.OPEN):
+    issue = MagicMock()
+    issue.project_issue_id = number
+    issue.title = title
+    issue.status = status
+    return issue
+
+
+@pytest.mark.asyncio
+async def test_issue_autocomplete_tops_up_with_full_text_matches(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 42
+    mock_interaction.namespace.project_name = "TestProject"
+
+    mock_project = MagicMock()
+    mock_project.id = 7
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = mock_project
+    mock_issue_repository = mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    )
+    mock_issue_repository.return_value.find_titles_by_project.return_value = [
+        (1, "Crash on login"),
+        (2, "Dark mode"),
+    ]
+    mock_issue_repository.return_value.search.return_value = [
+        make_issue(1, "Crash on login"),
+        make_issue(2, "Dark mode"),
+    ]
+
+    results = await issue_autocomplete(mock_interaction, "login")
+
+    assert all(isinstance(choice, app_commands.Choice) for choice in results)
+    assert [c.value for c in results] == ["1", "2"]
+    assert results[1].name == "#2: Dark mode"
+
+
+@pytest.mark.asyncio
+async def test_search_issues_project_not_found(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = None
+
+    bot = MagicMock()
+    cog = IssueCog(bot)
+    await cog.search_issues.callback(cog, mock_interaction, "NoProject", "login")
+
+    mock_interaction.followup.send.assert_called_once_with(
+        "❌ Project 'NoProject' not found."
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_issues_pages_results(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.name = "TestProject"
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = mock_project
+    mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    ).return_value.search.return_value = [
+        make_issue(n, f"Issue {n}") for n in range(1, 12)
+    ]
+
+    bot = MagicMock()
+    cog = IssueCog(bot)
+    await cog.search_issues.callback(cog, mock_interaction, "TestProject", "issue")
+
+    mock_interaction.followup.send.assert_called_once()
+    args, kwargs = mock_interaction.followup.send.call_args
+    embed, view = kwargs.get("embed"), kwargs.get("view")
+    assert "**#1** Issue 1 — `Open`" in embed.description
+    assert "Issue 11" not in embed.description
+    assert view.previous_button.disabled
+    assert not view.next_button.disabled
+
+
+@pytest.mark.asyncio
+async def test_list_issues_pages_with_keyset_cursor(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.response.edit_message = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.name = "TestProject"
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = mock_project
+    mock_issue_repository = mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    )
+    mock_issue_repository.return_value.list_issues.side_effect = [
+        [make_issue(n, f"Issue {n}") for n in range(1, 12)],
+        [make_issue(n, f"Issue {n}") for n in range(11, 13)],
+    ]
+
+    bot = MagicMock()
+    cog = IssueCog(bot)
+    await cog.list_issues.callback(
+        cog, mock_interaction, "TestProject", None, IssueStatus.OPEN, "bug"
+    )
+
+    args, kwargs = mock_interaction.followup.send.call_args
+    view = kwargs.get("view")
+    assert "Unassigned" in kwargs.get("embed").description
+
+    await view.next_button.callback(mock_interaction)
+
+    calls = mock_issue_repository.return_value.list_issues.call_args_list
+    assert calls[0].kwargs["after"] is None
+    assert calls[1].kwargs["after"] == 10
+    assert calls[1].kwargs["status"] == IssueStatus.OPEN
+    assert calls[1].kwargs["tag_name"] == "bug"
+    assert view.next_button.disabled
+
+
+@pytest.mark.asyncio
+async def test_view_issue_serves_cached_embed(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+
+    mock_project = MagicMock()
+    mock_project.id = 1
+    mock_project.name = "TestProject"
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = mock_project
+    updated_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    issue = make_issue(3, "Crash on login")
+    issue.id = 30
+    issue.creator_id = "10"
+    issue.description = "Steps"
+    issue.assignees = []
+    issue.tags = []
+    issue.created_at = issue.updated_at = updated_at
+    mock_issue_repository = mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    ).return_value
+    mock_issue_repository.get_version.return_value = (30, updated_at)
+    mock_issue_repository.find_by_project_issue_id.return_value = issue
+
+    cog = IssueCog(MagicMock())
+    await cog.view_issue.callback(cog, mock_interaction, "TestProject", 3)
+    await cog.view_issue.callback(cog, mock_interaction, "TestProject", 3)
+
+    mock_issue_repository.find_by_project_issue_id.assert_awaited_once_with(1, 3)
+    first, second = mock_interaction.followup.send.call_args_list
+    assert first.kwargs["embed"].to_dict() == second.kwargs["embed"].to_dict()
+    assert first.kwargs["embed"].fields[1].value == "<@10>"
+
+    # A newer version renders the issue again.
+    mock_issue_repository.get_version.return_value = (
+        30,
+        updated_at + datetime.timedelta(seconds=1),
+    )
+    await cog.view_issue.callback(cog, mock_interaction, "TestProject", 3)
+    assert mock_issue_repository.find_by_project_issue_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_import_issues_rejects_unknown_file_type(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = MagicMock()
+    mock_import = mocker.patch("discord_issues.transfer.issue_import.import_issues")
+    attachment = MagicMock()
+    attachment.filename = "issues.xlsx"
+
+    cog = IssueCog(MagicMock())
+    await cog.import_issues.callback(cog, mock_interaction, "TestProject", attachment)
+
+    mock_interaction.followup.send.assert_called_once_with(
+        "❌ Unsupported file type. Upload a `.csv` or `.jsonl` file."
+    )
+    mock_import.assert_not_called()
+
+
+def test_parse_issue_numbers():
+    assert parse_issue_numbers("1-3, #8,12 - 14") == [(1, 3), (8, 8), (12, 14)]
+    for text in ["", "3-1", "a", "0"]:
+        with pytest.raises(ValueError):
+            parse_issue_numbers(text)
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_requires_a_selection(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+    mock_issue_repository = mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    ).return_value
+
+    cog = IssueCog(MagicMock())
+    await cog.bulk_status_issues.callback(
+        cog, mock_interaction, "TestProject", IssueStatus.CLOSED
+    )
+
+    mock_interaction.followup.send.assert_called_once_with(
+        "❌ Select issues by number, status or tag."
+    )
+    mock_issue_repository.bulk_set_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_assign_issue_reports_existing_assignment(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+    mocker.patch(
+        "discord_issues.cogs.issue_command.ProjectRepository", autospec=True
+    ).return_value.find_by_name.return_value = MagicMock()
+    mocker.patch("discord_issues.cogs.issue_command.UserRepository", autospec=True)
+    mock_issue_repository = mocker.patch(
+        "discord_issues.cogs.issue_command.IssueRepository", autospec=True
+    ).return_value
+    mock_issue_repository.find_by_project_issue_id.return_value = make_issue(3, "T")
+    mock_issue_repository.add_assignee.return_value = False
+    user = MagicMock()
+    user.mention = "<@20>"
+
+    cog = IssueCog(MagicMock())
+    await cog.assign_issue.callback(cog, mock_interaction, "TestProject", 3, user)
+
+    mock_interaction.followup.send.assert_called_once_with(
+        "<@20> is already assigned to issue #3."
+    )
+
+
+@pytest.mark.asyncio
+async def test_page_view_without_fetch_page_cannot_be_created():
+    class Unpaged(IssuePageView):
+        pass
+
+    with pytest.raises(TypeError, match="fetch_page"):
+        Unpaged(MagicMock(), MagicMock(), "Issues")
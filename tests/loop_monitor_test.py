@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from discord_issues.db.instrumentation import QueryScope, current_scope
+from discord_issues.metrics.exporter import render_metrics
+from discord_issues.metrics.loop_monitor import NO_COMMAND, LoopLagMonitor
+
+
+def blocking_repository_call():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_logged_with_stack_and_command(caplog):
+    monitor = LoopLagMonitor(threshold=0.1, interval=0.01)
+    monitor.start()
+    token = current_scope.set(QueryScope("/issue view"))
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING):
+            blocking_repository_call()
+            await asyncio.sleep(0.05)
+    finally:
+        current_scope.reset(token)
+        await monitor.close()
+
+    assert monitor.stalls == {"/issue view": 1}
+    assert monitor.stalled_seconds["/issue view"] >= 0.2
+    assert "Event loop blocked" in caplog.text
+    assert "during /issue view" in caplog.text
+    assert "blocking_repository_call" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_lag_is_sampled_and_exported():
+    monitor = LoopLagMonitor(threshold=1.0, interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.close()
+
+    assert monitor.lag.count > 0
+    assert monitor.stalls == {}
+    text = render_metrics(monitor=monitor)
+    assert f"discord_event_loop_lag_seconds_count {monitor.lag.count}" in text
+
+
+@pytest.mark.asyncio
+async def test_stalls_outside_commands_share_one_label(caplog):
+    monitor = LoopLagMonitor(threshold=0.1, interval=0.01)
+    monitor.start()
+
+    async def unscoped():
+        blocking_repository_call()
+
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING):
+            await asyncio.create_task(unscoped(), name="Task-1234")
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.close()
+
+    assert monitor.stalls == {NO_COMMAND: 1}
+    assert "during task Task-1234" in caplog.text
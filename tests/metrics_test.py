@@ -0,0 +1,125 @@
+import inspect
+from unittest.mock import MagicMock
+
+import aiohttp
+import discord
+import pytest
+from aiohttp.test_utils import unused_port
+
+from discord_issues.command_tree import InstrumentedCommandTree
+from discord_issues.db.instrumentation import QueryStats
+from discord_issues.metrics.exporter import MetricsServer, render_metrics
+from discord_issues.metrics.interaction_metrics import (
+    Histogram,
+    InteractionMetrics,
+    interaction_metrics,
+)
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3)]
+    assert (histogram.count, histogram.sum) == (4, 2.65)
+
+
+def test_record_tracks_followups_errors_and_missed_deadlines():
+    metrics = InteractionMetrics()
+    metrics.record(
+        "/issue view", duration=1.5, acknowledged_after=0.2, deferred=True, failed=False
+    )
+    metrics.record(
+        "/issue view",
+        duration=4.0,
+        acknowledged_after=None,
+        deferred=False,
+        failed=True,
+    )
+
+    assert metrics.duration["/issue view"].count == 2
+    assert metrics.ack["/issue view"].count == 1
+    assert metrics.followup["/issue view"].sum == pytest.approx(1.3)
+    assert metrics.errors == {"/issue view": 1}
+    assert metrics.missed_deadline == {"/issue view": 1}
+
+
+def test_render_metrics_uses_the_prometheus_text_format():
+    metrics = InteractionMetrics()
+    metrics.record(
+        '/tag "x"', duration=0.3, acknowledged_after=0.3, deferred=False, failed=True
+    )
+
+    text = render_metrics(0.042, metrics, QueryStats())
+
+    assert "# TYPE discord_interaction_duration_seconds histogram" in text
+    assert (
+        'discord_interaction_duration_seconds_bucket{command="/tag \\"x\\"",le="0.5"} 1'
+        in text
+    )
+    assert 'discord_interaction_ack_seconds_count{command="/tag \\"x\\""} 1' in text
+    assert 'discord_interaction_errors_total{command="/tag \\"x\\""} 1' in text
+    assert "discord_gateway_latency_seconds 0.042" in text
+    assert "discord_gateway_latency_seconds" not in render_metrics(
+        float("nan"), metrics, QueryStats()
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_server_serves_the_exposition():
+    bot = MagicMock()
+    bot.latency = 0.1
+    port = unused_port()
+    server = MetricsServer(bot, "127.0.0.1", port)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                body = await response.text()
+                content_type = response.headers["Content-Type"]
+    finally:
+        await server.close()
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "discord_gateway_latency_seconds 0.1" in body
+
+
+@pytest.mark.asyncio
+async def test_tree_records_acknowledgement_and_duration(mocker):
+    async def handle(tree, interaction):
+        # Stand in for a handler that defers half a second after receipt.
+        response = interaction._cs_response
+        response.acknowledged_at = response.received_at + 0.5
+        response._response_type = (
+            discord.InteractionResponseType.deferred_channel_message
+        )
+
+    mocker.patch.object(discord.app_commands.CommandTree, "_call", handle)
+    interaction = MagicMock()
+    interaction.type = discord.InteractionType.application_command
+    interaction.data = {"name": "issue", "options": [{"type": 1, "name": "view"}]}
+    interaction.command_failed = False
+    tree = InstrumentedCommandTree(discord.Client(intents=discord.Intents.none()))
+
+    interaction_metrics.clear()
+    try:
+        await tree._call(interaction)
+        assert interaction_metrics.ack["/issue view"].sum == pytest.approx(0.5)
+        assert interaction_metrics.followup["/issue view"].count == 1
+        assert interaction_metrics.errors == {}
+    finally:
+        interaction_metrics.clear()
+
+
+def test_private_discord_api_used_by_the_command_tree_is_unchanged():
+    # InstrumentedCommandTree relies on these; update it before the pin.
+    call = inspect.signature(discord.app_commands.CommandTree._call)
+    assert list(call.parameters) == ["self", "interaction"]
+    assert inspect.iscoroutinefunction(discord.app_commands.CommandTree._call)
+    assert "_cs_response" in discord.Interaction.__slots__
+    response = vars(discord.Interaction)["response"]
+    assert isinstance(response, discord.utils.CachedSlotProperty)
+    assert response.name == "_cs_response"
+    init = inspect.signature(discord.InteractionResponse.__init__)
+    assert list(init.parameters) == ["self", "parent"]
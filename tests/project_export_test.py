@@ -0,0 +1,53 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRepository
+from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+from discord_issues.transfer.issue_import import parse_issues
+from discord_issues.transfer.project_export import export_issues
+
+
+async def _seed_project():
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    assignee = await UserRepository().create(user_id="20")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    tag = await TagRepository().create(name="bug, ui", project_id=project.id)
+    issue_repo = IssueRepository()
+    first = await issue_repo.create_issue(project, creator, "First", "Body", [], [tag])
+    await issue_repo.add_assignee(first.id, assignee)
+    await issue_repo.create_issue(project, creator, "Second", "")
+    return project
+
+
+@pytest.mark.asyncio
+async def test_export_jsonl_streams_issues_with_links(session_factory):
+    project = await _seed_project()
+    fp = io.BytesIO()
+
+    assert await export_issues(project.id, fp, "jsonl") == 2
+
+    first, second = map(json.loads, gzip.decompress(fp.getvalue()).splitlines())
+    assert first["title"] == "First" and first["status"] == "Open"
+    assert first["assignees"] == ["20"]
+    assert first["tags"] == ["bug, ui"]
+    assert second["project_issue_id"] == 2 and second["tags"] == []
+
+
+@pytest.mark.asyncio
+async def test_export_csv_round_trips_through_import(session_factory):
+    project = await _seed_project()
+    fp = io.BytesIO()
+    await export_issues(project.id, fp, "csv")
+
+    text = io.StringIO(gzip.decompress(fp.getvalue()).decode(), newline="")
+    first, second = parse_issues(text, "csv")
+    assert first.title == "First" and first.assignee_ids == ("20",)
+    assert first.creator_id == "10"
+    assert second.title == "Second"
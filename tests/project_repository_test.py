@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.db.models import IssueStatus
+from discord_issues.repo.issue_repository import IssueRecord, IssueRepository
+from discord_issues.repo.project_repository import (
+    ProjectRepository,
+    project_name_cache,
+)
+from discord_issues.repo.purger import ProjectPurger
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+
+
+@pytest.mark.asyncio
+async def test_find_by_name_is_served_from_cache(session_factory):
+    await GuildRepository().create(guild_id="1")
+    project_repo = ProjectRepository()
+    created = await project_repo.create(name="Alpha", guild_id="1")
+
+    first = await project_repo.find_by_name("1", "Alpha")
+    second = await project_repo.find_by_name("1", "Alpha")
+
+    assert first.id == second.id == created.id
+    assert (project_name_cache.hits, project_name_cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_name_drops_renamed_project(session_factory):
+    await GuildRepository().create(guild_id="1")
+    project_repo = ProjectRepository()
+    project = await project_repo.create(name="Alpha", guild_id="1")
+    await project_repo.find_by_name("1", "Alpha")
+
+    await project_repo.update(project.id, name="Beta")
+    project_repo.invalidate_name("1", "Alpha")
+
+    assert await project_repo.find_by_name("1", "Alpha") is None
+    assert (await project_repo.find_by_name("1", "Beta")).id == project.id
+
+
+async def _seed_project_with_issues(count):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project_repo = ProjectRepository()
+    project = await project_repo.create(name="Alpha", guild_id="1")
+    tag = await TagRepository().create(name="bug", project_id=project.id)
+    issue_repo = IssueRepository()
+    for number in range(count):
+        issue = await issue_repo.create_issue(
+            project, creator, f"Issue {number}", "", tags=[tag]
+        )
+        await issue_repo.add_assignee(issue.id, creator)
+    return project
+
+
+async def _count_rows(session_factory):
+    async with session_factory() as session:
+        return {
+            table: await session.scalar(text(f"SELECT count(*) FROM {table}"))
+            for table in ("projects", "issues", "tags", "issue_tags", "issues_fts")
+        }
+
+
+@pytest.mark.asyncio
+async def test_soft_delete_hides_project_and_frees_name(session_factory):
+    project = await _seed_project_with_issues(1)
+    project_repo = ProjectRepository()
+
+    assert await project_repo.soft_delete(project.id)
+    assert not await project_repo.soft_delete(project.id)
+
+    assert await project_repo.find_by_name("1", "Alpha") is None
+    assert await project_repo.find_by_guild_id("1") == []
+    replacement = await project_repo.create(name="Alpha", guild_id="1")
+    assert (await project_repo.find_by_name("1", "Alpha")).id == replacement.id
+
+
+@pytest.mark.asyncio
+async def test_purge_deleted_removes_rows_in_chunks(session_factory):
+    project = await _seed_project_with_issues(5)
+    project_repo = ProjectRepository()
+    await project_repo.soft_delete(project.id)
+
+    chunks = []
+    while removed := await project_repo.purge_deleted(batch_size=2):
+        chunks.append(removed)
+
+    # Three chunks of issues, then the tag, then the project itself.
+    assert chunks == [2, 2, 1, 1, 1]
+    assert set((await _count_rows(session_factory)).values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_delete_cascades_in_the_database(session_factory):
+    project = await _seed_project_with_issues(3)
+
+    assert await ProjectRepository().delete(project.id)
+
+    assert set((await _count_rows(session_factory)).values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_project_purger_runs_in_background(session_factory):
+    project = await _seed_project_with_issues(3)
+    await ProjectRepository().soft_delete(project.id)
+    # The pause keeps the purger sleeping, not writing, when it is closed.
+    purger = ProjectPurger(batch_size=2, pause=0.05)
+
+    purger.wake()
+    # Only poll the counter: the test database has a single shared connection.
+    async with asyncio.timeout(5):
+        while purger.purged < 5:
+            await asyncio.sleep(0.01)
+    await purger.close()
+
+    assert set((await _count_rows(session_factory)).values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_issue_counts_follow_every_write_path(session_factory):
+    project = await _seed_project_with_issues(3)
+    other = await ProjectRepository().create(name="Beta", guild_id="1")
+    issue_repo = IssueRepository()
+    project_repo = ProjectRepository()
+
+    await issue_repo.update(1, status=IssueStatus.IN_PROGRESS)
+    await issue_repo.bulk_set_status(project.id, IssueStatus.CLOSED, numbers=[(2, 3)])
+    await issue_repo.import_issues(
+        project.id, [IssueRecord("Imported", None, "10")] * 2
+    )
+    await issue_repo.delete(1)
+
+    counts = await project_repo.issue_counts([project.id, other.id])
+    assert counts[project.id] == {
+        IssueStatus.OPEN: 2,
+        IssueStatus.IN_PROGRESS: 0,
+        IssueStatus.CLOSED: 2,
+    }
+    assert counts[other.id] == dict.fromkeys(IssueStatus, 0)
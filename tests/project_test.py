@@ -4,6 +4,7 @@ from discord import app_commands
 
 from discord_issues.cogs.project_command import project_autocomplete
 from discord_issues.cogs.project_command import ProjectCog
+from discord_issues.db.models import IssueStatus
 
 
 @pytest.mark.asyncio
@@ -12,7 +13,7 @@ async def test_project_autocomplete_returns_matching_projects(mocker):
     mock_interaction.guild_id = 123
 
     MockProjectRepo = mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     )
     mock_project1 = MagicMock()
     mock_project1.name = "Alpha"
@@ -38,11 +39,11 @@ async def test_new_project_duplicate_name(mocker):
 
     # Patch guild repo
     mocker.patch(
-        "discord_issues.cogs.project_command.GuildRepository"
-    ).return_value.get.return_value = MagicMock()
+        "discord_issues.cogs.project_command.GuildRepository", autospec=True
+    ).return_value.get_or_create.return_value = MagicMock()
     # Patch project repo: find_by_name returns a project (duplicate)
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = MagicMock()
 
     bot = MagicMock()
@@ -63,18 +64,17 @@ async def test_new_project_success(mocker):
 
     # Patch guild repo
     mocker.patch(
-        "discord_issues.cogs.project_command.GuildRepository"
-    ).return_value.get.return_value = MagicMock()
+        "discord_issues.cogs.project_command.GuildRepository", autospec=True
+    ).return_value.get_or_create.return_value = MagicMock()
     # Patch project repo: find_by_name returns None (no duplicate)
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.find_by_name.return_value = None
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    )
+    mock_project_repository.return_value.find_by_name.return_value = None
     # Patch project repo: create returns a new project
     mock_new_project = MagicMock()
     mock_new_project.name = "Alpha"
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.create.return_value = mock_new_project
+    mock_project_repository.return_value.create.return_value = mock_new_project
 
     bot = MagicMock()
     cog = ProjectCog(bot)
@@ -96,16 +96,15 @@ async def test_new_project_exception(mocker):
 
     # Patch guild repo
     mocker.patch(
-        "discord_issues.cogs.project_command.GuildRepository"
-    ).return_value.get.return_value = MagicMock()
+        "discord_issues.cogs.project_command.GuildRepository", autospec=True
+    ).return_value.get_or_create.return_value = MagicMock()
     # Patch project repo: find_by_name returns None (no duplicate)
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.find_by_name.return_value = None
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    )
+    mock_project_repository.return_value.find_by_name.return_value = None
     # Patch project repo: create raises exception
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.create.side_effect = Exception("DB error")
+    mock_project_repository.return_value.create.side_effect = Exception("DB error")
 
     bot = MagicMock()
     cog = ProjectCog(bot)
@@ -125,7 +124,7 @@ async def test_list_projects_none(mocker):
 
     # Patch project repo: find_by_guild_id returns empty list
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_guild_id.return_value = []
 
     bot = MagicMock()
@@ -151,9 +150,19 @@ async def test_list_projects_some(mocker):
     mock_project2 = MagicMock()
     mock_project2.name = "Beta"
     mock_project2.description = None
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.find_by_guild_id.return_value = [mock_project1, mock_project2]
+    mock_project1.id = 1
+    mock_project2.id = 2
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    ).return_value
+    mock_project_repository.find_by_guild_id.return_value = [
+        mock_project1,
+        mock_project2,
+    ]
+    mock_project_repository.issue_counts.return_value = {
+        1: {IssueStatus.OPEN: 2, IssueStatus.IN_PROGRESS: 1, IssueStatus.CLOSED: 0},
+        2: dict.fromkeys(IssueStatus, 0),
+    }
 
     bot = MagicMock()
     cog = ProjectCog(bot)
@@ -165,10 +174,46 @@ async def test_list_projects_some(mocker):
     assert embed.title == "Projects in this Server"
     assert "Alpha" in embed.fields[0].name
     assert "Desc1" in embed.fields[0].value
+    assert "🔴 2 open · 🟡 1 in progress · 🟢 0 closed" in embed.fields[0].value
     assert "Beta" in embed.fields[1].name
     assert "No description provided." in embed.fields[1].value
 
 
+@pytest.mark.asyncio
+async def test_project_stats_totals_all_projects(mocker):
+    mock_interaction = MagicMock()
+    mock_interaction.guild_id = 123
+    mock_interaction.response.defer = AsyncMock()
+    mock_interaction.followup.send = AsyncMock()
+
+    mock_project1 = MagicMock()
+    mock_project1.id = 1
+    mock_project1.name = "Alpha"
+    mock_project2 = MagicMock()
+    mock_project2.id = 2
+    mock_project2.name = "Beta"
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    ).return_value
+    mock_project_repository.find_by_guild_id.return_value = [
+        mock_project1,
+        mock_project2,
+    ]
+    mock_project_repository.issue_counts.return_value = {
+        1: {IssueStatus.OPEN: 2, IssueStatus.IN_PROGRESS: 1, IssueStatus.CLOSED: 4},
+        2: {IssueStatus.OPEN: 1, IssueStatus.IN_PROGRESS: 0, IssueStatus.CLOSED: 3},
+    }
+
+    cog = ProjectCog(MagicMock())
+    await cog.project_stats.callback(cog, mock_interaction)
+
+    embed = mock_interaction.followup.send.call_args.kwargs["embed"]
+    assert embed.description == (
+        "**Total:** 🔴 3 open · 🟡 1 in progress · 🟢 7 closed"
+    )
+    assert [field.name for field in embed.fields] == ["📂 Alpha", "📂 Beta"]
+
+
 @pytest.mark.asyncio
 async def test_edit_project_no_changes(mocker):
     mock_interaction = MagicMock()
@@ -192,7 +237,7 @@ async def test_edit_project_not_found(mocker):
     mock_interaction.followup.send = AsyncMock()
 
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = None
 
     bot = MagicMock()
@@ -214,7 +259,7 @@ async def test_edit_project_name_collision(mocker):
     mock_project = MagicMock()
     mock_project.id = 1
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.side_effect = [mock_project, MagicMock()]
 
     bot = MagicMock()
@@ -234,12 +279,11 @@ async def test_edit_project_success(mocker):
 
     mock_project = MagicMock()
     mock_project.id = 1
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.find_by_name.side_effect = [mock_project, None]
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.update.return_value = None
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    )
+    mock_project_repository.return_value.find_by_name.side_effect = [mock_project, None]
+    mock_project_repository.return_value.update.return_value = None
 
     bot = MagicMock()
     cog = ProjectCog(bot)
@@ -249,6 +293,9 @@ async def test_edit_project_success(mocker):
     embed = kwargs.get("embed")
     assert embed.title == "✅ Project Updated"
     assert "Alpha" in embed.description
+    mock_project_repository.return_value.invalidate_name.assert_called_once_with(
+        "123", "Alpha"
+    )
 
 
 @pytest.mark.asyncio
@@ -260,18 +307,17 @@ async def test_edit_project_exception(mocker):
 
     mock_project = MagicMock()
     mock_project.id = 1
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.find_by_name.side_effect = [mock_project, None]
-    mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
-    ).return_value.update.side_effect = Exception("DB error")
+    mock_project_repository = mocker.patch(
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
+    )
+    mock_project_repository.return_value.find_by_name.side_effect = [mock_project, None]
+    mock_project_repository.return_value.update.side_effect = Exception("DB error")
 
     bot = MagicMock()
     cog = ProjectCog(bot)
     await cog.edit_project.callback(cog, mock_interaction, "Alpha", "Beta", "desc2")
     mock_interaction.followup.send.assert_called_once_with(
-        "❌ A project named 'Beta' already exists."
+        "❌ An unexpected error occurred while updating the project."
     )
 
 
@@ -282,7 +328,7 @@ async def test_delete_project_not_found(mocker):
     mock_interaction.response.send_message = AsyncMock()
 
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = None
 
     bot = MagicMock()
@@ -304,7 +350,7 @@ async def test_delete_project_found(mocker):
     mock_project.id = 1
     mock_project.name = "Alpha"
     mocker.patch(
-        "discord_issues.cogs.project_command.ProjectRepository"
+        "discord_issues.cogs.project_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
 
     bot = MagicMock()
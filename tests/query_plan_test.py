@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy import event
+
+from discord_issues.db.models import IssueStatus
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRecord, IssueRepository
+from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+
+
+async def _seed():
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    tag = await TagRepository().create(name="bug", project_id=project.id)
+    issue = await IssueRepository().create_issue(
+        project, creator, "Title", "Body", tags=[tag]
+    )
+    return project, creator, tag, issue
+
+
+async def _exercise_repositories(project, creator, tag, issue):
+    """Calls every repository method that targets a single row or parent."""
+    guild_repo = GuildRepository()
+    user_repo = UserRepository()
+    project_repo = ProjectRepository()
+    tag_repo = TagRepository()
+    issue_repo = IssueRepository()
+
+    await guild_repo.get("1")
+    await guild_repo.get_or_create(guild_id="1")
+    await user_repo.get_or_create(user_id="10")
+    await user_repo.get("10")
+    await project_repo.get(project.id)
+    await project_repo.find_by_name("1", "Alpha")
+    await project_repo.find_by_guild_id("1")
+    await project_repo.purge_deleted()
+    await project_repo.issue_counts([project.id])
+    await project_repo.update(project.id, description="Updated")
+    await tag_repo.find_by_name(project.id, "bug")
+    await tag_repo.find_by_project_id(project.id)
+    await issue_repo.find_by_project_issue_id(project.id, issue.project_issue_id)
+    await issue_repo.get_version(project.id, issue.project_issue_id)
+    await issue_repo.find_titles_by_project(project.id)
+    await issue_repo.search(project.id, "tit")
+    await issue_repo.list_issues(project.id, after=0)
+    [row async for row in issue_repo.stream_for_export(project.id)]
+    await issue_repo.list_issues(project.id, assignee_id="10", tag_name="bug")
+    await issue_repo.create_issue(project, creator, "Second", "")
+    await issue_repo.add_assignee(issue.id, creator)
+    await issue_repo.import_issues(
+        project.id, [IssueRecord("Imported", None, "10", tag_names=("bug",))]
+    )
+    await issue_repo.update(issue.id, title="Renamed")
+    await issue_repo.bulk_set_status(
+        project.id, IssueStatus.CLOSED, numbers=[(1, 2)], tag_name="bug"
+    )
+    await issue_repo.bulk_assign(project.id, "10", status=IssueStatus.CLOSED)
+    await tag_repo.delete_by_names(project.id, ["bug", "missing"])
+    await tag_repo.delete(tag.id)
+    await project_repo.soft_delete(project.id)
+    # A purge chunk with a deleted project removes its issues and tags.
+    await project_repo.purge_deleted()
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(session_factory):
+    """Fails if any repository statement falls back to a full table scan."""
+    project, creator, tag, issue = await _seed()
+
+    engine = session_factory.kw["bind"]
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            # One set of parameters is enough to plan an executemany.
+            statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await _exercise_repositories(project, creator, tag, issue)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert statements
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            # FTS5 lookups are reported as a SCAN of the virtual table's index.
+            scans = [
+                row.detail
+                for row in result
+                if row.detail.startswith("SCAN ")
+                and "VIRTUAL TABLE INDEX" not in row.detail
+            ]
+            assert not scans, f"{scans} in query plan of:\n{statement}"
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import event
+
+from discord_issues.repo.guild_repository import GuildRepository
+from discord_issues.repo.issue_repository import IssueRepository
+from discord_issues.repo.project_repository import ProjectRepository
+from discord_issues.repo.tag_repository import TagRepository
+from discord_issues.repo.user_repository import UserRepository
+
+
+@pytest.mark.asyncio
+async def test_delete_by_names_detaches_tags_with_two_statements(session_factory):
+    await GuildRepository().create(guild_id="1")
+    creator = await UserRepository().create(user_id="10")
+    project = await ProjectRepository().create(name="Alpha", guild_id="1")
+    tag_repo = TagRepository()
+    bug = await tag_repo.create(name="bug", project_id=project.id)
+    ui = await tag_repo.create(name="ui", project_id=project.id)
+    docs = await tag_repo.create(name="docs", project_id=project.id)
+    issue_repo = IssueRepository()
+    for number in range(3):
+        await issue_repo.create_issue(
+            project, creator, f"Issue {number}", "", tags=[bug, ui, docs]
+        )
+
+    engine = session_factory.kw["bind"]
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("BEGIN"):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        deleted = await tag_repo.delete_by_names(project.id, ["bug", "ui", "none"])
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert sorted(deleted) == ["bug", "ui"]
+    assert len(statements) == 2
+    issue = await issue_repo.find_by_project_issue_id(project.id, 1)
+    assert [tag.name for tag in issue.tags] == ["docs"]
+    assert [tag.name for tag in await tag_repo.find_by_project_id(project.id)] == [
+        "docs"
+    ]
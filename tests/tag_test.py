@@ -17,9 +17,11 @@ async def test_tag_autocomplete_returns_tags(mocker):
     mock_interaction.namespace = mock_namespace
 
     mock_project_repo = mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
+    )
+    mock_tag_repo = mocker.patch(
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
     )
-    mock_tag_repo = mocker.patch("discord_issues.cogs.tag_command.TagRepository")
 
     mock_project = MagicMock()
     mock_project.id = 99
@@ -54,9 +56,11 @@ async def test_tag_new_creates_tag(mocker):
     mock_interaction.followup.send = AsyncMock()
 
     mock_project_repo = mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
+    )
+    mock_tag_repo = mocker.patch(
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
     )
-    mock_tag_repo = mocker.patch("discord_issues.cogs.tag_command.TagRepository")
 
     mock_project = MagicMock()
     mock_project.id = 1
@@ -92,9 +96,9 @@ async def test_list_tags_project_not_found(mocker):
 
     # Patch repositories
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = None
-    mocker.patch("discord_issues.cogs.tag_command.TagRepository")
+    mocker.patch("discord_issues.cogs.tag_command.TagRepository", autospec=True)
 
     bot = MagicMock()
     cog = TagCog(bot)
@@ -117,10 +121,10 @@ async def test_list_tags_no_tags(mocker):
     mock_project.id = 1
     mock_project.name = "TestProject"
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
     mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
     ).return_value.find_by_project_id.return_value = []
 
     bot = MagicMock()
@@ -150,10 +154,10 @@ async def test_list_tags_with_tags(mocker):
     mock_tag2.name = "Beta"
 
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
     mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
     ).return_value.find_by_project_id.return_value = [mock_tag1, mock_tag2]
 
     bot = MagicMock()
@@ -176,9 +180,9 @@ async def test_delete_tag_project_not_found(mocker):
     mock_interaction.followup.send = AsyncMock()
 
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = None
-    mocker.patch("discord_issues.cogs.tag_command.TagRepository")
+    mocker.patch("discord_issues.cogs.tag_command.TagRepository", autospec=True)
 
     bot = MagicMock()
     cog = TagCog(bot)
@@ -200,11 +204,11 @@ async def test_delete_tag_tag_not_found(mocker):
     mock_project.id = 1
     mock_project.name = "TestProject"
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
     mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.find_by_name.return_value = None
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
+    ).return_value.delete_by_names.return_value = []
 
     bot = MagicMock()
     cog = TagCog(bot)
@@ -225,24 +229,22 @@ async def test_delete_tag_success(mocker):
     mock_project = MagicMock()
     mock_project.id = 1
     mock_project.name = "TestProject"
-    mock_tag = MagicMock()
-    mock_tag.id = 2
-    mock_tag.name = "Alpha"
 
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.find_by_name.return_value = mock_tag
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.delete.return_value = True
+    mock_tag_repository = mocker.patch(
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
+    )
+    mock_tag_repository.return_value.delete_by_names.return_value = ["Alpha"]
 
     bot = MagicMock()
     cog = TagCog(bot)
     await cog.delete_tag.callback(cog, mock_interaction, "TestProject", "Alpha")
 
+    mock_tag_repository.return_value.delete_by_names.assert_awaited_once_with(
+        1, ["Alpha"]
+    )
     mock_interaction.followup.send.assert_called_once()
     args, kwargs = mock_interaction.followup.send.call_args
     embed = kwargs.get("embed")
@@ -252,7 +254,7 @@ async def test_delete_tag_success(mocker):
 
 
 @pytest.mark.asyncio
-async def test_delete_tag_delete_failed(mocker):
+async def test_delete_tag_several_at_once(mocker):
     mock_interaction = MagicMock()
     mock_interaction.guild_id = 123
     mock_interaction.response.defer = AsyncMock()
@@ -261,27 +263,27 @@ async def test_delete_tag_delete_failed(mocker):
     mock_project = MagicMock()
     mock_project.id = 1
     mock_project.name = "TestProject"
-    mock_tag = MagicMock()
-    mock_tag.id = 2
-    mock_tag.name = "Alpha"
 
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.find_by_name.return_value = mock_tag
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.delete.return_value = False
+    mock_tag_repository = mocker.patch(
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
+    )
+    mock_tag_repository.return_value.delete_by_names.return_value = ["Alpha", "Beta"]
 
     bot = MagicMock()
     cog = TagCog(bot)
-    await cog.delete_tag.callback(cog, mock_interaction, "TestProject", "Alpha")
+    await cog.delete_tag.callback(
+        cog, mock_interaction, "TestProject", "Alpha, Beta,Gamma, Alpha"
+    )
 
-    mock_interaction.followup.send.assert_called_once_with(
-        "❌ Failed to delete the tag."
+    mock_tag_repository.return_value.delete_by_names.assert_awaited_once_with(
+        1, ["Alpha", "Beta", "Gamma"]
     )
+    embed = mock_interaction.followup.send.call_args.kwargs["embed"]
+    assert "tags **Alpha**, **Beta**" in embed.description
+    assert "Not found: `Gamma`" in embed.description
 
 
 @pytest.mark.asyncio
@@ -294,24 +296,18 @@ async def test_delete_tag_exception(mocker):
     mock_project = MagicMock()
     mock_project.id = 1
     mock_project.name = "TestProject"
-    mock_tag = MagicMock()
-    mock_tag.id = 2
-    mock_tag.name = "Alpha"
-
     mocker.patch(
-        "discord_issues.cogs.tag_command.ProjectRepository"
+        "discord_issues.cogs.tag_command.ProjectRepository", autospec=True
     ).return_value.find_by_name.return_value = mock_project
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.find_by_name.return_value = mock_tag
-    mocker.patch(
-        "discord_issues.cogs.tag_command.TagRepository"
-    ).return_value.delete.side_effect = Exception("DB error")
+    mock_tag_repository = mocker.patch(
+        "discord_issues.cogs.tag_command.TagRepository", autospec=True
+    )
+    mock_tag_repository.return_value.delete_by_names.side_effect = Exception("DB error")
 
     bot = MagicMock()
     cog = TagCog(bot)
     await cog.delete_tag.callback(cog, mock_interaction, "TestProject", "Alpha")
 
     mock_interaction.followup.send.assert_called_once_with(
-        "❌ An unexpected error occurred. This tag might be in use by an issue."
+        "❌ An unexpected error occurred while deleting the tag."
     )
@@ -0,0 +1,5 @@
+from discord_issues.cache.user_resolver import mention
+
+
+def test_mention_needs_no_lookup():
+    assert mention("42") == "<@42>"
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from discord_issues.db.database import make_engine
+from discord_issues.db.writer import WriteQueue
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER UNIQUE)"))
+    yield engine
+    await engine.dispose()
+
+
+def insert(value):
+    async def operation(session):
+        await session.execute(text("INSERT INTO t VALUES (:x)"), {"x": value})
+        return value
+
+    return operation
+
+
+async def stored_values(engine):
+    async with engine.connect() as conn:
+        return [row.x for row in await conn.execute(text("SELECT x FROM t ORDER BY x"))]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_a_commit(engine):
+    queue = WriteQueue(async_sessionmaker(bind=engine), max_latency=0.05)
+
+    results = await asyncio.gather(*(queue.submit(insert(n)) for n in range(20)))
+    await queue.close()
+
+    assert results == list(range(20))
+    assert await stored_values(engine) == list(range(20))
+    assert queue.operations == 20
+    assert queue.batches < 20
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_capped(engine):
+    queue = WriteQueue(async_sessionmaker(bind=engine), max_batch_size=4)
+
+    await asyncio.gather(*(queue.submit(insert(n)) for n in range(10)))
+    await queue.close()
+
+    assert queue.batches >= 3
+
+
+@pytest.mark.asyncio
+async def test_failing_operation_does_not_affect_its_batch(engine):
+    queue = WriteQueue(async_sessionmaker(bind=engine), max_latency=0.05)
+
+    results = await asyncio.gather(
+        queue.submit(insert(1)),
+        queue.submit(insert(1)),  # Violates the unique constraint.
+        queue.submit(insert(2)),
+        return_exceptions=True,
+    )
+    await queue.close()
+
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], Exception)
+    assert await stored_values(engine) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_lone_failing_operation_is_not_logged(engine, caplog):
+    queue = WriteQueue(async_sessionmaker(bind=engine))
+    await queue.submit(insert(1))
+
+    with caplog.at_level(logging.ERROR), pytest.raises(IntegrityError):
+        await queue.submit(insert(1))
+    await queue.close()
+
+    assert caplog.records == []
+    assert await stored_values(engine) == [1]